@@ -1,5 +1,6 @@
 """NerfProbe Core - Shared probe and scorer implementations."""
 
+from nerfprobe_core.core.batch import ProbeResultBatch
 from nerfprobe_core.core.entities import (
     LogprobResult,
     LogprobToken,
@@ -9,8 +10,10 @@ from nerfprobe_core.core.entities import (
     ProviderType,
     StrWithUsage,
 )
+from nerfprobe_core.core.estimator import CostEstimator
 from nerfprobe_core.core.gateway import LLMGateway
 from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol, ScorerProtocol
+from nerfprobe_core.core.usage import MeteredGateway, UsageMeter, UsageTotals
 from nerfprobe_core.models import ModelInfo, get_model_info, list_models
 from nerfprobe_core.models.research import RESEARCH_PROMPT, get_research_prompt
 
@@ -18,6 +21,7 @@ __all__ = [
     "MetricResult",
     "ModelTarget",
     "ProbeResult",
+    "ProbeResultBatch",
     "ProbeType",
     "ProviderType",
     "LogprobToken",
@@ -28,6 +32,11 @@ __all__ = [
     "ScorerProtocol",
     "ProbeProtocol",
     "CostEstimate",
+    "CostEstimator",
+    # Usage metering
+    "MeteredGateway",
+    "UsageMeter",
+    "UsageTotals",
     # Models
     "ModelInfo",
     "get_model_info",
@@ -0,0 +1,23 @@
+"""Lazy attribute exports for package __init__ modules (PEP 562)."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ that imports `name` from `exports[name]` on
+    first access and caches it in the package namespace.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
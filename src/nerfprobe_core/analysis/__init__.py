@@ -0,0 +1,14 @@
+"""
+Analysis module - offline analysis over collected probe results.
+
+Submodules with optional dependencies are not imported here:
+- fingerprint_index: Timing fingerprint k-NN index (requires numpy).
+"""
+
+from nerfprobe_core.analysis.changepoint import ChangeEvent, ChangePointMonitor, StreamDetector
+
+__all__ = [
+    "ChangeEvent",
+    "ChangePointMonitor",
+    "StreamDetector",
+]
@@ -0,0 +1,246 @@
+"""
+Change-point detection - when did a (target, probe) metric shift?
+
+Each stream (target, probe, metric) keeps an O(1)-state detector: a baseline
+mean/variance learned during warmup and then tracked by a slow EWMA, plus
+two-sided CUSUM or Page-Hinkley statistics over standardized residuals.
+Updates are O(1) and streams are held in an LRU map, so thousands of
+target x metric streams fit in bounded memory.
+
+Ref: Page (1954) Continuous Inspection Schemes.
+"""
+
+import datetime
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from nerfprobe_core.core.entities import ProbeResult
+
+UP = "up"
+DOWN = "down"
+
+# Scalar ProbeResult fields tracked alongside metric_scores
+_RESULT_FIELDS = ("score", "latency_ms", "ttft_ms", "mean_itl_ms")
+
+
+@dataclass
+class ChangeEvent:
+    """A detected shift in one metric stream."""
+
+    target: str
+    probe_name: str
+    metric: str
+    direction: str  # "up" or "down"
+    onset: datetime.datetime  # Estimated start of the shift
+    detected_at: datetime.datetime
+    baseline_mean: float
+    shifted_mean: float  # Mean of the samples since the estimated onset
+    magnitude: float  # Shift in baseline standard deviations
+    samples_since_onset: int
+
+
+@dataclass(slots=True)
+class _Side:
+    """One-sided cumulative statistic with onset bookkeeping."""
+
+    stat: float = 0.0
+    floor: float = 0.0  # Running minimum (Page-Hinkley only)
+    onset: datetime.datetime | None = None
+    total: float = 0.0
+    count: int = 0
+
+    def reset(self) -> None:
+        self.stat = self.floor = self.total = 0.0
+        self.onset = None
+        self.count = 0
+
+
+@dataclass(slots=True)
+class StreamDetector:
+    """
+    Two-sided change detector for one scalar stream.
+
+    Args:
+        method: "cusum" or "page_hinkley".
+        threshold: Decision threshold h, in standard deviations.
+        drift: Allowed slack k per sample, in standard deviations.
+        warmup: Samples used to learn the baseline before detecting.
+        alpha: EWMA weight for in-control baseline tracking.
+        min_std: Absolute floor on the baseline standard deviation.
+        rel_std: Floor on the standard deviation relative to |mean|.
+    """
+
+    method: str = "cusum"
+    threshold: float = 8.0
+    drift: float = 0.5
+    warmup: int = 20
+    alpha: float = 0.02
+    min_std: float = 0.05
+    rel_std: float = 0.02
+    n: int = 0
+    mean: float = 0.0
+    var: float = 0.0
+    up: _Side = field(default_factory=_Side)
+    down: _Side = field(default_factory=_Side)
+
+    def __post_init__(self) -> None:
+        if self.method not in ("cusum", "page_hinkley"):
+            raise ValueError(f"Unknown change-point method: {self.method!r}")
+
+    @property
+    def std(self) -> float:
+        return max(math.sqrt(max(self.var, 0.0)), self.min_std, self.rel_std * abs(self.mean))
+
+    def _restart(self) -> None:
+        """Forget the baseline; the next `warmup` samples learn a new one."""
+        self.n = 0
+        self.mean = self.var = 0.0
+        self.up.reset()
+        self.down.reset()
+
+    def _step(self, side: _Side, z: float, x: float, timestamp: datetime.datetime) -> bool:
+        if self.method == "cusum":
+            side.stat = max(0.0, side.stat + z - self.drift)
+            active = side.stat > 0.0
+        else:
+            side.stat += z - self.drift
+            side.floor = min(side.floor, side.stat)
+            active = side.stat > side.floor
+            if not active:
+                side.stat = side.floor = 0.0
+
+        if not active:
+            side.onset = None
+            side.total = 0.0
+            side.count = 0
+            return False
+
+        if side.onset is None:
+            side.onset = timestamp
+        side.total += x
+        side.count += 1
+        return side.stat - side.floor > self.threshold
+
+    def update(self, x: float, timestamp: datetime.datetime) -> tuple[str, datetime.datetime, float, int] | None:
+        """
+        Add one sample. Returns (direction, onset, shifted_mean, samples) on
+        detection, after which the detector re-learns its baseline.
+        """
+        if self.n < self.warmup:
+            # Welford warmup
+            self.n += 1
+            delta = x - self.mean
+            self.mean += delta / self.n
+            self.var += (delta * (x - self.mean) - self.var) / self.n
+            return None
+
+        z = (x - self.mean) / self.std
+        for direction, side, signed in ((UP, self.up, z), (DOWN, self.down, -z)):
+            if self._step(side, signed, x, timestamp):
+                assert side.onset is not None
+                event = (direction, side.onset, side.total / side.count, side.count)
+                self._restart()
+                return event
+
+        # Slow EWMA so the baseline follows benign drift; a real shift trips
+        # the statistic long before the baseline catches up with it
+        delta = x - self.mean
+        self.mean += self.alpha * delta
+        self.var = (1.0 - self.alpha) * (self.var + self.alpha * delta * delta)
+        return None
+
+
+class ChangePointMonitor:
+    """
+    Consumes ProbeResults and emits ChangeEvents per (target, probe, metric).
+
+    Tracks score, latency_ms, ttft_ms and mean_itl_ms plus every entry of
+    metric_scores (or only `metrics`, if given). At most `max_streams`
+    detectors are kept; the least recently updated stream is evicted first.
+    """
+
+    def __init__(
+        self,
+        method: str = "cusum",
+        threshold: float = 8.0,
+        drift: float = 0.5,
+        warmup: int = 20,
+        alpha: float = 0.02,
+        metrics: Iterable[str] | None = None,
+        max_streams: int = 100_000,
+    ):
+        self.method = method
+        self.threshold = threshold
+        self.drift = drift
+        self.warmup = warmup
+        self.alpha = alpha
+        self.metrics = frozenset(metrics) if metrics is not None else None
+        self.max_streams = max_streams
+        self._streams: OrderedDict[tuple[str, str, str], StreamDetector] = OrderedDict()
+
+        # Fail fast on a bad method rather than on the first update
+        StreamDetector(method=method)
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def _values(self, result: ProbeResult) -> Iterable[tuple[str, float]]:
+        for name in _RESULT_FIELDS:
+            value = getattr(result, name)
+            if value is not None:
+                yield name, float(value)
+        yield from result.metric_scores.items()
+
+    def _detector(self, key: tuple[str, str, str]) -> StreamDetector:
+        detector = self._streams.get(key)
+        if detector is None:
+            detector = StreamDetector(
+                method=self.method,
+                threshold=self.threshold,
+                drift=self.drift,
+                warmup=self.warmup,
+                alpha=self.alpha,
+            )
+            self._streams[key] = detector
+            if len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+        else:
+            self._streams.move_to_end(key)
+        return detector
+
+    def update(self, result: ProbeResult) -> list[ChangeEvent]:
+        """Feed one result (in timestamp order per stream); returns any detected changes."""
+        target = str(result.target)
+        events: list[ChangeEvent] = []
+        for metric, value in self._values(result):
+            if self.metrics is not None and metric not in self.metrics:
+                continue
+            if not math.isfinite(value):
+                continue
+            detector = self._detector((target, result.probe_name, metric))
+            baseline_mean, baseline_std = detector.mean, detector.std
+            change = detector.update(value, result.timestamp)
+            if change is None:
+                continue
+            direction, onset, shifted_mean, samples = change
+            events.append(
+                ChangeEvent(
+                    target=target,
+                    probe_name=result.probe_name,
+                    metric=metric,
+                    direction=direction,
+                    onset=onset,
+                    detected_at=result.timestamp,
+                    baseline_mean=baseline_mean,
+                    shifted_mean=shifted_mean,
+                    magnitude=abs(shifted_mean - baseline_mean) / baseline_std,
+                    samples_since_onset=samples,
+                )
+            )
+        return events
+
+    def update_many(self, results: Iterable[ProbeResult]) -> list[ChangeEvent]:
+        """Feed results in order; returns all detected changes."""
+        return [event for result in results for event in self.update(result)]
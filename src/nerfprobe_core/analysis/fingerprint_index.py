@@ -0,0 +1,345 @@
+"""
+TimingFingerprintIndex - Serving-stack identification via timing k-NN.
+
+Stores TimingProbe feature vectors (ITL percentiles, histogram bins,
+chunk-size statistics) per (provider, model) and classifies new runs
+against the stored history by nearest-neighbor distance.
+
+Ref: [2502.20589] LLMs Have Rhythm.
+Requires: numpy (pip install 'nerfprobe-core[analysis]').
+"""
+
+import datetime
+import json
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "TimingFingerprintIndex requires numpy. Install with: pip install 'nerfprobe-core[analysis]'"
+    ) from e
+
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult
+from nerfprobe_core.probes.core.timing_probe import TIMING_FEATURES
+
+_META_FILE = "index.json"
+_VECTORS_FILE = "vectors.f32"
+_LABELS_FILE = "labels.i32"
+_TIMESTAMPS_FILE = "timestamps.f64"
+
+# Rows scanned per block during k-NN search (bounds temporary memory).
+_BLOCK_ROWS = 65536
+_MIN_CAPACITY = 1024
+
+
+@dataclass
+class Neighbor:
+    """A stored fingerprint close to the query."""
+
+    label: str
+    distance: float
+    timestamp: datetime.datetime
+
+
+@dataclass
+class FingerprintMatch:
+    """Classification of a timing fingerprint against the index."""
+
+    label: str | None
+    distance: float
+    confidence: float
+    neighbors: list[Neighbor]
+    expected_label: str | None = None
+
+    @property
+    def matches_expected(self) -> bool:
+        """True if the predicted label is the expected (provider, model)."""
+        return self.expected_label is not None and self.label == self.expected_label
+
+
+def timing_feature_vector(
+    source: ProbeResult | Mapping[str, float], features: Sequence[str] = TIMING_FEATURES
+) -> list[float]:
+    """
+    Extract an ordered timing feature vector.
+
+    Accepts a TimingProbe ProbeResult (reads metric_scores) or a plain
+    mapping of feature name to value. Missing features default to 0.0.
+    """
+    values = source.metric_scores if isinstance(source, ProbeResult) else source
+    return [float(values.get(name, 0.0)) for name in features]
+
+
+class TimingFingerprintIndex:
+    """
+    Persistent reference store of timing fingerprints with vectorized k-NN lookup.
+
+    Vectors are stored log1p-transformed in memory-mapped float32 arrays under
+    `root`, so opening an index with hundreds of thousands of runs is O(1) and
+    queries stream over the data in fixed-size blocks. Distances are the RMS
+    z-score difference across features, using running per-feature variance,
+    so ~1.0 means "typical run-to-run variation".
+    """
+
+    def __init__(self, root: str | Path, features: Sequence[str] = TIMING_FEATURES, readonly: bool = False):
+        self.root = Path(root)
+        self.readonly = readonly
+        self.features: tuple[str, ...] = tuple(features)
+
+        self._labels: list[str] = []
+        self._label_ids: dict[str, int] = {}
+        self._count = 0
+        self._capacity = 0
+        dim = len(self.features)
+        self._sum = np.zeros(dim, dtype=np.float64)
+        self._sumsq = np.zeros(dim, dtype=np.float64)
+
+        self._vectors: np.memmap[Any, np.dtype[np.float32]] | None = None
+        self._label_col: np.memmap[Any, np.dtype[np.int32]] | None = None
+        self._ts_col: np.memmap[Any, np.dtype[np.float64]] | None = None
+
+        if (self.root / _META_FILE).exists():
+            self._load()
+        elif readonly:
+            raise FileNotFoundError(f"No fingerprint index at {self.root}")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        meta = json.loads((self.root / _META_FILE).read_text())
+        stored = tuple(meta["features"])
+        if stored != self.features:
+            raise ValueError(f"Index features {stored} do not match requested features {self.features}")
+
+        self._labels = list(meta["labels"])
+        self._label_ids = {label: i for i, label in enumerate(self._labels)}
+        self._count = int(meta["count"])
+        self._capacity = int(meta["capacity"])
+        self._sum = np.asarray(meta["sum"], dtype=np.float64)
+        self._sumsq = np.asarray(meta["sumsq"], dtype=np.float64)
+        self._open_arrays()
+
+    def _open_arrays(self) -> None:
+        if self._capacity == 0:
+            return
+        mode: Literal["r", "r+"] = "r" if self.readonly else "r+"
+        dim = len(self.features)
+        self._vectors = np.memmap(self.root / _VECTORS_FILE, dtype=np.float32, mode=mode, shape=(self._capacity, dim))
+        self._label_col = np.memmap(self.root / _LABELS_FILE, dtype=np.int32, mode=mode, shape=(self._capacity,))
+        self._ts_col = np.memmap(self.root / _TIMESTAMPS_FILE, dtype=np.float64, mode=mode, shape=(self._capacity,))
+
+    def _close_arrays(self) -> None:
+        for arr in (self._vectors, self._label_col, self._ts_col):
+            if arr is not None:
+                arr.flush()
+        self._vectors = self._label_col = self._ts_col = None
+
+    def _ensure_capacity(self, required: int) -> None:
+        """Grow the backing files geometrically so appends stay amortized O(1)."""
+        if required <= self._capacity:
+            return
+        new_capacity = max(required, self._capacity * 2, _MIN_CAPACITY)
+        self._close_arrays()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        dim = len(self.features)
+        for name, row_bytes in (
+            (_VECTORS_FILE, 4 * dim),
+            (_LABELS_FILE, 4),
+            (_TIMESTAMPS_FILE, 8),
+        ):
+            with open(self.root / name, "ab") as f:
+                f.truncate(new_capacity * row_bytes)
+
+        self._capacity = new_capacity
+        self._open_arrays()
+
+    def flush(self) -> None:
+        """Flush arrays and write index metadata atomically."""
+        if self.readonly:
+            return
+        for arr in (self._vectors, self._label_col, self._ts_col):
+            if arr is not None:
+                arr.flush()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "features": list(self.features),
+            "labels": self._labels,
+            "count": self._count,
+            "capacity": self._capacity,
+            "sum": self._sum.tolist(),
+            "sumsq": self._sumsq.tolist(),
+        }
+        tmp = self.root / f"{_META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, self.root / _META_FILE)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def labels(self) -> list[str]:
+        """Known (provider/model) labels."""
+        return list(self._labels)
+
+    def _label_id(self, label: str) -> int:
+        if label not in self._label_ids:
+            self._label_ids[label] = len(self._labels)
+            self._labels.append(label)
+        return self._label_ids[label]
+
+    def add(
+        self,
+        target: ModelTarget | str,
+        source: ProbeResult | Mapping[str, float],
+        timestamp: datetime.datetime | None = None,
+    ) -> None:
+        """Append one fingerprint. Call flush() to persist metadata."""
+        if timestamp is None and isinstance(source, ProbeResult):
+            timestamp = source.timestamp
+        self.add_many(target, [timing_feature_vector(source, self.features)], [timestamp or datetime.datetime.now()])
+
+    def add_many(
+        self,
+        target: ModelTarget | str,
+        vectors: Sequence[Sequence[float]] | npt.NDArray[np.floating[Any]],
+        timestamps: Sequence[datetime.datetime] | None = None,
+    ) -> None:
+        """Append a batch of raw feature vectors for one (provider, model)."""
+        if self.readonly:
+            raise PermissionError("Index opened read-only")
+
+        if len(vectors) == 0:
+            return
+        rows = self._transform(np.asarray(vectors, dtype=np.float64))
+        n = rows.shape[0]
+
+        self._ensure_capacity(self._count + n)
+        assert self._vectors is not None and self._label_col is not None and self._ts_col is not None
+
+        start, end = self._count, self._count + n
+        self._vectors[start:end] = rows
+        self._label_col[start:end] = self._label_id(str(target))
+        if timestamps is None:
+            self._ts_col[start:end] = datetime.datetime.now().timestamp()
+        else:
+            self._ts_col[start:end] = [ts.timestamp() for ts in timestamps]
+
+        self._sum += rows.sum(axis=0)
+        self._sumsq += (rows * rows).sum(axis=0)
+        self._count = end
+
+    def _transform(self, vectors: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Log-compress heavy-tailed timing features."""
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if vectors.shape[1] != len(self.features):
+            raise ValueError(f"Expected {len(self.features)} features, got {vectors.shape[1]}")
+        return np.log1p(np.clip(vectors, 0.0, None))
+
+    def _weights(self) -> npt.NDArray[np.float64]:
+        """Inverse per-feature variance; constant features get unit weight."""
+        if self._count == 0:
+            return np.ones(len(self.features))
+        mean = self._sum / self._count
+        var = self._sumsq / self._count - mean * mean
+        return np.where(var > 1e-12, 1.0 / np.maximum(var, 1e-12), 1.0)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        source: ProbeResult | Mapping[str, float],
+        k: int = 5,
+        label: ModelTarget | str | None = None,
+    ) -> list[Neighbor]:
+        """Return the k nearest stored fingerprints, optionally restricted to one label."""
+        if self._count == 0 or self._vectors is None or self._label_col is None or self._ts_col is None:
+            return []
+
+        q = self._transform(np.asarray(timing_feature_vector(source, self.features), dtype=np.float64))[0]
+        weights = self._weights()
+        only = self._label_ids.get(str(label), -1) if label is not None else None
+        if only == -1:
+            return []
+
+        best_idx = np.empty(0, dtype=np.int64)
+        best_dist = np.empty(0, dtype=np.float64)
+        for start in range(0, self._count, _BLOCK_ROWS):
+            end = min(start + _BLOCK_ROWS, self._count)
+            diff = np.asarray(self._vectors[start:end], dtype=np.float64) - q
+            dist = (diff * diff) @ weights
+            idx = np.arange(start, end)
+            if only is not None:
+                mask = self._label_col[start:end] == only
+                dist, idx = dist[mask], idx[mask]
+
+            dist = np.concatenate([best_dist, dist])
+            idx = np.concatenate([best_idx, idx])
+            if dist.shape[0] > k:
+                keep = np.argpartition(dist, k)[:k]
+                dist, idx = dist[keep], idx[keep]
+            best_dist, best_idx = dist, idx
+
+        order = np.argsort(best_dist)
+        dim = len(self.features)
+        return [
+            Neighbor(
+                label=self._labels[int(self._label_col[i])],
+                distance=float(np.sqrt(best_dist[j] / dim)),
+                timestamp=datetime.datetime.fromtimestamp(float(self._ts_col[i])),
+            )
+            for j, i in ((j, int(best_idx[j])) for j in order)
+        ]
+
+    def classify(
+        self,
+        source: ProbeResult | Mapping[str, float],
+        k: int = 5,
+        expected: ModelTarget | str | None = None,
+    ) -> FingerprintMatch:
+        """
+        Classify a fingerprint by inverse-distance weighted vote of its k neighbors.
+
+        `distance` is the distance to the closest neighbor of the winning label.
+        Pass `expected` (e.g. the ModelTarget that was probed) to check whether
+        the run still looks like the same serving stack.
+        """
+        neighbors = self.query(source, k=k)
+        expected_label = str(expected) if expected is not None else None
+        if not neighbors:
+            return FingerprintMatch(
+                label=None,
+                distance=float("inf"),
+                confidence=0.0,
+                neighbors=[],
+                expected_label=expected_label,
+            )
+
+        votes: dict[str, float] = {}
+        for n in neighbors:
+            votes[n.label] = votes.get(n.label, 0.0) + 1.0 / (n.distance + 1e-6)
+        label = max(votes, key=lambda lbl: votes[lbl])
+
+        return FingerprintMatch(
+            label=label,
+            distance=min(n.distance for n in neighbors if n.label == label),
+            confidence=votes[label] / sum(votes.values()),
+            neighbors=neighbors,
+            expected_label=expected_label,
+        )
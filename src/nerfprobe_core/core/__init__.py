@@ -1,5 +1,6 @@
 """Core module exports."""
 
+from nerfprobe_core.core.batch import ProbeResultBatch
 from nerfprobe_core.core.entities import (
     LogprobResult,
     LogprobToken,
@@ -7,19 +8,43 @@ from nerfprobe_core.core.entities import (
     ProbeResult,
     ProbeType,
     ProviderType,
+    copy_plain,
 )
+from nerfprobe_core.core.estimator import CostEstimator, use_estimator
 from nerfprobe_core.core.gateway import LLMGateway
-from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol, ScorerProtocol
+from nerfprobe_core.core.scorer import CostEstimate, FusableProbe, ProbeProtocol, ScorerProtocol
+from nerfprobe_core.core.tokens import approx_token_count, fits_context_window
+from nerfprobe_core.core.usage import (
+    MeteredGateway,
+    UsageMeter,
+    UsageTotals,
+    extract_usage,
+    probe_scope,
+    sum_tokens,
+)
 
 __all__ = [
     "LogprobResult",
     "LogprobToken",
     "ModelTarget",
     "ProbeResult",
+    "ProbeResultBatch",
     "ProbeType",
     "ProviderType",
+    "copy_plain",
     "LLMGateway",
     "CostEstimate",
+    "CostEstimator",
+    "use_estimator",
     "ProbeProtocol",
+    "FusableProbe",
     "ScorerProtocol",
+    "MeteredGateway",
+    "UsageMeter",
+    "UsageTotals",
+    "extract_usage",
+    "sum_tokens",
+    "probe_scope",
+    "approx_token_count",
+    "fits_context_window",
 ]
@@ -0,0 +1,197 @@
+"""
+ProbeResultBatch - Columnar container for bulk aggregation and export.
+
+Numeric fields are packed into typed arrays and repeated strings (probe
+names, targets, probe types) are stored once in a lookup table with compact
+integer codes per row, so large result sets cost a few dozen bytes per row
+plus the free-text fields.
+"""
+
+import datetime
+import math
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType, copy_plain
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_MISSING_INT = -1  # Sentinel for None in integer token columns
+
+
+class _Codes:
+    """Interned value table with per-row integer codes."""
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self.index: dict[Any, int] = {}
+        self.codes = array("I")
+
+    def append(self, value: Any) -> None:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.values[self.codes[row]]
+
+
+def _to_micros(ts: datetime.datetime) -> int:
+    """Exact integer microseconds since the epoch; naive timestamps are local time, as in datetime.timestamp()."""
+    if ts.tzinfo is None:
+        ts = ts.astimezone()
+    return (ts - _EPOCH) // _MICROSECOND
+
+
+class ProbeResultBatch:
+    """
+    Columnar store of ProbeResults.
+
+    Column attributes (one entry per row):
+        scores, latency_ms, ttft_ms, mean_itl_ms: array('d'); NaN = None
+        input_tokens, output_tokens: array('q'); -1 = None
+        passed: array('b'); timestamps_us: array('q') microseconds since the Unix epoch
+    """
+
+    def __init__(self, results: Iterable[ProbeResult] = ()):
+        self._probe_names = _Codes()
+        self._probe_types = _Codes()
+        self._targets = _Codes()
+
+        self.timestamps_us = array("q")
+        self.scores = array("d")
+        self.passed = array("b")
+        self.latency_ms = array("d")
+        self.ttft_ms = array("d")
+        self.mean_itl_ms = array("d")
+        self.input_tokens = array("q")
+        self.output_tokens = array("q")
+
+        self.error_reasons: list[str | None] = []
+        self.metric_scores: list[dict[str, float]] = []
+        self.raw_responses: list[str] = []
+        self.raw_response_refs: list[str | None] = []
+        self.metadata: list[dict[str, Any]] = []
+
+        self.extend(results)
+
+    @classmethod
+    def from_results(cls, results: Iterable[ProbeResult]) -> "ProbeResultBatch":
+        return cls(results)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def append(self, result: ProbeResult) -> None:
+        self._probe_names.append(sys.intern(result.probe_name))
+        self._probe_types.append(result.probe_type)
+        self._targets.append(result.target)
+
+        nan = math.nan
+        self.timestamps_us.append(_to_micros(result.timestamp))
+        self.scores.append(result.score)
+        self.passed.append(result.passed)
+        self.latency_ms.append(result.latency_ms)
+        self.ttft_ms.append(nan if result.ttft_ms is None else result.ttft_ms)
+        self.mean_itl_ms.append(nan if result.mean_itl_ms is None else result.mean_itl_ms)
+        self.input_tokens.append(_MISSING_INT if result.input_tokens is None else result.input_tokens)
+        self.output_tokens.append(_MISSING_INT if result.output_tokens is None else result.output_tokens)
+
+        self.error_reasons.append(result.error_reason)
+        self.metric_scores.append(result.metric_scores)
+        self.raw_responses.append(result.raw_response)
+        self.raw_response_refs.append(result.raw_response_ref)
+        self.metadata.append(result.metadata)
+
+    def extend(self, results: Iterable[ProbeResult]) -> None:
+        for result in results:
+            self.append(result)
+
+    # ------------------------------------------------------------------
+    # Interned columns
+    # ------------------------------------------------------------------
+
+    @property
+    def probe_names(self) -> list[str]:
+        """Distinct probe names, indexed by probe_name_codes."""
+        return self._probe_names.values
+
+    @property
+    def probe_name_codes(self) -> "array[int]":
+        return self._probe_names.codes
+
+    @property
+    def targets(self) -> list[ModelTarget]:
+        """Distinct targets, indexed by target_codes."""
+        return self._targets.values
+
+    @property
+    def target_codes(self) -> "array[int]":
+        return self._targets.codes
+
+    @property
+    def probe_types(self) -> list[ProbeType]:
+        """Distinct probe types, indexed by probe_type_codes."""
+        return self._probe_types.values
+
+    @property
+    def probe_type_codes(self) -> "array[int]":
+        return self._probe_types.codes
+
+    def probe_name(self, row: int) -> str:
+        return str(self._probe_names[row])
+
+    def target(self, row: int) -> ModelTarget:
+        target: ModelTarget = self._targets[row]
+        return target
+
+    def timestamp(self, row: int) -> datetime.datetime:
+        """Timezone-aware (UTC) timestamp of a row."""
+        return _EPOCH + datetime.timedelta(microseconds=self.timestamps_us[row])
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, row: int) -> ProbeResult:
+        if row < 0:
+            row += len(self)
+        ttft, itl = self.ttft_ms[row], self.mean_itl_ms[row]
+        in_tok, out_tok = self.input_tokens[row], self.output_tokens[row]
+        return ProbeResult.trusted(
+            probe_name=self._probe_names[row],
+            probe_type=self._probe_types[row],
+            target=self._targets[row],
+            timestamp=self.timestamp(row),
+            score=self.scores[row],
+            passed=bool(self.passed[row]),
+            latency_ms=self.latency_ms[row],
+            ttft_ms=None if math.isnan(ttft) else ttft,
+            mean_itl_ms=None if math.isnan(itl) else itl,
+            input_tokens=None if in_tok == _MISSING_INT else in_tok,
+            output_tokens=None if out_tok == _MISSING_INT else out_tok,
+            error_reason=self.error_reasons[row],
+            metric_scores=dict(self.metric_scores[row]),
+            raw_response=self.raw_responses[row],
+            raw_response_ref=self.raw_response_refs[row],
+            # Fresh containers: results must not share state with the batch
+            metadata=copy_plain(self.metadata[row]),
+        )
+
+    def __iter__(self) -> Iterator[ProbeResult]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def to_results(self) -> list[ProbeResult]:
+        return list(self)
+
+    def groups(self) -> dict[tuple[ModelTarget, str], list[int]]:
+        """Row indices per (target, probe_name)."""
+        grouped: dict[tuple[int, int], list[int]] = {}
+        for row, key in enumerate(zip(self._targets.codes, self._probe_names.codes, strict=True)):
+            grouped.setdefault(key, []).append(row)
+        return {(self._targets.values[t], self._probe_names.values[p]): rows for (t, p), rows in grouped.items()}
@@ -53,6 +53,7 @@ class ProbeType(str, enum.Enum):
     ROUTING = "routing"
     CALIBRATION = "calibration"
     MULTILINGUAL = "multilingual"
+    TEMPORAL = "temporal"
 
 
 class LogprobToken(BaseModel):
@@ -93,6 +94,18 @@ class ModelTarget(BaseModel):
         return f"{self.provider_id}/{self.model_name}"
 
 
+def copy_plain(value: Any) -> Any:
+    """
+    Copy nested dicts and lists (e.g. a cached config dump); other leaves
+    are shared, so they must be immutable.
+    """
+    if isinstance(value, dict):
+        return {k: copy_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_plain(v) for v in value]
+    return value
+
+
 class ProbeResult(BaseModel):
     """The outcome of a single probe execution."""
 
@@ -121,10 +134,25 @@ class ProbeResult(BaseModel):
 
     # Raw data for deeper analysis
     raw_response: str
+    raw_response_ref: str | None = None  # BlobStore digest when raw_response holds only a preview
     metadata: dict[str, Any] = Field(default_factory=dict)
 
     model_config = ConfigDict(frozen=True)
 
+    @classmethod
+    def trusted(cls, **fields: Any) -> "ProbeResult":
+        """
+        Build without validation, for internal paths whose fields are already
+        well-typed (e.g. rehydrating stored results). Defaults are still applied.
+        Containers are used as given, so callers pass ones no other result holds.
+        """
+        return cls.model_construct(**fields)
+
+    @property
+    def is_valid(self) -> bool:
+        """False for gateway errors and skipped runs, whose score says nothing about the model."""
+        return not self.raw_response.startswith(("ERROR", "SKIPPED"))
+
     def summary(self) -> str:
         """Compact one-line summary for CLI output."""
         status = "PASS" if self.passed else "FAIL"
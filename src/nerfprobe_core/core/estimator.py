@@ -0,0 +1,180 @@
+"""
+CostEstimator - Token cost estimates learned from past ProbeResults.
+
+A probe's static `estimated_cost` is a guess made without seeing the
+target. The estimator keeps running per-(probe, target) statistics of the
+input/output tokens actually reported and blends them with the static
+estimate, which acts as a prior worth `prior_weight` observations; with no
+history the static estimate is returned unchanged.
+
+Probes consult the estimator installed with use_estimator() for their
+`max_tokens_per_run` check (see exceeds_budget), so budget skips follow
+the learned costs without any change to the probe configs.
+"""
+
+import contextlib
+import math
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult
+from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol
+
+_active: ContextVar["CostEstimator | None"] = ContextVar("nerfprobe_cost_estimator", default=None)
+
+
+@dataclass(slots=True)
+class TokenStats:
+    """Welford running mean/variance of input and output tokens."""
+
+    count: int = 0
+    mean_input: float = 0.0
+    mean_output: float = 0.0
+    _m2_input: float = 0.0
+    _m2_output: float = 0.0
+
+    def add(self, input_tokens: int, output_tokens: int) -> None:
+        self.count += 1
+        d_in = input_tokens - self.mean_input
+        self.mean_input += d_in / self.count
+        self._m2_input += d_in * (input_tokens - self.mean_input)
+        d_out = output_tokens - self.mean_output
+        self.mean_output += d_out / self.count
+        self._m2_output += d_out * (output_tokens - self.mean_output)
+
+    @property
+    def std_input(self) -> float:
+        return math.sqrt(self._m2_input / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def std_output(self) -> float:
+        return math.sqrt(self._m2_output / (self.count - 1)) if self.count > 1 else 0.0
+
+
+def _probe_name(probe: ProbeProtocol) -> str:
+    return str(getattr(probe.config, "name", type(probe).__name__))
+
+
+class CostEstimator:
+    """
+    Learned per-(probe, target) token cost.
+
+    Args:
+        prior_weight: Observations the static estimate is worth; higher
+            values trust history more slowly.
+        sigmas: Standard deviations added to the learned means, for
+            conservative (upper-bound) estimates.
+    """
+
+    def __init__(self, prior_weight: float = 1.0, sigmas: float = 0.0):
+        self.prior_weight = prior_weight
+        self.sigmas = sigmas
+        self._stats: dict[tuple[str, ModelTarget], TokenStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_results(cls, results: Iterable[ProbeResult], **kwargs: Any) -> "CostEstimator":
+        estimator = cls(**kwargs)
+        estimator.observe_many(results)
+        return estimator
+
+    def observe(self, result: ProbeResult) -> None:
+        """Learn from a result. Skipped runs and results without token usage are ignored."""
+        if result.input_tokens is None and result.output_tokens is None:
+            return
+        if result.raw_response.startswith("SKIPPED"):
+            return
+        input_tokens, output_tokens = result.input_tokens or 0, result.output_tokens or 0
+        # Dataset runs are priced per item (see probes.dataset), so learn them per item
+        items = int(result.metric_scores.get("items", 0)) if "dataset_path" in result.metadata else 0
+        if items > 1:
+            input_tokens, output_tokens = round(input_tokens / items), round(output_tokens / items)
+        key = (result.probe_name, result.target)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = TokenStats()
+            stats.add(input_tokens, output_tokens)
+
+    def observe_many(self, results: Iterable[ProbeResult]) -> None:
+        for result in results:
+            self.observe(result)
+
+    def stats(self, probe_name: str, target: ModelTarget) -> TokenStats | None:
+        return self._stats.get((probe_name, target))
+
+    def estimate(self, probe: ProbeProtocol, target: ModelTarget) -> CostEstimate:
+        """Blend of the static estimate and observed usage for this target."""
+        static = probe.estimated_cost
+        stats = self._stats.get((_probe_name(probe), target))
+        if stats is None or stats.count == 0:
+            return static
+
+        n, k = stats.count, self.prior_weight
+        mean_in = (n * stats.mean_input + k * static.input_tokens) / (n + k)
+        mean_out = (n * stats.mean_output + k * static.output_tokens) / (n + k)
+        return CostEstimate(
+            input_tokens=math.ceil(mean_in + self.sigmas * stats.std_input),
+            output_tokens=math.ceil(mean_out + self.sigmas * stats.std_output),
+        )
+
+    def fits_budget(self, probe: ProbeProtocol, target: ModelTarget, budget: int | None = None) -> bool:
+        """Whether the probe's estimated cost is within `budget` (default: its max_tokens_per_run; 0 = no limit)."""
+        if budget is None:
+            budget = int(getattr(probe.config, "max_tokens_per_run", 0))
+        return budget <= 0 or self.estimate(probe, target).total_tokens <= budget
+
+    def select(
+        self, probes: Sequence[ProbeProtocol], target: ModelTarget, budget: int
+    ) -> tuple[list[ProbeProtocol], list[ProbeProtocol]]:
+        """
+        Greedily pack probes, in order, into a shared token budget.
+
+        Returns (selected, deferred). Each probe's own max_tokens_per_run is
+        also respected.
+        """
+        selected: list[ProbeProtocol] = []
+        deferred: list[ProbeProtocol] = []
+        remaining = budget
+        for probe in probes:
+            cost = self.estimate(probe, target).total_tokens
+            if cost <= remaining and self.fits_budget(probe, target):
+                selected.append(probe)
+                remaining -= cost
+            else:
+                deferred.append(probe)
+        return selected, deferred
+
+
+@contextlib.contextmanager
+def use_estimator(estimator: CostEstimator) -> Iterator[None]:
+    """Make probes run inside the block (and tasks they spawn) budget with learned costs."""
+    token = _active.set(estimator)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def expected_cost(probe: ProbeProtocol, target: ModelTarget) -> CostEstimate:
+    """Learned cost from the active estimator, else the probe's static estimate."""
+    estimator = _active.get()
+    return estimator.estimate(probe, target) if estimator is not None else probe.estimated_cost
+
+
+def exceeds_budget(probe: ProbeProtocol, target: ModelTarget) -> bool:
+    """The probe-side max_tokens_per_run check (0 = no limit)."""
+    budget = int(getattr(probe.config, "max_tokens_per_run", 0))
+    return budget > 0 and expected_cost(probe, target).total_tokens > budget
+
+
+__all__ = [
+    "CostEstimator",
+    "TokenStats",
+    "exceeds_budget",
+    "expected_cost",
+    "use_estimator",
+]
@@ -4,7 +4,7 @@ from typing import Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel
 
-from nerfprobe_core.core.entities import ModelTarget, ProbeResult
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType
 from nerfprobe_core.core.gateway import LLMGateway
 
 
@@ -55,3 +55,32 @@ class ProbeProtocol(Protocol):
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         """Execute the probe and return results."""
         ...
+
+
+@runtime_checkable
+class FusableProbe(ProbeProtocol, Protocol):
+    """
+    A probe whose short prompts can share one request with other probes.
+    See nerfprobe_core.probes.fusion.
+    """
+
+    @property
+    def probe_type(self) -> ProbeType:
+        """Type recorded on this probe's results."""
+        ...
+
+    def fusable_prompts(self) -> list[str]:
+        """Prompts that can be fused (empty if this configuration must run alone)."""
+        ...
+
+    async def score_fused(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        answers: list[str],
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> ProbeResult:
+        """Build the result from this probe's answers, split out of a fused reply."""
+        ...
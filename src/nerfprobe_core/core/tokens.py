@@ -0,0 +1,203 @@
+"""
+Approximate token counting without a tokenizer.
+
+BPE tokenizers spend roughly one token per short English word, one per
+3 digits, about one per CJK character and fractions of a token on
+other multi-byte scripts. The text's UTF-8 bytes are mapped to character
+classes with bytes.translate and the classes and their runs are tallied
+with bytes.count, so megabyte prompts are counted in a few milliseconds.
+
+Per-family TokenProfiles adjust the class weights (e.g. tokenizers with
+large CJK vocabularies); calibrate() fits a profile's scale to token
+counts reported by a provider.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from nerfprobe_core.models import get_model_info, normalize_model_id
+
+
+@dataclass(frozen=True, slots=True)
+class TokenProfile:
+    """Token weights per character class (rough, tokenizer-family specific)."""
+
+    letters_per_token: float = 4.0  # ASCII letters; every word costs at least one token
+    digits_per_token: float = 3.0  # Digit runs are split into groups of up to 3
+    punct_per_token: float = 1.3  # Some punctuation pairs merge ("()", "==", "**")
+    newline_tokens: float = 0.6
+    space_run_tokens: float = 1.0  # Runs of 2+ spaces/tabs (indentation)
+    two_byte_tokens: float = 0.5  # Latin-1 accents, Greek, Cyrillic, Arabic, Hebrew
+    three_byte_tokens: float = 1.0  # CJK, Thai, Devanagari, ...
+    four_byte_tokens: float = 2.0  # Emoji, rare CJK
+    scale: float = 1.0  # Overall calibration factor
+
+
+DEFAULT_PROFILE = TokenProfile()
+
+# Normalized model-ID prefix -> profile. Rough defaults; override with
+# register_profile() or fit with calibrate() from real usage counts.
+FAMILY_PROFILES: dict[str, TokenProfile] = {
+    "gpt": DEFAULT_PROFILE,
+    "claude": TokenProfile(scale=1.15),
+    "gemini": TokenProfile(three_byte_tokens=0.8, scale=0.95),
+    "llama": TokenProfile(three_byte_tokens=1.2),
+    "mistral": TokenProfile(scale=1.1, three_byte_tokens=1.3),
+    "qwen": TokenProfile(three_byte_tokens=0.7),
+    "deepseek": TokenProfile(three_byte_tokens=0.7),
+    "grok": TokenProfile(scale=1.05),
+}
+
+
+def _table(mapping: dict[bytes, bytes], default: bytes) -> bytes:
+    table = bytearray(default * 256)
+    for chars, cls in mapping.items():
+        for b in chars:
+            table[b] = cls[0]
+    return bytes(table)
+
+
+_LETTERS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_DIGITS = b"0123456789"
+_SPACES = b" \t\r\x0b\x0c"
+
+# Character class per UTF-8 byte: a=letter d=digit n=newline ' '=space
+# p=punctuation/control c=continuation 2/3/4=lead byte of a 2/3/4-byte char
+_CLASSES = _table(
+    {
+        _LETTERS: b"a",
+        _DIGITS: b"d",
+        b"\n": b"n",
+        _SPACES: b" ",
+        bytes(range(0x80, 0xC0)): b"c",
+        bytes(range(0xC0, 0xE0)): b"2",
+        bytes(range(0xE0, 0xF0)): b"3",
+        bytes(range(0xF0, 0x100)): b"4",
+    },
+    b"p",
+)
+# Single-class masks: a run of the class starts wherever " X" occurs
+_LETTER_MASK = _table({_LETTERS: b"X"}, b" ")
+_DIGIT_MASK = _table({_DIGITS: b"X"}, b" ")
+_SPACE_MASK = _table({_SPACES: b" "}, b"X")
+
+
+def _runs(mask: bytes) -> int:
+    """Number of runs of b"X" in a mask."""
+    return mask.count(b" X") + (mask[:1] == b"X")
+
+
+def _counts(data: bytes) -> tuple[float, ...]:
+    classes = data.translate(_CLASSES)
+    space_mask = data.translate(_SPACE_MASK)
+    return (
+        classes.count(b"a"),
+        _runs(data.translate(_LETTER_MASK)),
+        classes.count(b"d"),
+        _runs(data.translate(_DIGIT_MASK)),
+        classes.count(b"p"),
+        classes.count(b"n"),
+        space_mask.count(b"X  ") + (space_mask[:2] == b"  "),
+        classes.count(b"2"),
+        classes.count(b"3"),
+        classes.count(b"4"),
+    )
+
+
+def _estimate(counts: tuple[float, ...], profile: TokenProfile) -> float:
+    letters, words, digits, numbers, punct, newlines, space_runs, two, three, four = counts
+    tokens = (
+        max(words, letters / profile.letters_per_token)
+        + max(numbers, digits / profile.digits_per_token)
+        + punct / profile.punct_per_token
+        + newlines * profile.newline_tokens
+        + space_runs * profile.space_run_tokens
+        + two * profile.two_byte_tokens
+        + three * profile.three_byte_tokens
+        + four * profile.four_byte_tokens
+    )
+    return tokens * profile.scale
+
+
+def profile_for(model_name: str | None) -> TokenProfile:
+    """Profile of the longest FAMILY_PROFILES prefix matching the model ID."""
+    if not model_name:
+        return DEFAULT_PROFILE
+    key = normalize_model_id(model_name)
+    best = ""
+    for family in FAMILY_PROFILES:
+        if key.startswith(family) and len(family) > len(best):
+            best = family
+    return FAMILY_PROFILES[best] if best else DEFAULT_PROFILE
+
+
+def register_profile(family: str, profile: TokenProfile) -> None:
+    """Add or replace the profile for a model-ID prefix."""
+    FAMILY_PROFILES[normalize_model_id(family)] = profile
+
+
+def approx_token_count(text: str, model_name: str | None = None, profile: TokenProfile | None = None) -> int:
+    """
+    Approximate token count of text.
+
+    Args:
+        text: Text to count.
+        model_name: Model ID used to pick a family profile.
+        profile: Explicit profile (overrides model_name).
+    """
+    if not text:
+        return 0
+    profile = profile or profile_for(model_name)
+    return max(1, round(_estimate(_counts(text.encode("utf-8")), profile)))
+
+
+def calibrate(samples: Iterable[tuple[str, int]], profile: TokenProfile = DEFAULT_PROFILE) -> TokenProfile:
+    """
+    Fit a profile's scale to (text, actual_token_count) samples.
+
+    The scale is the ratio of actual to estimated totals, so a handful of
+    provider-reported prompt_tokens counts is enough.
+    """
+    base = replace(profile, scale=1.0)
+    estimated = actual = 0.0
+    for text, tokens in samples:
+        estimated += _estimate(_counts(text.encode("utf-8")), base)
+        actual += tokens
+    if estimated <= 0 or actual <= 0:
+        return profile
+    return replace(profile, scale=actual / estimated)
+
+
+def fits_context_window(prompt: str | int, model_name: str, reserve_tokens: int = 0) -> bool:
+    """
+    Whether a prompt (text or token count) plus `reserve_tokens` of output
+    fits the model's registered context window. True if the window is unknown.
+    """
+    info = get_model_info(model_name)
+    if info is None or not info.context_window:
+        return True
+    tokens = prompt if isinstance(prompt, int) else approx_token_count(prompt, model_name)
+    return tokens + reserve_tokens <= info.context_window
+
+
+_WORD = re.compile(r"\S+")
+
+
+def tokens_per_word(sample: str, model_name: str | None = None) -> float:
+    """Average tokens per whitespace-separated word in a sample text."""
+    words = len(_WORD.findall(sample))
+    return approx_token_count(sample, model_name) / words if words else 1.0
+
+
+__all__ = [
+    "DEFAULT_PROFILE",
+    "FAMILY_PROFILES",
+    "TokenProfile",
+    "approx_token_count",
+    "calibrate",
+    "fits_context_window",
+    "profile_for",
+    "register_profile",
+    "tokens_per_word",
+]
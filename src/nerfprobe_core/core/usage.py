@@ -0,0 +1,243 @@
+"""
+Usage metering - token and dollar accounting across probes and targets.
+
+MeteredGateway wraps any LLMGateway and feeds a UsageMeter from the usage
+each response carries (StrWithUsage.usage or LogprobResult token counts),
+so probes need no changes. The probe a request belongs to is taken from
+probe_scope(), which MeteredGateway.run_probe() sets automatically.
+
+Costs use ModelTarget.cost_per_m_in / cost_per_m_out (USD per million tokens).
+"""
+
+import contextlib
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from nerfprobe_core.core.entities import LogprobResult, ModelTarget, ProbeResult
+from nerfprobe_core.core.gateway import LLMGateway
+from nerfprobe_core.core.scorer import ProbeProtocol
+
+UNATTRIBUTED = "unattributed"
+
+_current_probe: ContextVar[str | None] = ContextVar("nerfprobe_current_probe", default=None)
+
+
+def extract_usage(response: Any) -> tuple[int | None, int | None]:
+    """
+    (input_tokens, output_tokens) reported by a gateway response; None for a
+    count the response does not carry, so "unreported" is not mistaken for 0.
+    """
+    if isinstance(response, LogprobResult):
+        return response.input_tokens, response.output_tokens
+    usage = getattr(response, "usage", None) or {}
+    input_tokens = usage.get("prompt_tokens", usage.get("input_tokens"))
+    output_tokens = usage.get("completion_tokens", usage.get("output_tokens"))
+    return (
+        None if input_tokens is None else int(input_tokens),
+        None if output_tokens is None else int(output_tokens),
+    )
+
+
+def sum_tokens(*counts: int | None) -> int | None:
+    """Sum of the reported token counts; None if none was reported."""
+    reported = [count for count in counts if count is not None]
+    return sum(reported) if reported else None
+
+
+def cost_usd(target: ModelTarget, input_tokens: int, output_tokens: int) -> float:
+    """Dollar cost of a token count at the target's per-million prices."""
+    return (input_tokens * target.cost_per_m_in + output_tokens * target.cost_per_m_out) / 1_000_000
+
+
+@contextlib.contextmanager
+def probe_scope(probe_name: str) -> Iterator[None]:
+    """Attribute metered requests made inside the block (and tasks it spawns) to a probe."""
+    token = _current_probe.set(probe_name)
+    try:
+        yield
+    finally:
+        _current_probe.reset(token)
+
+
+@dataclass(frozen=True, slots=True)
+class UsageTotals:
+    """Aggregated usage."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+# Counter cell: [requests, input_tokens, output_tokens]
+_Cells = dict[tuple[ModelTarget, str], list[int]]
+
+
+class UsageMeter:
+    """
+    Thread-safe usage counters by (target, probe) and time bucket.
+
+    record() is a dict lookup and three integer adds under a lock, so it can
+    run on every request. Totals for a time window are summed from
+    `bucket_seconds` buckets, of which the most recent `max_buckets` are kept.
+    The running totals (requests, input_tokens, output_tokens, cost_usd) are
+    plain attributes a scheduler can poll without locking.
+    """
+
+    def __init__(self, bucket_seconds: float = 60.0, max_buckets: int = 1440):
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._lock = threading.Lock()
+        self._totals: _Cells = {}
+        self._buckets: dict[int, _Cells] = {}
+
+        self.requests = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cost_usd = 0.0
+
+    def record(
+        self,
+        target: ModelTarget,
+        input_tokens: int | None,
+        output_tokens: int | None,
+        probe_name: str | None = None,
+        at: float | None = None,
+        requests: int = 1,
+    ) -> None:
+        """
+        Count `requests` requests' usage (unreported counts add 0). probe_name
+        defaults to the enclosing probe_scope().
+        """
+        probe_name = probe_name or _current_probe.get() or UNATTRIBUTED
+        input_tokens = input_tokens or 0
+        output_tokens = output_tokens or 0
+        bucket_id = int((time.time() if at is None else at) // self.bucket_seconds)
+        key = (target, probe_name)
+
+        with self._lock:
+            bucket = self._buckets.get(bucket_id)
+            if bucket is None:
+                bucket = self._buckets[bucket_id] = {}
+                if len(self._buckets) > self.max_buckets:
+                    del self._buckets[min(self._buckets)]
+
+            for cells in (self._totals, bucket):
+                cell = cells.get(key)
+                if cell is None:
+                    cell = cells[key] = [0, 0, 0]
+                cell[0] += requests
+                cell[1] += input_tokens
+                cell[2] += output_tokens
+
+            self.requests += requests
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            self.cost_usd += cost_usd(target, input_tokens, output_tokens)
+
+    def record_result(self, result: ProbeResult, requests: int = 0) -> None:
+        """
+        Count a finished ProbeResult's reported tokens. A result does not say
+        how many calls it took, so no requests are counted unless given.
+        """
+        self.record(
+            result.target,
+            result.input_tokens,
+            result.output_tokens,
+            probe_name=result.probe_name,
+            at=result.timestamp.timestamp(),
+            requests=requests,
+        )
+
+    def _cells_since(self, since: float | None) -> list[tuple[tuple[ModelTarget, str], list[int]]]:
+        with self._lock:
+            if since is None:
+                return [(key, list(cell)) for key, cell in self._totals.items()]
+            first = int(since // self.bucket_seconds)
+            return [
+                (key, list(cell)) for b, cells in self._buckets.items() if b >= first for key, cell in cells.items()
+            ]
+
+    def totals(
+        self,
+        target: ModelTarget | None = None,
+        probe_name: str | None = None,
+        window_seconds: float | None = None,
+    ) -> UsageTotals:
+        """
+        Usage matching the filters. With window_seconds, only the last
+        window (rounded out to whole buckets) is counted.
+        """
+        return self._group(lambda t, p: None, target, probe_name, window_seconds).get(None, UsageTotals())
+
+    def by_target(self, window_seconds: float | None = None) -> dict[ModelTarget, UsageTotals]:
+        return self._group(lambda t, p: t, None, None, window_seconds)
+
+    def by_probe(
+        self, target: ModelTarget | None = None, window_seconds: float | None = None
+    ) -> dict[str, UsageTotals]:
+        return self._group(lambda t, p: p, target, None, window_seconds)
+
+    def _group(
+        self,
+        key_fn: Callable[[ModelTarget, str], Any],
+        target: ModelTarget | None,
+        probe_name: str | None,
+        window_seconds: float | None,
+    ) -> dict[Any, UsageTotals]:
+        since = time.time() - window_seconds if window_seconds is not None else None
+        sums: dict[Any, list[float]] = {}
+        for (t, p), (requests, in_tok, out_tok) in self._cells_since(since):
+            if (target is not None and t != target) or (probe_name is not None and p != probe_name):
+                continue
+            acc = sums.setdefault(key_fn(t, p), [0, 0, 0, 0.0])
+            acc[0] += requests
+            acc[1] += in_tok
+            acc[2] += out_tok
+            acc[3] += cost_usd(t, in_tok, out_tok)
+        return {k: UsageTotals(int(r), int(i), int(o), c) for k, (r, i, o, c) in sums.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self._buckets.clear()
+            self.requests = self.input_tokens = self.output_tokens = 0
+            self.cost_usd = 0.0
+
+
+class MeteredGateway:
+    """LLMGateway wrapper that records every response's usage in a UsageMeter."""
+
+    def __init__(self, gateway: LLMGateway, meter: UsageMeter):
+        self.gateway = gateway
+        self.meter = meter
+
+    async def generate(self, model: ModelTarget, prompt: str) -> str:
+        response = await self.gateway.generate(model, prompt)
+        self.meter.record(model, *extract_usage(response))
+        return response
+
+    async def generate_stream(self, model: ModelTarget, prompt: str) -> AsyncIterator[str]:
+        # Streams carry no usage; count the request so rates stay accurate
+        self.meter.record(model, 0, 0)
+        async for chunk in self.gateway.generate_stream(model, prompt):
+            yield chunk
+
+    async def generate_with_logprobs(self, model: ModelTarget, prompt: str, top_logprobs: int = 5) -> LogprobResult:
+        response = await self.gateway.generate_with_logprobs(model, prompt, top_logprobs)
+        self.meter.record(model, *extract_usage(response))
+        return response
+
+    async def run_probe(self, probe: ProbeProtocol, target: ModelTarget) -> ProbeResult:
+        """Run a probe through this gateway with its requests attributed to it."""
+        name = getattr(probe.config, "name", type(probe).__name__)
+        with probe_scope(name):
+            return await probe.run(target, self)
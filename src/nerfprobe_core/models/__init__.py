@@ -3,12 +3,27 @@ Model metadata registry for probe-aware testing.
 
 Ships with flagship examples (1 per provider).
 Users can research additional models via prompt template.
+
+The registry is merged from up to three YAML layers, later layers
+overriding earlier ones per model and per field:
+
+    bundled  models.yaml shipped with the package
+    site     $NERFPROBE_SITE_MODELS, else /etc/nerfprobe/models.yaml
+    user     $NERFPROBE_USER_MODELS, else ~/.config/nerfprobe/models.yaml
+
+The user layer is the local overlay that ModelOverlay and
+research_models() write to.
 """
 
+import hashlib
+import json
+import os
+import re
+import threading
 from datetime import date
 from pathlib import Path
+from typing import Any
 
-import yaml
 from pydantic import BaseModel
 
 
@@ -33,21 +48,16 @@ class ModelInfo(BaseModel):
     params_active_b: float | None = None  # For MoE models
 
 
-def _load_models() -> tuple[dict[str, ModelInfo], dict[str, str]]:
-    """Load models from YAML file."""
-    yaml_path = Path(__file__).parent / "models.yaml"
+LAYERS = ("bundled", "site", "user")
 
-    if not yaml_path.exists():
-        return {}, {}
-
-    with open(yaml_path) as f:
-        data = yaml.safe_load(f)
 
+def _parse_models(data: dict[str, Any]) -> tuple[dict[str, ModelInfo], dict[str, str]]:
+    """Build ModelInfo objects from parsed registry data (YAML or snapshot)."""
     models: dict[str, ModelInfo] = {}
-    for m in data.get("models", []):
+    for m in data.get("models") or []:
         cutoff = None
         if m.get("knowledge_cutoff"):
-            cutoff = date.fromisoformat(m["knowledge_cutoff"])
+            cutoff = date.fromisoformat(str(m["knowledge_cutoff"]))
 
         models[m["id"]] = ModelInfo(
             id=m["id"],
@@ -59,46 +69,183 @@ def _load_models() -> tuple[dict[str, ModelInfo], dict[str, str]]:
             params_active_b=m.get("params_active_b"),
         )
 
-    aliases: dict[str, str] = data.get("aliases", {})
+    aliases: dict[str, str] = data.get("aliases") or {}
     return models, aliases
 
 
-# Load on import
-MODELS, _ALIASES = _load_models()
+# Trailing release dates: -20240229, -2024-02-29, @20240229
+_DATE_SUFFIX = re.compile(r"[-@_]?(?:\d{8}|\d{4}-\d{2}-\d{2})$")
+
+
+def normalize_model_id(model_id: str) -> str:
+    """
+    Canonical lookup key for a model ID.
+
+    Lowercases, drops a provider prefix ("openai/gpt-5" -> "gpt-5"), a
+    ":variant" tag, a trailing release date or "-latest", and treats '.',
+    '_' and spaces as '-' (so "claude-opus-4-5-20251101" matches
+    "claude-opus-4.5").
+    """
+    key = model_id.strip().lower()
+    key = key.rsplit("/", 1)[-1].split(":", 1)[0]
+    key = re.sub(r"[._\s]+", "-", key)
+    key = _DATE_SUFFIX.sub("", key)
+    key = key.removesuffix("-latest")
+    return key
+
+
+def _config_dir() -> Path:
+    return Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "nerfprobe"
+
+
+def layer_paths() -> dict[str, Path]:
+    """YAML file of each registry layer, lowest precedence first (files may not exist)."""
+    return {
+        "bundled": Path(__file__).parent / "models.yaml",
+        "site": Path(os.environ.get("NERFPROBE_SITE_MODELS") or "/etc/nerfprobe/models.yaml"),
+        "user": Path(os.environ.get("NERFPROBE_USER_MODELS") or _config_dir() / "models.yaml"),
+    }
+
+
+def _merge_layers(layers: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge parsed registry layers. A model entry in a later layer updates the
+    fields it sets on the earlier entry with the same ID; aliases are
+    overridden per key.
+    """
+    entries: dict[str, dict[str, Any]] = {}
+    aliases: dict[str, str] = {}
+    for data in layers:
+        for entry in data.get("models") or []:
+            entries.setdefault(entry["id"], {}).update(entry)
+        aliases.update(data.get("aliases") or {})
+    return {"models": list(entries.values()), "aliases": aliases}
+
+
+def _cache_dir() -> Path:
+    env = os.environ.get("NERFPROBE_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "nerfprobe"
+
+
+def _read_registry_data(yaml_path: Path) -> dict[str, Any]:
+    """
+    Registry data for a YAML file, via a JSON snapshot keyed by the file's
+    mtime and size so warm starts skip YAML parsing. Cache failures are
+    never fatal.
+    """
+    stat = yaml_path.stat()
+    digest = hashlib.sha256(str(yaml_path.resolve()).encode()).hexdigest()[:16]
+    snapshot = _cache_dir() / f"models-{digest}.json"
+    stamp = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = json.loads(snapshot.read_text())
+        if cached.get("stamp") == stamp:
+            data: dict[str, Any] = cached["data"]
+            return data
+    except (OSError, ValueError, KeyError):
+        pass
+
+    import yaml  # Only needed on a cold start
+
+    with open(yaml_path) as f:
+        data = yaml.safe_load(f) or {}
+
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        tmp = snapshot.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"stamp": stamp, "data": data}, default=str))
+        os.replace(tmp, snapshot)
+    except OSError:
+        pass
+    return data
+
+
+class _Registry:
+    """Loaded models, aliases and the normalized lookup index."""
+
+    def __init__(self, models: dict[str, ModelInfo], aliases: dict[str, str]):
+        self.models = models
+        self.aliases = aliases
+        self.index: dict[str, str] = {}
+        # IDs take precedence over aliases when normalized keys collide
+        for key, model_id in [(m, m) for m in models] + list(aliases.items()):
+            if model_id in models:
+                self.index.setdefault(normalize_model_id(key), model_id)
+
+
+def _load_registry() -> _Registry:
+    """Load and merge the registry layers that exist."""
+    layers = [_read_registry_data(path) for path in layer_paths().values() if path.is_file()]
+    return _Registry(*_parse_models(_merge_layers(layers)))
+
+
+_registry: _Registry | None = None
+_registry_lock = threading.Lock()
+
+
+def _get_registry() -> _Registry:
+    """The registry, loaded on first access."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _load_registry()
+    return _registry
+
+
+def reload_registry() -> None:
+    """Drop the loaded registry so the next lookup re-reads all layers."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
+def __getattr__(name: str) -> Any:
+    # MODELS / _ALIASES stay importable but are only loaded when touched
+    if name == "MODELS":
+        return _get_registry().models
+    if name == "_ALIASES":
+        return _get_registry().aliases
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_model_info(model_id: str) -> ModelInfo | None:
     """
     Look up model metadata by ID.
 
-    Returns None if model not in registry.
+    Matches exact IDs and aliases first, then normalized keys (case,
+    provider prefix, date suffix). Returns None if model not in registry.
     Use RESEARCH_PROMPT to research unknown models.
     """
+    registry = _get_registry()
+
     # Direct match
-    if model_id in MODELS:
-        return MODELS[model_id]
+    if model_id in registry.models:
+        return registry.models[model_id]
 
     # Try alias
-    if model_id in _ALIASES:
-        return MODELS.get(_ALIASES[model_id])
-
-    # Try lowercase
-    lower_id = model_id.lower()
-    for key, info in MODELS.items():
-        if key.lower() == lower_id:
-            return info
+    if model_id in registry.aliases:
+        return registry.models.get(registry.aliases[model_id])
 
-    return None
+    resolved = registry.index.get(normalize_model_id(model_id))
+    return registry.models[resolved] if resolved is not None else None
 
 
 def list_models() -> list[str]:
     """List all known model IDs."""
-    return list(MODELS.keys())
+    return list(_get_registry().models.keys())
 
 
 __all__ = [
     "ModelInfo",
     "MODELS",
+    "LAYERS",
     "get_model_info",
+    "layer_paths",
     "list_models",
+    "normalize_model_id",
+    "reload_registry",
 ]
@@ -0,0 +1,88 @@
+"""
+Persistent local overlay of researched model metadata.
+
+The overlay is a models.yaml-format file, by default the registry's user
+layer, so saved entries take effect on the next registry load.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from nerfprobe_core.models import ModelInfo, layer_paths, reload_registry
+
+
+def _entry(info: ModelInfo) -> dict[str, Any]:
+    """YAML entry for a model; unknown (None) fields are omitted so they never mask lower layers."""
+    entry = info.model_dump(exclude_none=True)
+    if info.knowledge_cutoff is not None:
+        entry["knowledge_cutoff"] = info.knowledge_cutoff.isoformat()
+    return entry
+
+
+class ModelOverlay:
+    """
+    Editable models.yaml overlay.
+
+    Entries added with add() are held in memory until save(), which rewrites
+    the file atomically and invalidates the loaded registry.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else layer_paths()["user"]
+        self._models: dict[str, dict[str, Any]] = {}
+        self._aliases: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.is_file():
+            return
+        import yaml
+
+        with open(self.path) as f:
+            data = yaml.safe_load(f) or {}
+        for entry in data.get("models") or []:
+            self._models[entry["id"]] = dict(entry)
+        self._aliases.update(data.get("aliases") or {})
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def ids(self) -> list[str]:
+        return list(self._models)
+
+    def add(self, info: ModelInfo, aliases: list[str] | None = None) -> None:
+        """Add or replace a model entry (and optional aliases pointing to it)."""
+        with self._lock:
+            self._models[info.id] = _entry(info)
+            for alias in aliases or []:
+                self._aliases[alias] = info.id
+
+    def remove(self, model_id: str) -> None:
+        with self._lock:
+            self._models.pop(model_id, None)
+            self._aliases = {a: m for a, m in self._aliases.items() if m != model_id}
+
+    def save(self) -> None:
+        """Write the overlay atomically and reload the registry on next access."""
+        import yaml
+
+        with self._lock:
+            data: dict[str, Any] = {"models": list(self._models.values())}
+            if self._aliases:
+                data["aliases"] = dict(self._aliases)
+            text = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, self.path)
+        reload_registry()
+
+
+__all__ = ["ModelOverlay"]
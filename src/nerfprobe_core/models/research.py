@@ -2,13 +2,20 @@
 Research prompt template for model metadata.
 
 Users can run this prompt through any LLM to research
-models not in the bundled registry.
+models not in the bundled registry, or research many IDs at once with
+research_models(), which saves results to the local overlay.
 """
 
+import asyncio
 import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import date
 
-from nerfprobe_core.models import ModelInfo
+from nerfprobe_core.core.entities import ModelTarget
+from nerfprobe_core.core.gateway import LLMGateway
+from nerfprobe_core.models import ModelInfo, get_model_info
+from nerfprobe_core.models.overlay import ModelOverlay
 
 RESEARCH_PROMPT = """Research the following specifications for the AI model "{model_name}" by {provider}:  # noqa: E501
 
@@ -98,8 +105,96 @@ def parse_research_response(
         return None
 
 
+@dataclass
+class ResearchReport:
+    """Outcome of a research_models() run."""
+
+    researched: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)  # model_id -> reason
+
+
+async def research_models(
+    models: Mapping[str, str] | Iterable[tuple[str, str]],
+    gateway: LLMGateway,
+    researcher: ModelTarget,
+    overlay: ModelOverlay | None = None,
+    concurrency: int = 8,
+    refresh: bool = False,
+    checkpoint_every: int = 25,
+) -> ResearchReport:
+    """
+    Research unknown models concurrently and save them to the overlay.
+
+    Args:
+        models: model_id -> provider (or (model_id, provider) pairs)
+        gateway: Gateway used to run the research prompts
+        researcher: Model that answers the research prompts
+        overlay: Overlay to write to (default: the registry's user layer)
+        concurrency: Maximum research requests in flight
+        refresh: Re-research models that are already known
+        checkpoint_every: Save the overlay after this many new models
+
+    The overlay is saved (off the event loop) every `checkpoint_every`
+    models and once at the end, so an interrupted run loses at most one
+    checkpoint and resumes by calling again with the same IDs: known models
+    are skipped and only the missing or failed ones are researched.
+    """
+    overlay = overlay if overlay is not None else ModelOverlay()
+    pairs = list(models.items()) if isinstance(models, Mapping) else list(models)
+    report = ResearchReport()
+
+    pending: list[tuple[str, str]] = []
+    for model_id, provider in dict(pairs).items():
+        if not refresh and (model_id in overlay or get_model_info(model_id) is not None):
+            report.skipped.append(model_id)
+        else:
+            pending.append((model_id, provider))
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    save_lock = asyncio.Lock()
+    unsaved = 0
+
+    async def save() -> None:
+        nonlocal unsaved
+        # Every save rewrites the whole file and reloads the registry
+        await asyncio.to_thread(overlay.save)
+        unsaved = 0
+
+    async def research_one(model_id: str, provider: str) -> None:
+        async with semaphore:
+            try:
+                response = await gateway.generate(researcher, get_research_prompt(model_id, provider))
+            except Exception as e:
+                report.failed[model_id] = f"ERROR: {e!s}"
+                return
+
+        info = parse_research_response(model_id, provider, str(response))
+        if info is None:
+            report.failed[model_id] = "Unparseable response"
+            return
+
+        nonlocal unsaved
+        async with save_lock:
+            overlay.add(info)
+            report.researched.append(model_id)
+            unsaved += 1
+            if unsaved >= checkpoint_every:
+                await save()
+
+    try:
+        await asyncio.gather(*(research_one(model_id, provider) for model_id, provider in pending))
+    finally:
+        async with save_lock:
+            if unsaved:
+                await save()
+    return report
+
+
 __all__ = [
     "RESEARCH_PROMPT",
+    "ResearchReport",
     "get_research_prompt",
     "parse_research_response",
+    "research_models",
 ]
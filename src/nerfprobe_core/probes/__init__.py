@@ -1,17 +1,12 @@
-"""Probes module - organized by tier."""
+"""Probes module - organized by tier.
 
-# Advanced tier probes
-from nerfprobe_core.probes.advanced import (
-    ChainOfThoughtProbe,
-    ConsistencyProbe,
-    ConstraintProbe,
-    ContextProbe,
-    FingerprintProbe,
-    JsonProbe,
-    LogicProbe,
-    RepetitionProbe,
-    RoutingProbe,
-)
+Configs are imported eagerly; probe classes load on first attribute access
+(see PROBE_REGISTRY for key-based lookup and plugin discovery).
+"""
+
+from typing import TYPE_CHECKING
+
+from nerfprobe_core._lazy import lazy_exports
 from nerfprobe_core.probes.config import (
     # Base
     BaseProbeConfig,
@@ -24,6 +19,9 @@ from nerfprobe_core.probes.config import (
     ConsistencyProbeConfig,
     ConstraintProbeConfig,
     ContextProbeConfig,
+    # Shared
+    DatasetConfig,
+    DiversityThresholds,
     FactProbeConfig,
     # Advanced tier
     FingerprintProbeConfig,
@@ -34,25 +32,71 @@ from nerfprobe_core.probes.config import (
     MultilingualProbeConfig,
     RepetitionProbeConfig,
     RoutingProbeConfig,
+    SequentialTestConfig,
     StyleProbeConfig,
+    TemporalConsistencyConfig,
     TimingProbeConfig,
     ZeroPrintProbeConfig,
 )
+from nerfprobe_core.probes.registry import PROBE_REGISTRY, create_probe
 
-# Core tier probes
-from nerfprobe_core.probes.core import (
-    CodeProbe,
-    FactProbe,
-    MathProbe,
-    StyleProbe,
-    TimingProbe,
-)
+if TYPE_CHECKING:
+    from nerfprobe_core.probes.advanced import (
+        ChainOfThoughtProbe,
+        ConsistencyProbe,
+        ConstraintProbe,
+        ContextProbe,
+        FingerprintProbe,
+        JsonProbe,
+        LogicProbe,
+        RepetitionProbe,
+        RoutingProbe,
+    )
+    from nerfprobe_core.probes.core import (
+        CodeProbe,
+        FactProbe,
+        MathProbe,
+        StyleProbe,
+        TimingProbe,
+    )
+    from nerfprobe_core.probes.fusion import run_fused
+    from nerfprobe_core.probes.optional import (
+        CalibrationProbe,
+        MultilingualProbe,
+        TemporalProbe,
+        ZeroPrintProbe,
+    )
+    from nerfprobe_core.probes.utility import ComparisonProbe, SequentialProbe
 
-# Optional tier probes
-from nerfprobe_core.probes.optional import (
-    CalibrationProbe,
-    MultilingualProbe,
-    ZeroPrintProbe,
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        # Core tier probes
+        "MathProbe": "nerfprobe_core.probes.core",
+        "StyleProbe": "nerfprobe_core.probes.core",
+        "TimingProbe": "nerfprobe_core.probes.core",
+        "CodeProbe": "nerfprobe_core.probes.core",
+        "FactProbe": "nerfprobe_core.probes.core",
+        # Advanced tier probes
+        "FingerprintProbe": "nerfprobe_core.probes.advanced",
+        "ContextProbe": "nerfprobe_core.probes.advanced",
+        "RoutingProbe": "nerfprobe_core.probes.advanced",
+        "RepetitionProbe": "nerfprobe_core.probes.advanced",
+        "ConstraintProbe": "nerfprobe_core.probes.advanced",
+        "LogicProbe": "nerfprobe_core.probes.advanced",
+        "ChainOfThoughtProbe": "nerfprobe_core.probes.advanced",
+        "JsonProbe": "nerfprobe_core.probes.advanced",
+        "ConsistencyProbe": "nerfprobe_core.probes.advanced",
+        # Optional tier probes
+        "CalibrationProbe": "nerfprobe_core.probes.optional",
+        "ZeroPrintProbe": "nerfprobe_core.probes.optional",
+        "MultilingualProbe": "nerfprobe_core.probes.optional",
+        "TemporalProbe": "nerfprobe_core.probes.optional",
+        # Utility probes (wrap other probes; built from a wrapped config)
+        "ComparisonProbe": "nerfprobe_core.probes.utility",
+        "SequentialProbe": "nerfprobe_core.probes.utility",
+        "run_fused": "nerfprobe_core.probes.fusion",
+    },
 )
 
 # Tier definitions for CLI --tier flag
@@ -68,33 +112,11 @@ ADVANCED_PROBES = [
     "json",
     "consistency",
 ]
+# "temporal" needs a local events file (events_path), so no tier runs it by default
 OPTIONAL_PROBES = ["calibration", "zeroprint", "multilingual"]
 
 ALL_PROBES = CORE_PROBES + ADVANCED_PROBES + OPTIONAL_PROBES
 
-# Probe class registry
-PROBE_REGISTRY = {
-    # Core
-    "math": MathProbe,
-    "style": StyleProbe,
-    "timing": TimingProbe,
-    "code": CodeProbe,
-    "fact": FactProbe,
-    # Advanced
-    "fingerprint": FingerprintProbe,
-    "context": ContextProbe,
-    "routing": RoutingProbe,
-    "repetition": RepetitionProbe,
-    "constraint": ConstraintProbe,
-    "logic": LogicProbe,
-    "cot": ChainOfThoughtProbe,
-    "json": JsonProbe,
-    "consistency": ConsistencyProbe,
-    # Optional
-    "calibration": CalibrationProbe,
-    "zeroprint": ZeroPrintProbe,
-    "multilingual": MultilingualProbe,
-}
 
 __all__ = [
     # Configs
@@ -113,6 +135,7 @@ __all__ = [
     "CalibrationProbeConfig",
     "ZeroPrintProbeConfig",
     "MultilingualProbeConfig",
+    "TemporalConsistencyConfig",
     "ComparisonProbeConfig",
     "FactProbeConfig",
     # Probe classes
@@ -130,15 +153,24 @@ __all__ = [
     "CalibrationProbe",
     "ZeroPrintProbe",
     "MultilingualProbe",
+    "TemporalProbe",
     "JsonProbe",
     "ConsistencyProbe",
     "FactProbe",
     "JsonProbeConfig",
     "ConsistencyProbeConfig",
+    "DatasetConfig",
+    "DiversityThresholds",
+    "SequentialTestConfig",
+    # Utility probes
+    "ComparisonProbe",
+    "SequentialProbe",
     # Tier lists
     "CORE_PROBES",
     "ADVANCED_PROBES",
     "OPTIONAL_PROBES",
     "ALL_PROBES",
     "PROBE_REGISTRY",
+    "create_probe",
+    "run_fused",
 ]
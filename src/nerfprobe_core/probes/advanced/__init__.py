@@ -1,14 +1,37 @@
-"""Advanced tier probes - research-backed advanced detection."""
+"""Advanced tier probes - research-backed advanced detection.
 
-from nerfprobe_core.probes.advanced.consistency_probe import ConsistencyProbe
-from nerfprobe_core.probes.advanced.constraint_probe import ConstraintProbe
-from nerfprobe_core.probes.advanced.context_probe import ContextProbe
-from nerfprobe_core.probes.advanced.cot_probe import ChainOfThoughtProbe
-from nerfprobe_core.probes.advanced.fingerprint_probe import FingerprintProbe
-from nerfprobe_core.probes.advanced.json_probe import JsonProbe
-from nerfprobe_core.probes.advanced.logic_probe import LogicProbe
-from nerfprobe_core.probes.advanced.repetition_probe import RepetitionProbe
-from nerfprobe_core.probes.advanced.routing_probe import RoutingProbe
+Probe modules are imported on first attribute access.
+"""
+
+from typing import TYPE_CHECKING
+
+from nerfprobe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from nerfprobe_core.probes.advanced.consistency_probe import ConsistencyProbe
+    from nerfprobe_core.probes.advanced.constraint_probe import ConstraintProbe
+    from nerfprobe_core.probes.advanced.context_probe import ContextProbe
+    from nerfprobe_core.probes.advanced.cot_probe import ChainOfThoughtProbe
+    from nerfprobe_core.probes.advanced.fingerprint_probe import FingerprintProbe
+    from nerfprobe_core.probes.advanced.json_probe import JsonProbe
+    from nerfprobe_core.probes.advanced.logic_probe import LogicProbe
+    from nerfprobe_core.probes.advanced.repetition_probe import RepetitionProbe
+    from nerfprobe_core.probes.advanced.routing_probe import RoutingProbe
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ConsistencyProbe": "nerfprobe_core.probes.advanced.consistency_probe",
+        "ConstraintProbe": "nerfprobe_core.probes.advanced.constraint_probe",
+        "ContextProbe": "nerfprobe_core.probes.advanced.context_probe",
+        "ChainOfThoughtProbe": "nerfprobe_core.probes.advanced.cot_probe",
+        "FingerprintProbe": "nerfprobe_core.probes.advanced.fingerprint_probe",
+        "JsonProbe": "nerfprobe_core.probes.advanced.json_probe",
+        "LogicProbe": "nerfprobe_core.probes.advanced.logic_probe",
+        "RepetitionProbe": "nerfprobe_core.probes.advanced.repetition_probe",
+        "RoutingProbe": "nerfprobe_core.probes.advanced.routing_probe",
+    },
+)
 
 __all__ = [
     "FingerprintProbe",
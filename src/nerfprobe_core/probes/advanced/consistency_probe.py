@@ -1,8 +1,10 @@
 import time
 
-from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType, copy_plain
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.core.gateway import LLMGateway
 from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol
+from nerfprobe_core.core.usage import extract_usage, sum_tokens
 from nerfprobe_core.probes.config import ConsistencyProbeConfig
 from nerfprobe_core.scorers.consistency_scorer import ConsistencyScorer
 
@@ -15,6 +17,7 @@ class ConsistencyProbe(ProbeProtocol):
 
     def __init__(self, config: ConsistencyProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = ConsistencyScorer(consistency_type=config.consistency_type, expect_match=config.expect_match)
 
     @property
@@ -27,7 +30,7 @@ class ConsistencyProbe(ProbeProtocol):
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         # Enforce Token Budget
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.HALLUCINATION,
@@ -76,10 +79,10 @@ class ConsistencyProbe(ProbeProtocol):
         passed = score == 1.0
 
         # Calculate usage
-        u1 = getattr(resp1, "usage", {})
-        u2 = getattr(resp2, "usage", {})
-        input_tokens = u1.get("prompt_tokens", 0) + u2.get("prompt_tokens", 0)
-        output_tokens = u1.get("completion_tokens", 0) + u2.get("completion_tokens", 0)
+        in1, out1 = extract_usage(resp1)
+        in2, out2 = extract_usage(resp2)
+        input_tokens = sum_tokens(in1, in2)
+        output_tokens = sum_tokens(out1, out2)
 
         failure_reason = None
         if not passed:
@@ -104,7 +107,7 @@ class ConsistencyProbe(ProbeProtocol):
             metric_scores={"similarity": metrics["similarity"]},
             metadata={
                 "research_ref": "[2504.04823]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "answer1": metrics["answer1"],
                 "answer2": metrics["answer2"],
             },
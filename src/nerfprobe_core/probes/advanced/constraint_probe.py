@@ -12,7 +12,10 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import ConstraintProbeConfig
 from nerfprobe_core.scorers.constraint import ConstraintScorer
 
@@ -25,11 +28,13 @@ class ConstraintProbe:
 
     def __init__(self, config: ConstraintProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = ConstraintScorer(
             constraint_type=config.type,
             min_words=config.min_words,
             max_words=config.max_words,
             forbidden_words=config.forbidden_words,
+            segmenter=config.segmentation,
         )
 
     @property
@@ -41,7 +46,7 @@ class ConstraintProbe:
         return CostEstimate(input_tokens=50, output_tokens=150)
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.CONSTRAINT,
@@ -86,9 +91,7 @@ class ConstraintProbe:
         passed = score == 1.0
 
         # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response_text)
 
         failure_reason = None
         if not passed:
@@ -112,7 +115,7 @@ class ConstraintProbe:
             },
             metadata={
                 "research_ref": "[2409.11055]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "violations": metrics.get("violations", []),
             },
         )
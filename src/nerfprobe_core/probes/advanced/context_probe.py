@@ -4,10 +4,16 @@ ContextProbe - KV Cache compression detection via depth-placed reasoning.
 Ref: [2512.12008] KV Cache Compression
 """
 
+import bisect
+import math
 import random
+import re
 import string
 import time
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 
 from nerfprobe_core.core import (
     CostEstimate,
@@ -15,8 +21,173 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    extract_usage,
+    sum_tokens,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
+from nerfprobe_core.core.tokens import fits_context_window, tokens_per_word
+from nerfprobe_core.models import get_model_info
 from nerfprobe_core.probes.config import ContextProbeConfig
+from nerfprobe_core.probes.seeding import probe_rng
+
+# Classic pangram filler (default, matches historical haystacks).
+FILLER_SENTENCES: tuple[str, ...] = (
+    "The quick brown fox jumps over the lazy dog.",
+    "Pack my box with five dozen liquor jugs.",
+    "How vexingly quick daft zebras jump.",
+)
+
+# Combinatorial filler parts for diversified haystacks (20 x 20 x 20 sentences).
+_FILLER_SUBJECTS: tuple[str, ...] = (
+    "The old lighthouse keeper",
+    "A quiet village baker",
+    "The museum curator",
+    "A travelling botanist",
+    "The harbour pilot",
+    "An apprentice clockmaker",
+    "The night librarian",
+    "A retired cartographer",
+    "The orchard farmer",
+    "A young violinist",
+    "The railway signalman",
+    "An amateur astronomer",
+    "The ferry captain",
+    "A careful archivist",
+    "The mountain guide",
+    "A patient beekeeper",
+    "The market fishmonger",
+    "An elderly weaver",
+    "The school caretaker",
+    "A wandering potter",
+)
+_FILLER_PREDICATES: tuple[str, ...] = (
+    "walked slowly along",
+    "sketched a picture of",
+    "wrote a long letter about",
+    "told a neighbour about",
+    "spent the morning near",
+    "repaired a fence beside",
+    "read an old book about",
+    "photographed",
+    "hummed a tune while passing",
+    "carefully measured",
+    "collected pebbles from",
+    "argued pleasantly about",
+    "planted tulips next to",
+    "painted a small sign for",
+    "forgot an umbrella at",
+    "counted the windows of",
+    "waited patiently beside",
+    "cleaned the path leading to",
+    "made careful notes about",
+    "rested for an hour near",
+)
+_FILLER_OBJECTS: tuple[str, ...] = (
+    "the windy northern cliffs",
+    "the crowded weekend market",
+    "a narrow cobbled street",
+    "the frozen mill pond",
+    "an abandoned stone chapel",
+    "the busy central station",
+    "a meadow full of clover",
+    "the sleepy fishing harbour",
+    "a bridge over the river",
+    "the municipal rose garden",
+    "an overgrown tennis court",
+    "the tall brick chimney",
+    "a small public library",
+    "the edge of the pine forest",
+    "an empty concert hall",
+    "the village green",
+    "a row of painted cottages",
+    "the foggy salt marsh",
+    "an old iron gate",
+    "the hill above the town",
+)
+
+
+# Matches "1: Yes", "2. no", "Q3) **Yes**" lines in multi-needle answers.
+_NUMBERED_ANSWER = re.compile(r"^\W*(?:Q(?:uestion)?\s*)?(\d+)\s*[:.)\-]\s*\W*(yes|no)\b", re.IGNORECASE | re.MULTILINE)
+
+
+class Haystack:
+    """
+    Filler text built once and reused across needle depths.
+
+    The text is a single string; sentence start offsets (in characters and
+    words) are kept in compact arrays so needles can be spliced in by offset
+    without materializing a list of words. Diverse mode samples sentences
+    from a seeded combinatorial pool so the filler is not a short period
+    that providers can trivially compress or cache.
+    """
+
+    def __init__(self, word_count: int, seed: int = 0, diverse: bool = False):
+        self.word_count = word_count
+        self.seed = seed
+        self.diverse = diverse
+
+        rng = random.Random(seed)
+        sentences: list[str] = []
+        # Offsets of each sentence start; a final entry marks the end of text.
+        self._char_offsets = array("L", [0])
+        self._word_offsets = array("L", [0])
+
+        chars = 0
+        words = 0
+        i = 0
+        while words < word_count:
+            sentence = self._sentence(rng, i)
+            n_words = sentence.count(" ") + 1
+            if words + n_words > word_count:
+                n_words = word_count - words
+                sentence = " ".join(sentence.split(" ")[:n_words])
+            sentence += " "
+            sentences.append(sentence)
+            chars += len(sentence)
+            words += n_words
+            self._char_offsets.append(chars)
+            self._word_offsets.append(words)
+            i += 1
+
+        self.text = "".join(sentences)
+
+    def _sentence(self, rng: random.Random, i: int) -> str:
+        if not self.diverse:
+            return FILLER_SENTENCES[i % len(FILLER_SENTENCES)]
+        return f"{rng.choice(_FILLER_SUBJECTS)} {rng.choice(_FILLER_PREDICATES)} {rng.choice(_FILLER_OBJECTS)}."
+
+    def offset_at(self, word_index: int) -> int:
+        """Character offset of the sentence boundary at or after a word index."""
+        idx = bisect.bisect_left(self._word_offsets, word_index)
+        return self._char_offsets[min(idx, len(self._char_offsets) - 1)]
+
+    def render(
+        self,
+        needles: Sequence[tuple[float, str]],
+        prefix: str = "",
+        suffix: str = "",
+        word_count: int | None = None,
+    ) -> str:
+        """
+        Build a prompt with needles spliced in at fractional depths.
+
+        Args:
+            needles: (depth, text) pairs; depth is a fraction of the context.
+            prefix: Text placed before the context.
+            suffix: Text placed after the context.
+            word_count: Use only the first N words of the buffer (sentence granular).
+        """
+        words = self.word_count if word_count is None else min(word_count, self.word_count)
+        end = self.offset_at(words)
+
+        pieces = [prefix]
+        prev = 0
+        for depth, needle in sorted(needles):
+            offset = min(self.offset_at(int(words * depth)), end)
+            pieces += [self.text[prev:offset], needle, " "]
+            prev = offset
+        pieces += [self.text[prev:end].rstrip(), suffix]
+        return "".join(pieces)
 
 
 @dataclass
@@ -99,6 +270,7 @@ class ContextProbe:
     def __init__(self, config: ContextProbeConfig):
         self._config = config
         self._scorer = ContextScorer()
+        self._haystack: Haystack | None = None
 
     @property
     def config(self) -> ContextProbeConfig:
@@ -106,38 +278,228 @@ class ContextProbe:
 
     @property
     def estimated_cost(self) -> CostEstimate:
-        input_tokens = len(self._config.needle_depths) * self._config.context_length
+        requests = 1 if self._config.multi_needle else len(self._config.needle_depths)
+        input_tokens = requests * self._haystack_tokens(self._config.context_length)
         output_tokens = len(self._config.needle_depths) * 10
         return CostEstimate(input_tokens=input_tokens, output_tokens=output_tokens)
 
-    def _generate_haystack(self, length: int) -> list[str]:
-        """Generate filler text tokens."""
-        filler = (
-            "The quick brown fox jumps over the lazy dog. "
-            "Pack my box with five dozen liquor jugs. "
-            "How vexingly quick daft zebras jump. "
-        ) * 100
-        words = filler.split()
-        while len(words) < length:
-            words += words
-        return words[:length]
-
-    def _create_needle(self) -> ReasoningNeedle:
+    def _filler_tokens_per_word(self, model_name: str | None = None) -> float:
+        """Approximate tokens per filler word (lengths are configured in words)."""
+        if self._config.diverse_filler:
+            sample = " ".join(
+                f"{s} {p} {o}." for s, p, o in zip(_FILLER_SUBJECTS, _FILLER_PREDICATES, _FILLER_OBJECTS, strict=True)
+            )
+        else:
+            sample = " ".join(FILLER_SENTENCES)
+        return tokens_per_word(sample, model_name)
+
+    def _haystack_tokens(self, words: int, model_name: str | None = None) -> int:
+        return math.ceil(words * self._filler_tokens_per_word(model_name))
+
+    def _filler_seed(self, run_seed: int) -> int:
+        """Seed of the diverse filler (pangram filler does not depend on it)."""
+        if not self._config.diverse_filler:
+            return 0
+        return run_seed if self._config.filler_seed is None else self._config.filler_seed
+
+    def _generate_haystack(self, length: int, seed: int) -> Haystack:
+        """Return the filler buffer, building it only when the shape changes."""
+        hs = self._haystack
+        if hs is None or hs.word_count != length or hs.seed != seed or hs.diverse != self._config.diverse_filler:
+            hs = Haystack(length, seed=seed, diverse=self._config.diverse_filler)
+            self._haystack = hs
+        return hs
+
+    def _create_needle(self, rng: random.Random, negated: bool = False) -> ReasoningNeedle:
         """Create a unique reasoning task to prevent training data contamination."""
-        obj = "".join(random.choices(string.ascii_uppercase, k=3))
-        prop = "".join(random.choices(string.ascii_lowercase, k=4))
+        obj = "".join(rng.choices(string.ascii_uppercase, k=3))
+        prop = "".join(rng.choices(string.ascii_lowercase, k=4))
 
         return ReasoningNeedle(
             premise_1=f"Ref-X{obj} is composed of {prop}.",
-            premise_2=f"Materials composed of {prop} are magnetic.",
+            premise_2=f"Materials composed of {prop} are {'not ' if negated else ''}magnetic.",
             question=f"Is Ref-X{obj} magnetic? Answer Yes or No.",
-            expected_answer="Yes",
+            expected_answer="No" if negated else "Yes",
         )
 
-    async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+    def _create_distinct_needles(self, rng: random.Random, count: int) -> list[ReasoningNeedle]:
+        """Create needles with unique objects/properties and mixed Yes/No answers."""
+        needles: list[ReasoningNeedle] = []
+        seen: set[str] = set()
+        while len(needles) < count:
+            needle = self._create_needle(rng, negated=rng.random() < 0.5)
+            if needle.premise_1 in seen:
+                continue
+            seen.add(needle.premise_1)
+            needles.append(needle)
+        return needles
+
+    @staticmethod
+    def _parse_numbered_answers(response: str) -> dict[int, str]:
+        """Parse '1: Yes' style lines into {1: 'yes'}."""
+        return {int(num): ans.lower() for num, ans in _NUMBERED_ANSWER.findall(response)}
+
+    async def _run_per_depth(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        haystack: Haystack,
+        rng: random.Random,
+        word_count: int | None = None,
+    ) -> tuple[dict[float, bool], int | None, int | None]:
+        """One request per depth (original protocol)."""
+        results: dict[float, bool] = {}
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
+
+        for depth in self._config.needle_depths:
+            needle = self._create_needle(rng)
+            prompt = haystack.render(
+                [(depth, f"{needle.premise_1} {needle.premise_2}")],
+                prefix="Context:\n",
+                suffix=f"\n\nQuestion: {needle.question}\nAnswer:",
+                word_count=word_count,
+            )
+
+            try:
+                response = await generator.generate(target, prompt)
+
+                # Accumulate usage
+                in_tok, out_tok = extract_usage(response)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
+
+                passed = needle.expected_answer.lower() in response.lower()
+                results[depth] = passed
+            except Exception:
+                results[depth] = False
+
+        return results, total_input_tokens, total_output_tokens
+
+    async def _run_multi_needle(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        haystack: Haystack,
+        rng: random.Random,
+        word_count: int | None = None,
+    ) -> tuple[dict[float, bool], int | None, int | None]:
+        """All needles in one context, all questions asked together."""
+        depths = self._config.needle_depths
+        needles = self._create_distinct_needles(rng, len(depths))
+
+        questions = "\n".join(f"{i}. {n.question.removesuffix(' Answer Yes or No.')}" for i, n in enumerate(needles, 1))
+        prompt = haystack.render(
+            [(d, f"{n.premise_1} {n.premise_2}") for d, n in zip(depths, needles, strict=True)],
+            prefix="Context:\n",
+            suffix=(
+                f"\n\nQuestions:\n{questions}\n\n"
+                "Answer every question with Yes or No, one per line, "
+                'in the format "<number>: <Yes|No>".\nAnswers:'
+            ),
+            word_count=word_count,
+        )
+
+        try:
+            response = await generator.generate(target, prompt)
+        except Exception:
+            return dict.fromkeys(depths, False), 0, 0
+
+        input_tokens, output_tokens = extract_usage(response)
+        answers = self._parse_numbered_answers(response)
+        results = {
+            depth: answers.get(i) == needle.expected_answer.lower()
+            for i, (depth, needle) in enumerate(zip(depths, needles, strict=True), 1)
+        }
+        return results, input_tokens, output_tokens
+
+    async def _run_trial(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        haystack: Haystack,
+        rng: random.Random,
+        word_count: int | None = None,
+    ) -> tuple[dict[float, bool], int | None, int | None]:
+        if self._config.multi_needle:
+            return await self._run_multi_needle(target, generator, haystack, rng, word_count)
+        return await self._run_per_depth(target, generator, haystack, rng, word_count)
+
+    def _search_upper_bound(self, target: ModelTarget) -> int:
+        """
+        Largest context (in words) to try: the model's registered window, else
+        context_length, capped by search_max_length.
+        """
+        info = get_model_info(target.model_name)
+        if info is None or not info.context_window:
+            upper = self._config.context_length
+        else:
+            # Leave headroom for the question block and tokenizer variance.
+            words = info.context_window / self._filler_tokens_per_word(target.model_name)
+            upper = max(self._config.search_min_length, int(words * 0.95))
+        if self._config.search_max_length is not None:
+            upper = min(upper, self._config.search_max_length)
+        return upper
+
+    def _search_lengths(self, upper: int) -> list[int]:
+        """
+        Context lengths probed by the most expensive search up to `upper`.
+
+        The upper bound and the minimum are tried first; after that, every
+        step passing moves each midpoint as high as it can go.
+        """
+        lo = min(self._config.search_min_length, upper)
+        lengths = [upper] if lo >= upper else [upper, lo]
+        hi = upper
+        while lo < hi and (hi - lo) > self._config.search_resolution * upper:
+            lo = (lo + hi) // 2
+            lengths.append(lo)
+        return lengths
+
+    def _search_cost(self, upper: int, model_name: str | None = None) -> CostEstimate:
+        """Worst-case cost of a bisection search up to `upper` words, each step priced at its own length."""
+        requests = self._config.search_trials * (1 if self._config.multi_needle else len(self._config.needle_depths))
+        lengths = self._search_lengths(upper)
+        return CostEstimate(
+            input_tokens=requests * sum(self._haystack_tokens(n, model_name) for n in lengths),
+            output_tokens=requests * len(lengths) * 10 * len(self._config.needle_depths),
+        )
+
+    def _fit_search_budget(self, upper: int, model_name: str | None = None) -> int:
+        """Largest upper bound <= `upper` whose worst-case search fits search_max_tokens (0 if none does)."""
+        budget = self._config.search_max_tokens
+
+        def fits(n: int) -> bool:
+            return self._search_cost(n, model_name).total_tokens <= budget
+
+        if fits(upper):
+            return upper
+        lo, hi = self._config.search_min_length, upper
+        if lo >= hi or not fits(lo):
+            return 0
+        # Cost grows with the upper bound: bisect for the largest one that fits
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    async def _run_search(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        """
+        Bisect the context length on needle success to find the effective context.
+
+        The haystack is built once at the upper bound; each step renders a prefix.
+        A length succeeds if the majority of `search_trials` trials pass. The
+        upper bound is lowered until the worst-case search fits search_max_tokens.
+        """
         start = time.perf_counter()
+        window_upper = self._search_upper_bound(target)
+        upper = self._fit_search_budget(window_upper, target.model_name)
 
-        if self.estimated_cost.total_tokens > self._config.max_tokens_per_run:
+        if not upper:
+            cost = self._search_cost(min(self._config.search_min_length, window_upper), target.model_name)
             return ProbeResult(
                 probe_name=self._config.name,
                 probe_type=ProbeType.CONTEXT,
@@ -148,45 +510,118 @@ class ContextProbe:
                 raw_response="SKIPPED: Cost Exceeds Budget",
                 metadata={
                     "status": "SKIPPED",
-                    "cost": self.estimated_cost.total_tokens,
+                    "cost": cost.total_tokens,
+                    "search_max_tokens": self._config.search_max_tokens,
                 },
             )
 
-        filler_tokens = self._generate_haystack(self._config.context_length)
-        total_tokens = len(filler_tokens)
+        seed, rng = probe_rng(self._config.seed)
+        filler_seed = self._filler_seed(seed)
+        haystack = self._generate_haystack(upper, filler_seed)
+        calls = 0
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
+        trace: list[dict[str, Any]] = []
+
+        async def succeeds(length: int) -> bool:
+            nonlocal calls, total_input_tokens, total_output_tokens
+            wins = 0
+            for _ in range(self._config.search_trials):
+                results, in_tok, out_tok = await self._run_trial(target, generator, haystack, rng, length)
+                calls += 1 if self._config.multi_needle else len(results)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
+                wins += self._scorer.score(results).passed
+            ok = wins * 2 > self._config.search_trials
+            trace.append({"words": length, "passed": ok, "wins": wins})
+            return ok
+
+        lo = min(self._config.search_min_length, upper)
+        hi = upper
+        if await succeeds(hi):
+            effective = hi
+        elif lo >= hi or not await succeeds(lo):
+            effective = 0
+        else:
+            # Invariant: lo passes, hi fails.
+            while (hi - lo) > self._config.search_resolution * upper:
+                mid = (lo + hi) // 2
+                if await succeeds(mid):
+                    lo = mid
+                else:
+                    hi = mid
+            effective = lo
 
-        results: dict[float, bool] = {}
-        total_input_tokens = 0
-        total_output_tokens = 0
-
-        for depth in self._config.needle_depths:
-            needle = self._create_needle()
-
-            # Insert needle at depth
-            insert_idx = int(total_tokens * depth)
+        latency_ms = (time.perf_counter() - start) * 1000
+        required = min(self._config.context_length, upper)
+        passed = effective >= required
 
-            context_tokens = (
-                filler_tokens[:insert_idx] + [needle.premise_1, needle.premise_2] + filler_tokens[insert_idx:]
-            )
+        return ProbeResult(
+            probe_name=self._config.name,
+            probe_type=ProbeType.CONTEXT,
+            target=target,
+            score=effective / upper if upper else 0.0,
+            passed=passed,
+            latency_ms=latency_ms,
+            raw_response="ContextProbe Search Execution",
+            input_tokens=total_input_tokens,
+            output_tokens=total_output_tokens,
+            error_reason=None if passed else f"Effective context {effective} < {required} words",
+            metric_scores={
+                "effective_context_words": float(effective),
+                "max_context_words": float(upper),
+                "window_context_words": float(window_upper),
+                "calls_used": float(calls),
+                "search_steps": float(len(trace)),
+            },
+            metadata={
+                "research_ref": "[2512.12008]",
+                "mode": "search",
+                "seed": seed,
+                "filler_seed": filler_seed,
+                "search_trace": trace,
+                "trials_per_step": self._config.search_trials,
+            },
+        )
 
-            prompt = f"""Context:
-{" ".join(context_tokens)}
+    async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if self._config.search_effective_length:
+            return await self._run_search(target, generator)
 
-Question: {needle.question}
-Answer:"""
+        start = time.perf_counter()
 
-            try:
-                response = await generator.generate(target, prompt)
+        if exceeds_budget(self, target):
+            return ProbeResult(
+                probe_name=self._config.name,
+                probe_type=ProbeType.CONTEXT,
+                target=target,
+                score=0.0,
+                passed=False,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Cost Exceeds Budget",
+                metadata={
+                    "status": "SKIPPED",
+                    "cost": self.estimated_cost.total_tokens,
+                },
+            )
 
-                # Accumulate usage
-                usage = getattr(response, "usage", {})
-                total_input_tokens += usage.get("prompt_tokens", 0)
-                total_output_tokens += usage.get("completion_tokens", 0)
+        prompt_tokens = self._haystack_tokens(self._config.context_length, target.model_name)
+        if not fits_context_window(prompt_tokens, target.model_name, reserve_tokens=100):
+            return ProbeResult(
+                probe_name=self._config.name,
+                probe_type=ProbeType.CONTEXT,
+                target=target,
+                score=0.0,
+                passed=False,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Exceeds context window",
+                metadata={"status": "SKIPPED", "prompt_tokens": prompt_tokens},
+            )
 
-                passed = needle.expected_answer.lower() in response.lower()
-                results[depth] = passed
-            except Exception:
-                results[depth] = False
+        seed, rng = probe_rng(self._config.seed)
+        filler_seed = self._filler_seed(seed)
+        haystack = self._generate_haystack(self._config.context_length, filler_seed)
+        results, total_input_tokens, total_output_tokens = await self._run_trial(target, generator, haystack, rng)
 
         latency_ms = (time.perf_counter() - start) * 1000
         score = self._scorer.score(results)
@@ -205,6 +640,9 @@ Answer:"""
             metric_scores={f"depth_{k}": 1.0 if v else 0.0 for k, v in results.items()},
             metadata={
                 "research_ref": "[2512.12008]",
+                "mode": "multi_needle" if self._config.multi_needle else "per_depth",
+                "seed": seed,
+                "filler_seed": filler_seed,
                 "depth_results": score.depth_results,
                 "middle_failure": score.middle_failure,
                 "reason": score.reason,
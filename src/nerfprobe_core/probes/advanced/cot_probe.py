@@ -12,7 +12,10 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import ChainOfThoughtProbeConfig
 from nerfprobe_core.scorers.cot import ChainOfThoughtScorer
 
@@ -25,6 +28,7 @@ class ChainOfThoughtProbe:
 
     def __init__(self, config: ChainOfThoughtProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = ChainOfThoughtScorer(
             min_steps=config.min_steps,
             detect_circular=config.detect_circular,
@@ -39,7 +43,7 @@ class ChainOfThoughtProbe:
         return CostEstimate(input_tokens=100, output_tokens=400)
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.REASONING,
@@ -84,9 +88,7 @@ class ChainOfThoughtProbe:
         passed = score == 1.0
 
         # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response_text)
 
         failure_reason = None
         if not passed:
@@ -114,7 +116,7 @@ class ChainOfThoughtProbe:
             },
             metadata={
                 "research_ref": "[2504.04823]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "steps_extracted": metrics.get("steps_extracted", []),
             },
         )
@@ -13,7 +13,10 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    extract_usage,
+    sum_tokens,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import FingerprintProbeConfig
 
 
@@ -110,7 +113,7 @@ class FingerprintProbe:
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         start = time.perf_counter()
 
-        if self.estimated_cost.total_tokens > self._config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self._config.name,
                 probe_type=ProbeType.FINGERPRINT,
@@ -126,15 +129,15 @@ class FingerprintProbe:
             )
 
         malformed_responses: list[str] = []
-        total_input_tokens = 0
-        total_output_tokens = 0
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
 
         for query in self._config.malformed_queries:
             try:
                 res = await generator.generate(target, query)
-                u = getattr(res, "usage", {})
-                total_input_tokens += u.get("prompt_tokens", 0)
-                total_output_tokens += u.get("completion_tokens", 0)
+                in_tok, out_tok = extract_usage(res)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
                 malformed_responses.append(res)
             except Exception as e:
                 # Gateway crash is also a fingerprint
@@ -144,9 +147,9 @@ class FingerprintProbe:
         for prompt in self._config.banner_prompts:
             try:
                 res = await generator.generate(target, prompt)
-                u = getattr(res, "usage", {})
-                total_input_tokens += u.get("prompt_tokens", 0)
-                total_output_tokens += u.get("completion_tokens", 0)
+                in_tok, out_tok = extract_usage(res)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
                 banner_responses.append(res)
             except Exception as e:
                 banner_responses.append(f"ERROR: {e!s}")
@@ -1,8 +1,9 @@
 import time
 
-from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType, copy_plain
 from nerfprobe_core.core.gateway import LLMGateway
 from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol
+from nerfprobe_core.core.usage import extract_usage
 from nerfprobe_core.probes.config import JsonProbeConfig
 from nerfprobe_core.scorers.json_scorer import JsonScorer
 
@@ -15,6 +16,7 @@ class JsonProbe(ProbeProtocol):
 
     def __init__(self, config: JsonProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = JsonScorer(schema=config.schema_definition, strict=config.strict)
 
     @property
@@ -64,9 +66,7 @@ class JsonProbe(ProbeProtocol):
         passed = score == 1.0
 
         # Extract usage
-        usage = getattr(response, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response)
 
         failure_reason = None
         if not passed:
@@ -91,7 +91,7 @@ class JsonProbe(ProbeProtocol):
                 "research_ref": "[2402.16775]",
                 "strict_mode": self.config.strict,
                 "extraction_used": metric_scores.get("extraction_used", 0.0) == 1.0,
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "scorer_details": scorer_metadata,
             },
         )
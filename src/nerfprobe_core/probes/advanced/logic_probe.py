@@ -12,8 +12,12 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget, expected_cost
 from nerfprobe_core.probes.config import LogicPuzzleProbeConfig
+from nerfprobe_core.probes.dataset import run_dataset
 from nerfprobe_core.scorers.logic import LogicScorer
 
 
@@ -25,6 +29,7 @@ class LogicProbe:
 
     def __init__(self, config: LogicPuzzleProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = LogicScorer(
             expected_answer=config.expected_answer,
             required_reasoning=config.required_reasoning,
@@ -38,8 +43,25 @@ class LogicProbe:
     def estimated_cost(self) -> CostEstimate:
         return CostEstimate(input_tokens=150, output_tokens=300)
 
+    @staticmethod
+    def _score_item(response: str, expected: str) -> bool:
+        """Score one dataset item."""
+        return LogicScorer(expected_answer=expected).score(response) == 1.0
+
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if self.config.dataset is not None:
+            return await run_dataset(
+                self.config,
+                self.config.dataset,
+                target,
+                generator,
+                ProbeType.REASONING,
+                self._score_item,
+                "[2504.04823]",
+                item_cost=expected_cost(self, target),
+            )
+
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.REASONING,
@@ -84,9 +106,7 @@ class LogicProbe:
         passed = score == 1.0
 
         # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response_text)
 
         failure_reason = None
         if not passed:
@@ -113,7 +133,7 @@ class LogicProbe:
             },
             metadata={
                 "research_ref": "[2504.04823]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "missing_steps": metrics.get("missing_steps", []),
                 "has_answer": metrics.get("has_answer", False),
             },
@@ -4,6 +4,7 @@ RepetitionProbe - Phrase looping detection via N-gram analysis.
 Ref: [2403.06408] Perturbation Lens
 """
 
+import asyncio
 import time
 
 from nerfprobe_core.core import (
@@ -12,8 +13,11 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
-from nerfprobe_core.probes.config import RepetitionProbeConfig
+from nerfprobe_core.probes.config import DiversityThresholds, RepetitionProbeConfig
+from nerfprobe_core.scorers.diversity import HIGHER_IS_BETTER, meets_threshold
 from nerfprobe_core.scorers.repetition import RepetitionScorer
 
 
@@ -24,11 +28,20 @@ class RepetitionProbe:
     """
 
     def __init__(self, config: RepetitionProbeConfig):
+        metric = config.diversity_metric
+        if metric is not None and metric not in DiversityThresholds.model_fields:
+            raise ValueError(
+                f"Unknown diversity_metric {metric!r}; expected one of {sorted(DiversityThresholds.model_fields)}"
+            )
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = RepetitionScorer(
             ngram_size=config.ngram_size,
             max_repeats=config.max_repeats,
             sliding_window_size=config.sliding_window_size,
+            segmenter=config.segmentation,
+            min_loop_chars=config.min_loop_chars,
+            max_loop_coverage=config.max_loop_coverage,
         )
 
     @property
@@ -68,15 +81,28 @@ class RepetitionProbe:
                 metadata={"error": str(e)},
             )
 
-        metrics = self._scorer.metrics(response_text)
+        # Loop detection is CPU-bound (~0.1 s per 50k characters); keep it off the event loop
+        metrics = await asyncio.to_thread(self._scorer.metrics, response_text)
 
         # Pass conditions:
         # 1. No excessive loops (max_repeats <= config.max_repeats)
         # 2. Local TTR above threshold (min_local_ttr >= config.min_ngram_ttr)
+        # 3. Optional: character-level loops cover at most config.max_loop_coverage
+        # 4. Optional diversity metric within its threshold
         min_local_ttr = metrics.get("min_local_ttr", 1.0)
         max_repeats = int(metrics.get("max_repeats", 0))
-
-        passed = (max_repeats <= self.config.max_repeats) and (min_local_ttr >= self.config.min_ngram_ttr)
+        loop_coverage = metrics.get("loop_coverage", 0.0)
+        max_coverage = self.config.max_loop_coverage
+        looping = max_coverage is not None and loop_coverage > max_coverage
+        metric = self.config.diversity_metric
+        diverse = metric is None or meets_threshold(metric, metrics[metric], getattr(self.config.diversity, metric))
+
+        passed = (
+            (max_repeats <= self.config.max_repeats)
+            and (min_local_ttr >= self.config.min_ngram_ttr)
+            and not looping
+            and diverse
+        )
         score = 1.0 if passed else 0.0
 
         # Extract numeric metrics for metric_scores
@@ -87,9 +113,7 @@ class RepetitionProbe:
         scorer_meta = metrics.get("_metadata", {})
 
         # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response_text)
 
         failure_reason = None
         if not passed:
@@ -97,6 +121,11 @@ class RepetitionProbe:
                 failure_reason = f"Repeats {max_repeats} > {self.config.max_repeats}"
             elif min_local_ttr < self.config.min_ngram_ttr:
                 failure_reason = f"Low TTR {min_local_ttr:.2f}"
+            elif looping:
+                failure_reason = f"Loop coverage {loop_coverage:.2f} > {max_coverage}"
+            elif metric is not None and not diverse:
+                bound = "Min" if HIGHER_IS_BETTER[metric] else "Max"
+                failure_reason = f"{metric}: {metrics[metric]:.2f} ({bound} {getattr(self.config.diversity, metric)})"
             else:
                 failure_reason = "Repetition check failed"
 
@@ -114,7 +143,7 @@ class RepetitionProbe:
             metric_scores=metric_scores,
             metadata={
                 "research_ref": "[2403.06408]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "scorer_details": scorer_meta,
                 **extra_meta,
             },
@@ -5,7 +5,9 @@ Ref: [2406.18665] RouteLLM
 """
 
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from nerfprobe_core.core import (
     CostEstimate,
@@ -13,7 +15,10 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    extract_usage,
+    sum_tokens,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import RoutingProbeConfig
 
 
@@ -75,6 +80,8 @@ class RoutingProbe:
     Large performance gaps suggest cheaper/weaker models for complex queries.
     """
 
+    probe_type = ProbeType.ROUTING
+
     def __init__(self, config: RoutingProbeConfig):
         self._config = config
         self._scorer = RoutingScorer()
@@ -91,7 +98,7 @@ class RoutingProbe:
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         start = time.perf_counter()
 
-        if self.estimated_cost.total_tokens > self._config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self._config.name,
                 probe_type=ProbeType.ROUTING,
@@ -106,42 +113,87 @@ class RoutingProbe:
                 },
             )
 
-        # Run Easy Tasks
-        easy_results: list[bool] = []
-        total_input_tokens = 0
-        total_output_tokens = 0
-
-        for prompt in self._config.easy_prompts:
-            try:
-                response = await generator.generate(target, prompt)
-
-                u = getattr(response, "usage", {})
-                total_input_tokens += u.get("prompt_tokens", 0)
-                total_output_tokens += u.get("completion_tokens", 0)
-
-                is_correct = self._evaluate_easy(prompt, response)
-                easy_results.append(is_correct)
-            except Exception:
-                easy_results.append(False)
-
-        # Run Hard Tasks
-        hard_results: list[bool] = []
-        for prompt in self._config.hard_prompts:
+        easy_results, total_input_tokens, total_output_tokens = await self._run_prompts(
+            target, generator, self._config.easy_prompts, self._evaluate_easy
+        )
+        return await self._finish(target, generator, start, easy_results, total_input_tokens, total_output_tokens)
+
+    def fusable_prompts(self) -> list[str]:
+        """The easy prompts; the hard ones always run on their own."""
+        return list(self._config.easy_prompts)
+
+    async def score_fused(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        answers: list[str],
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> ProbeResult:
+        """Score the fused easy answers, then run the hard prompts directly."""
+        start = time.perf_counter() - latency_ms / 1000
+        easy_results = [
+            self._evaluate_easy(prompt, answer)
+            for prompt, answer in zip(self._config.easy_prompts, answers, strict=True)
+        ]
+        return await self._finish(target, generator, start, easy_results, input_tokens, output_tokens, fused=True)
+
+    async def _run_prompts(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        prompts: list[str],
+        evaluate: Callable[[str, str], bool],
+    ) -> tuple[list[bool], int | None, int | None]:
+        """One request per prompt; returns (results, input_tokens, output_tokens)."""
+        results: list[bool] = []
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
+
+        for prompt in prompts:
             try:
                 response = await generator.generate(target, prompt)
 
-                u = getattr(response, "usage", {})
-                total_input_tokens += u.get("prompt_tokens", 0)
-                total_output_tokens += u.get("completion_tokens", 0)
+                in_tok, out_tok = extract_usage(response)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
 
-                is_correct = self._evaluate_hard(prompt, response)
-                hard_results.append(is_correct)
+                results.append(evaluate(prompt, response))
             except Exception:
-                hard_results.append(False)
+                results.append(False)
+
+        return results, total_input_tokens, total_output_tokens
+
+    async def _finish(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        start: float,
+        easy_results: list[bool],
+        input_tokens: int | None,
+        output_tokens: int | None,
+        fused: bool = False,
+    ) -> ProbeResult:
+        """Run the hard tasks and score the gap (easy results may come from a fused request)."""
+        hard_results, hard_input, hard_output = await self._run_prompts(
+            target, generator, self._config.hard_prompts, self._evaluate_hard
+        )
+        total_input_tokens = sum_tokens(input_tokens, hard_input)
+        total_output_tokens = sum_tokens(output_tokens, hard_output)
 
         latency_ms = (time.perf_counter() - start) * 1000
         score = self._scorer.score(easy_results, hard_results, self._config.baseline_gap_threshold)
 
+        metadata: dict[str, Any] = {
+            "research_ref": "[2406.18665]",
+            "reason": score.reason,
+            "easy_results": easy_results,
+            "hard_results": hard_results,
+        }
+        if fused:
+            metadata["fused"] = True
+
         return ProbeResult(
             probe_name=self._config.name,
             probe_type=ProbeType.ROUTING,
@@ -158,12 +210,7 @@ class RoutingProbe:
                 "hard_accuracy": score.hard_accuracy,
                 "complexity_gap": score.complexity_gap,
             },
-            metadata={
-                "research_ref": "[2406.18665]",
-                "reason": score.reason,
-                "easy_results": easy_results,
-                "hard_results": hard_results,
-            },
+            metadata=metadata,
         )
 
     def _evaluate_easy(self, prompt: str, response: str) -> bool:
@@ -3,15 +3,52 @@
 from datetime import date
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializeAsAny
 
 
 class BaseProbeConfig(BaseModel):
-    """Base configuration for all probes."""
+    """
+    Base configuration for all probes.
+
+    A probe dumps its config once when constructed and reports that dump in
+    every result, so treat a config as fixed once it is handed to a probe:
+    for another setup, build a new probe from config.model_copy(update=...).
+    """
 
     name: str
     description: str = ""
     max_tokens_per_run: int = 1000  # Token budget for cost control
+    seed: int | None = None  # Seed for randomized prompt material (None = fresh seed per run)
+
+
+class DatasetConfig(BaseModel):
+    """
+    Local JSONL/CSV dataset for accuracy runs (e.g. GSM8K).
+    Items are streamed by offset; only the sampled rows are parsed.
+    CSV files must hold one record per line.
+    """
+
+    path: str
+    format: str | None = None  # "jsonl" or "csv"; inferred from the extension if None
+    prompt_field: str = "question"
+    answer_field: str = "answer"
+    prompt_template: str = "{prompt}"
+    sample_size: int | None = None  # None = every item
+    stratify_field: str | None = None  # Proportional stratified sampling by this field
+    concurrency: int = 8
+    confidence: float = 0.95  # Confidence level for the accuracy interval
+    min_accuracy: float = 0.8  # Fails only if the interval lies entirely below this
+    # Token budget for the whole run (None = the probe's max_tokens_per_run per item; 0 = no limit)
+    max_tokens: int | None = None
+
+
+class DiversityThresholds(BaseModel):
+    """Pass thresholds for the lexical diversity metrics (see scorers.diversity)."""
+
+    mtld: float = 40.0  # Minimum
+    hdd: float = 0.7  # Minimum
+    yules_k: float = 300.0  # Maximum
+    compression_ratio: float = 3.0  # Maximum
 
 
 # =============================================================================
@@ -27,6 +64,7 @@ class MathProbeConfig(BaseProbeConfig):
 
     prompt: str
     expected_answer: str
+    dataset: DatasetConfig | None = None  # When set, prompt/expected_answer are ignored
 
 
 class StyleProbeConfig(BaseProbeConfig):
@@ -39,6 +77,11 @@ class StyleProbeConfig(BaseProbeConfig):
     sliding_window_size: int = 50
     prompt_template: str = "Write a creative short story about {topic}. Length: 200 words."
     topic: str = "a robot who loves gardening"
+    segmentation: str = "script"  # "script" (CJK-aware), "chars" or "whitespace"
+    # Pass criterion: "min_local_ttr" or "ttr" (against min_ttr), or "mtld", "hdd",
+    # "yules_k" or "compression_ratio" (against the matching diversity threshold)
+    pass_metric: str = "min_local_ttr"
+    diversity: DiversityThresholds = Field(default_factory=DiversityThresholds)
 
 
 class TimingProbeConfig(BaseProbeConfig):
@@ -59,6 +102,7 @@ class CodeProbeConfig(BaseProbeConfig):
 
     prompt: str = "Write a Python function to solve FizzBuzz. Return ONLY the code in a markdown block."
     language: str = "python"
+    dataset: DatasetConfig | None = None  # Items need only a prompt field
 
 
 # =============================================================================
@@ -99,7 +143,22 @@ class ContextProbeConfig(BaseProbeConfig):
     description: str = "Detects logic failure due to KV cache compression at depth."
     context_length: int = 4000
     needle_depths: list[float] = Field(default_factory=lambda: [0.1, 0.5, 0.9])
-    max_tokens_per_run: int = 15000
+    diverse_filler: bool = False  # Sample varied filler sentences instead of repeating pangrams
+    # Seed for the diverse filler. A fixed value keeps one haystack that is reused across
+    # runs; None derives it from the run's resolved `seed` (a new filler variant per run)
+    filler_seed: int | None = 0
+    multi_needle: bool = False  # Embed all depths in one prompt and ask all questions at once
+    # Effective-context search: bisect length (in words) up to ModelInfo.context_window
+    search_effective_length: bool = False
+    search_min_length: int = 1000
+    search_trials: int = 1  # Repeats per step; a step passes on majority
+    search_resolution: float = 0.05  # Stop when the bracket is within this fraction of the max
+    search_max_length: int | None = None  # Cap on the search upper bound in words (None = model window)
+    # Worst-case token budget for a whole search (replaces max_tokens_per_run in search mode);
+    # the upper bound is lowered until the search fits
+    search_max_tokens: int = 500_000
+    # Fits the default 3 x 4000-word run with either filler (diverse filler costs ~16k tokens)
+    max_tokens_per_run: int = 20000
 
 
 class RoutingProbeConfig(BaseProbeConfig):
@@ -128,7 +187,8 @@ class RoutingProbeConfig(BaseProbeConfig):
 
 class RepetitionProbeConfig(BaseProbeConfig):
     """
-    Phrase looping detection via n-gram analysis.
+    Phrase looping detection via n-gram analysis and character-level
+    repeat detection.
     Ref: [2403.06408] Perturbation Lens.
     """
 
@@ -137,6 +197,13 @@ class RepetitionProbeConfig(BaseProbeConfig):
     max_repeats: int = 2
     min_ngram_ttr: float = 0.55
     sliding_window_size: int = 50
+    segmentation: str = "script"  # "script" (CJK-aware), "chars" or "whitespace"
+    min_loop_chars: int = 40  # Shortest character-level repeat counted as a loop
+    # Extra pass criterion: max share of the output inside such repeats, e.g. 0.3 (None = off)
+    max_loop_coverage: float | None = None
+    # Extra pass criterion: "mtld", "hdd", "yules_k" or "compression_ratio" (None = off)
+    diversity_metric: str | None = None
+    diversity: DiversityThresholds = Field(default_factory=DiversityThresholds)
 
 
 class ConstraintProbeConfig(BaseProbeConfig):
@@ -150,6 +217,7 @@ class ConstraintProbeConfig(BaseProbeConfig):
     min_words: int | None = None
     max_words: int | None = None
     forbidden_words: list[str] = Field(default_factory=list)
+    segmentation: str = "chars"  # Word counting: "chars" (one per CJK character), "script" or "whitespace"
 
 
 class LogicPuzzleProbeConfig(BaseProbeConfig):
@@ -165,6 +233,7 @@ class LogicPuzzleProbeConfig(BaseProbeConfig):
     )
     expected_answer: str = "72"
     required_reasoning: list[str] = Field(default_factory=lambda: ["48 / 2 = 24", "48 + 24"])
+    dataset: DatasetConfig | None = None  # Scores final answers only; required_reasoning is not applied
 
 
 class ChainOfThoughtProbeConfig(BaseProbeConfig):
@@ -223,6 +292,8 @@ Maintain the exact technical meaning.
 
 Text: "The quantizer minimizes the mean squared error between the original weights and the quantized levels."  # noqa: E501
 """
+    verify_language: bool = True  # Require each response to be written in the requested language
+    min_script_purity: float = 0.6  # Share of letters in the language's own scripts
     max_tokens_per_run: int = 500
 
 
@@ -234,13 +305,35 @@ Text: "The quantizer minimizes the mean squared error between the original weigh
 class ComparisonProbeConfig(BaseProbeConfig):
     """
     Wrapper that runs a probe against target and reference model.
+    Both run concurrently in each trial so they share the same time window.
     """
 
+    name: str = "comparison_probe"
     reference_model_name: str
     reference_provider_id: str = "openrouter"
-    wrapped_probe_config: BaseProbeConfig
+    wrapped_probe_config: SerializeAsAny[BaseProbeConfig]  # Dumped with all subclass fields
     threshold_score_delta: float = 0.1
     threshold_latency_delta_ms: float = 1000.0
+    paired_trials: int = 1  # Repeated paired runs; deltas are averaged
+
+
+class SequentialTestConfig(BaseProbeConfig):
+    """
+    Repeats a wrapped probe until a degraded-vs-baseline decision is reached.
+    Ref: Wald (1945) Sequential Tests of Statistical Hypotheses.
+    """
+
+    name: str = "sequential_test"
+    wrapped_probe_config: SerializeAsAny[BaseProbeConfig]  # Dumped with all subclass fields
+    method: str = "sprt"  # "sprt" (Wald) or "bayes" (beta-binomial posterior)
+    baseline_pass_rate: float = 0.95  # H0: healthy pass rate
+    degraded_pass_rate: float = 0.75  # H1: pass rate treated as degraded
+    alpha: float = 0.05  # Max P(declare degraded | healthy)
+    beta: float = 0.10  # Max P(declare healthy | degraded)
+    use_score: bool = False  # Use score (0-1) as a fractional outcome instead of passed
+    min_samples: int = 1
+    max_samples: int = 50
+    max_tokens_per_run: int = 0  # 0 = no cap; otherwise stop before exceeding it
 
 
 class FactProbeConfig(BaseProbeConfig):
@@ -248,13 +341,25 @@ class FactProbeConfig(BaseProbeConfig):
 
     prompt: str
     expected_text: str
+    dataset: DatasetConfig | None = None  # When set, prompt/expected_text are ignored
 
 
 class TemporalConsistencyConfig(BaseProbeConfig):
-    """Knowledge cutoff verification."""
+    """
+    Knowledge cutoff verification.
+    Binary-searches dated events (JSONL: date, question, answer) around the
+    expected cutoff; each step asks one month's questions in a single request.
+    """
 
-    cutoff_date: date
-    strict_event_check: bool = True
+    name: str = "temporal_probe"
+    cutoff_date: date | None = None  # Expected cutoff; None = ModelInfo.knowledge_cutoff
+    strict_event_check: bool = True  # Exact answer match (False = answer contained in reply)
+    events_path: str | None = None
+    window_months: int = 12  # Search months on each side of the expected cutoff
+    questions_per_step: int = 5  # Events asked per request
+    known_threshold: float = 0.6  # Fraction correct for a month to count as known
+    tolerance_days: int = 92  # Allowed shift between effective and expected cutoff
+    max_tokens_per_run: int = 3000
 
 
 class JsonProbeConfig(BaseProbeConfig):
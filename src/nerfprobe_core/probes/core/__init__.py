@@ -1,10 +1,29 @@
-"""Core tier probes - essential degradation signals."""
+"""Core tier probes - essential degradation signals.
 
-from nerfprobe_core.probes.core.code_probe import CodeProbe
-from nerfprobe_core.probes.core.fact_probe import FactProbe
-from nerfprobe_core.probes.core.math_probe import MathProbe
-from nerfprobe_core.probes.core.style_probe import StyleProbe
-from nerfprobe_core.probes.core.timing_probe import TimingProbe
+Probe modules are imported on first attribute access.
+"""
+
+from typing import TYPE_CHECKING
+
+from nerfprobe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from nerfprobe_core.probes.core.code_probe import CodeProbe
+    from nerfprobe_core.probes.core.fact_probe import FactProbe
+    from nerfprobe_core.probes.core.math_probe import MathProbe
+    from nerfprobe_core.probes.core.style_probe import StyleProbe
+    from nerfprobe_core.probes.core.timing_probe import TimingProbe
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CodeProbe": "nerfprobe_core.probes.core.code_probe",
+        "FactProbe": "nerfprobe_core.probes.core.fact_probe",
+        "MathProbe": "nerfprobe_core.probes.core.math_probe",
+        "StyleProbe": "nerfprobe_core.probes.core.style_probe",
+        "TimingProbe": "nerfprobe_core.probes.core.timing_probe",
+    },
+)
 
 __all__ = [
     "MathProbe",
@@ -12,8 +12,13 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import expected_cost
+from nerfprobe_core.core.tokens import approx_token_count
 from nerfprobe_core.probes.config import CodeProbeConfig
+from nerfprobe_core.probes.dataset import run_dataset
 from nerfprobe_core.scorers.code import CodeScorer
 
 
@@ -25,6 +30,7 @@ class CodeProbe:
 
     def __init__(self, config: CodeProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = CodeScorer()
 
     @property
@@ -33,9 +39,28 @@ class CodeProbe:
 
     @property
     def estimated_cost(self) -> CostEstimate:
-        return CostEstimate(input_tokens=100, output_tokens=300)
+        # Per item in dataset mode, where the static prompt is unused
+        input_tokens = approx_token_count(self.config.prompt) if self.config.dataset is None else 150
+        return CostEstimate(input_tokens=input_tokens, output_tokens=300)
+
+    @staticmethod
+    def _score_item(response: str, expected: str) -> bool:
+        """Score one dataset item (syntax only; the expected answer is unused)."""
+        return CodeScorer().score(response) == 1.0
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if self.config.dataset is not None:
+            return await run_dataset(
+                self.config,
+                self.config.dataset,
+                target,
+                generator,
+                ProbeType.CODE,
+                self._score_item,
+                "[2512.08213]",
+                item_cost=expected_cost(self, target),
+            )
+
         start = time.perf_counter()
         response_text = ""
 
@@ -76,9 +101,7 @@ class CodeProbe:
         scorer_meta = metrics.get("_metadata", {})
 
         # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response_text)
 
         failure_reason = None
         if not passed:
@@ -102,7 +125,7 @@ class CodeProbe:
             metric_scores=metric_scores,
             metadata={
                 "research_ref": "[2512.08213]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "scorer_details": scorer_meta,
                 **extra_meta,
             },
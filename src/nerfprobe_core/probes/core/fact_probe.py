@@ -1,9 +1,13 @@
 import time
+from typing import Any
 
-from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType, copy_plain
+from nerfprobe_core.core.estimator import exceeds_budget, expected_cost
 from nerfprobe_core.core.gateway import LLMGateway
 from nerfprobe_core.core.scorer import CostEstimate, ProbeProtocol
+from nerfprobe_core.core.usage import extract_usage
 from nerfprobe_core.probes.config import FactProbeConfig
+from nerfprobe_core.probes.dataset import run_dataset
 from nerfprobe_core.scorers.fact_scorer import FactScorer
 
 
@@ -12,8 +16,11 @@ class FactProbe(ProbeProtocol):
     Checks if model expected fact is in the output.
     """
 
+    probe_type = ProbeType.HALLUCINATION
+
     def __init__(self, config: FactProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = FactScorer(expected_text=config.expected_text)
 
     @property
@@ -24,7 +31,36 @@ class FactProbe(ProbeProtocol):
     def estimated_cost(self) -> CostEstimate:
         return CostEstimate(input_tokens=50, output_tokens=50)
 
+    @staticmethod
+    def _score_item(response: str, expected: str) -> bool:
+        """Score one dataset item."""
+        return FactScorer(expected_text=expected).score(response) == 1.0
+
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if self.config.dataset is not None:
+            return await run_dataset(
+                self.config,
+                self.config.dataset,
+                target,
+                generator,
+                ProbeType.HALLUCINATION,
+                self._score_item,
+                "[2512.08213]",
+                item_cost=expected_cost(self, target),
+            )
+
+        if exceeds_budget(self, target):
+            return ProbeResult(
+                probe_name=self.config.name,
+                probe_type=ProbeType.HALLUCINATION,
+                target=target,
+                passed=False,
+                score=0.0,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Exceeds token budget",
+                metadata={"error": "Token budget exceeded"},
+            )
+
         start = time.perf_counter()
         response_text = ""
         try:
@@ -52,21 +88,54 @@ class FactProbe(ProbeProtocol):
                 metadata={"error": str(e)},
             )
 
+        # Extract usage
+        input_tokens, output_tokens = extract_usage(response_text)
+        return self._build_result(target, response_text, latency_ms, input_tokens, output_tokens)
+
+    def fusable_prompts(self) -> list[str]:
+        """The single prompt, unless the probe samples a dataset."""
+        return [self.config.prompt] if self.config.dataset is None else []
+
+    async def score_fused(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        answers: list[str],
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> ProbeResult:
+        """Score the answer split out of a fused request (see probes.fusion)."""
+        return self._build_result(target, answers[0], latency_ms, input_tokens, output_tokens, fused=True)
+
+    def _build_result(
+        self,
+        target: ModelTarget,
+        response_text: str,
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+        fused: bool = False,
+    ) -> ProbeResult:
+        """Score a response; shared by direct and fused runs."""
         score = self._scorer.score(response_text)
         metrics = self._scorer.metrics(response_text)
         passed = score == 1.0
 
-        # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
-
         failure_reason = None
         if not passed:
             # truncate expected if too long
             exp = str(self.config.expected_text)[:15]
             failure_reason = f"Missing fact: '{exp}...'"
 
+        metadata: dict[str, Any] = {
+            "research_ref": "[2512.08213]",
+            "config": copy_plain(self._config_dump),
+            "scorer_details": metrics,
+        }
+        if fused:
+            metadata["fused"] = True
+
         return ProbeResult(
             probe_name=self.config.name,
             probe_type=ProbeType.HALLUCINATION,
@@ -79,9 +148,5 @@ class FactProbe(ProbeProtocol):
             output_tokens=output_tokens,
             error_reason=failure_reason,
             metric_scores={"passed": 1.0 if passed else 0.0},
-            metadata={
-                "research_ref": "[2512.08213]",
-                "config": self.config.model_dump(),
-                "scorer_details": metrics,
-            },
+            metadata=metadata,
         )
@@ -5,6 +5,7 @@ Ref: [2504.04823] Quantization Hurts Reasoning.
 """
 
 import time
+from typing import Any
 
 from nerfprobe_core.core import (
     CostEstimate,
@@ -12,8 +13,12 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget, expected_cost
 from nerfprobe_core.probes.config import MathProbeConfig
+from nerfprobe_core.probes.dataset import run_dataset
 from nerfprobe_core.scorers.math import MathScorer
 
 
@@ -23,8 +28,11 @@ class MathProbe:
     Simple but effective for detecting precision loss.
     """
 
+    probe_type = ProbeType.MATH
+
     def __init__(self, config: MathProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = MathScorer(expected_answer=config.expected_answer)
 
     @property
@@ -35,7 +43,36 @@ class MathProbe:
     def estimated_cost(self) -> CostEstimate:
         return CostEstimate(input_tokens=50, output_tokens=50)
 
+    @staticmethod
+    def _score_item(response: str, expected: str) -> bool:
+        """Score one dataset item."""
+        return MathScorer(expected_answer=expected).score(response) == 1.0
+
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if self.config.dataset is not None:
+            return await run_dataset(
+                self.config,
+                self.config.dataset,
+                target,
+                generator,
+                ProbeType.MATH,
+                self._score_item,
+                "[2504.04823]",
+                item_cost=expected_cost(self, target),
+            )
+
+        if exceeds_budget(self, target):
+            return ProbeResult(
+                probe_name=self.config.name,
+                probe_type=ProbeType.MATH,
+                target=target,
+                passed=False,
+                score=0.0,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Exceeds token budget",
+                metadata={"error": "Token budget exceeded"},
+            )
+
         start = time.perf_counter()
         response_text = ""
 
@@ -65,15 +102,40 @@ class MathProbe:
                 metadata={"error": str(e)},
             )
 
+        # Extract usage if available (StrWithUsage pattern)
+        input_tokens, output_tokens = extract_usage(response_text)
+        return self._build_result(target, response_text, latency_ms, input_tokens, output_tokens)
+
+    def fusable_prompts(self) -> list[str]:
+        """The single prompt, unless the probe samples a dataset."""
+        return [self.config.prompt] if self.config.dataset is None else []
+
+    async def score_fused(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        answers: list[str],
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> ProbeResult:
+        """Score the answer split out of a fused request (see probes.fusion)."""
+        return self._build_result(target, answers[0], latency_ms, input_tokens, output_tokens, fused=True)
+
+    def _build_result(
+        self,
+        target: ModelTarget,
+        response_text: str,
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+        fused: bool = False,
+    ) -> ProbeResult:
+        """Score a response; shared by direct and fused runs."""
         score = self._scorer.score(response_text)
         metrics = self._scorer.metrics(response_text)
         passed = score == 1.0
 
-        # Extract usage if available (StrWithUsage pattern)
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
-
         # Populate failure reason for UI
         failure_reason = None
         if not passed:
@@ -83,6 +145,14 @@ class MathProbe:
                 got += "..."
             failure_reason = f"Got '{got}' (Exp {self.config.expected_answer})"
 
+        metadata: dict[str, Any] = {
+            "research_ref": "[2504.04823]",
+            "config": copy_plain(self._config_dump),
+            "scorer_details": metrics,
+        }
+        if fused:
+            metadata["fused"] = True
+
         return ProbeResult(
             probe_name=self.config.name,
             probe_type=ProbeType.MATH,
@@ -95,9 +165,5 @@ class MathProbe:
             output_tokens=output_tokens,
             error_reason=failure_reason,
             metric_scores={"passed": 1.0 if passed else 0.0},
-            metadata={
-                "research_ref": "[2504.04823]",
-                "config": self.config.model_dump(),
-                "scorer_details": metrics,
-            },
+            metadata=metadata,
         )
@@ -12,20 +12,28 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import StyleProbeConfig
+from nerfprobe_core.scorers.diversity import HIGHER_IS_BETTER, meets_threshold
 from nerfprobe_core.scorers.ttr import TTRScorer
 
 
 class StyleProbe:
     """
     Detects vocabulary degradation using Type-Token Ratio.
-    Low TTR indicates repetitive, "lobotomized" output.
+    Low TTR indicates repetitive, "lobotomized" output. The pass criterion
+    can be switched to a length-robust metric with `pass_metric`.
     """
 
     def __init__(self, config: StyleProbeConfig):
+        if config.pass_metric not in HIGHER_IS_BETTER:
+            raise ValueError(f"Unknown pass_metric {config.pass_metric!r}; expected one of {sorted(HIGHER_IS_BETTER)}")
         self._config = config
-        self._scorer = TTRScorer(sliding_window_size=config.sliding_window_size)
+        self._config_dump = config.model_dump()
+        self._scorer = TTRScorer(sliding_window_size=config.sliding_window_size, segmenter=config.segmentation)
 
     @property
     def config(self) -> StyleProbeConfig:
@@ -35,9 +43,14 @@ class StyleProbe:
     def estimated_cost(self) -> CostEstimate:
         return CostEstimate(input_tokens=50, output_tokens=500)
 
+    def _threshold(self, metric: str) -> float:
+        if metric in ("ttr", "min_local_ttr"):
+            return self.config.min_ttr
+        return float(getattr(self.config.diversity, metric))
+
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         # Enforce Token Budget
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.STYLE,
@@ -81,17 +94,20 @@ class StyleProbe:
         # Scoring Phase
         score = self._scorer.score(response)
         metrics = self._scorer.metrics(response)
-        passed = metrics.get("min_local_ttr", score) >= self.config.min_ttr
+        metric = self.config.pass_metric
+        threshold = self._threshold(metric)
+        passed = meets_threshold(metric, metrics[metric], threshold)
 
         # Extract usage
-        usage = getattr(response, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
+        input_tokens, output_tokens = extract_usage(response)
 
         failure_reason = None
         if not passed:
-            ttr = metrics.get("min_local_ttr", 0.0)
-            failure_reason = f"Low TTR: {ttr:.2f} (Min {self.config.min_ttr})"
+            if metric in ("ttr", "min_local_ttr"):
+                failure_reason = f"Low TTR: {metrics[metric]:.2f} (Min {self.config.min_ttr})"
+            else:
+                bound = "Min" if HIGHER_IS_BETTER[metric] else "Max"
+                failure_reason = f"{metric}: {metrics[metric]:.2f} ({bound} {threshold})"
 
         return ProbeResult(
             probe_name=self.config.name,
@@ -109,6 +125,7 @@ class StyleProbe:
                 "research_ref": "[2403.06408]",
                 "threshold_baseline": "0.65-0.70",
                 "threshold_alert": f"<{self.config.min_ttr}",
-                "config": self.config.model_dump(),
+                "pass_metric": metric,
+                "config": copy_plain(self._config_dump),
             },
         )
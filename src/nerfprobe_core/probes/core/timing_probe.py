@@ -4,8 +4,10 @@ TimingProbe - Latency fingerprinting via TTFT and ITL.
 Ref: [2502.20589] LLMs Have Rhythm.
 """
 
+import bisect
+import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from nerfprobe_core.core import (
     CostEstimate,
@@ -13,9 +15,28 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
 )
 from nerfprobe_core.probes.config import TimingProbeConfig
 
+# Log-spaced ITL histogram edges (ms). The last bin is open-ended.
+ITL_HISTOGRAM_EDGES_MS: tuple[float, ...] = (5.0, 10.0, 20.0, 40.0, 80.0, 160.0, 320.0)
+
+# Ordered feature names for timing fingerprints (see analysis.fingerprint_index).
+TIMING_FEATURES: tuple[str, ...] = (
+    "ttft_ms",
+    "mean_itl_ms",
+    "itl_std_ms",
+    "itl_p10_ms",
+    "itl_p50_ms",
+    "itl_p90_ms",
+    "itl_p99_ms",
+    *(f"itl_hist_{i}" for i in range(len(ITL_HISTOGRAM_EDGES_MS) + 1)),
+    "chunk_chars_mean",
+    "chunk_chars_std",
+    "chunk_count",
+)
+
 
 @dataclass
 class TimingStats:
@@ -24,21 +45,75 @@ class TimingStats:
     ttft_ms: float
     mean_itl_ms: float
     chunk_count: int
+    itl_std_ms: float = 0.0
+    itl_percentiles_ms: dict[int, float] = field(default_factory=dict)
+    itl_histogram: list[float] = field(default_factory=list)
+    chunk_chars_mean: float = 0.0
+    chunk_chars_std: float = 0.0
+
+    def features(self) -> dict[str, float]:
+        """Flatten into the named features listed in TIMING_FEATURES."""
+        feats = {
+            "ttft_ms": self.ttft_ms,
+            "mean_itl_ms": self.mean_itl_ms,
+            "itl_std_ms": self.itl_std_ms,
+            "chunk_chars_mean": self.chunk_chars_mean,
+            "chunk_chars_std": self.chunk_chars_std,
+            "chunk_count": float(self.chunk_count),
+        }
+        for q in (10, 50, 90, 99):
+            feats[f"itl_p{q}_ms"] = self.itl_percentiles_ms.get(q, 0.0)
+        for i in range(len(ITL_HISTOGRAM_EDGES_MS) + 1):
+            feats[f"itl_hist_{i}"] = self.itl_histogram[i] if i < len(self.itl_histogram) else 0.0
+        return feats
 
 
 class TimingAnalyzer:
     """Pure timing analysis logic."""
 
     @staticmethod
-    def analyze(ttft: float, chunk_times: list[float]) -> TimingStats:
+    def analyze(ttft: float, chunk_times: list[float], chunk_sizes: list[int] | None = None) -> TimingStats:
         """Compute timing statistics from raw measurements."""
         mean_itl = sum(chunk_times) / len(chunk_times) if chunk_times else 0.0
+        sorted_itl = sorted(chunk_times)
+
+        histogram = [0.0] * (len(ITL_HISTOGRAM_EDGES_MS) + 1)
+        for itl in chunk_times:
+            histogram[bisect.bisect_right(ITL_HISTOGRAM_EDGES_MS, itl)] += 1
+        if chunk_times:
+            histogram = [count / len(chunk_times) for count in histogram]
+
+        sizes = chunk_sizes or []
+        chunk_mean = sum(sizes) / len(sizes) if sizes else 0.0
+
         return TimingStats(
             ttft_ms=ttft,
             mean_itl_ms=mean_itl,
             chunk_count=len(chunk_times),
+            itl_std_ms=TimingAnalyzer._std(chunk_times, mean_itl),
+            itl_percentiles_ms={q: TimingAnalyzer._percentile(sorted_itl, q) for q in (10, 50, 90, 99)},
+            itl_histogram=histogram,
+            chunk_chars_mean=chunk_mean,
+            chunk_chars_std=TimingAnalyzer._std(sizes, chunk_mean),
         )
 
+    @staticmethod
+    def _percentile(sorted_values: list[float], q: float) -> float:
+        """Linearly interpolated percentile of pre-sorted values."""
+        if not sorted_values:
+            return 0.0
+        pos = (len(sorted_values) - 1) * q / 100.0
+        lo = int(pos)
+        hi = min(lo + 1, len(sorted_values) - 1)
+        return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+    @staticmethod
+    def _std(values: list[float] | list[int], mean: float) -> float:
+        """Population standard deviation."""
+        if not values:
+            return 0.0
+        return math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+
 
 class TimingProbe:
     """
@@ -48,6 +123,7 @@ class TimingProbe:
 
     def __init__(self, config: TimingProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
 
     @property
     def config(self) -> TimingProbeConfig:
@@ -60,6 +136,7 @@ class TimingProbe:
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         start_time = time.perf_counter()
         chunk_times: list[float] = []
+        chunk_sizes: list[int] = []
         full_response: list[str] = []
 
         prompt = f"Count from 1 to {self.config.token_count} in words, one per line."
@@ -83,13 +160,14 @@ class TimingProbe:
                     last_chunk_time = now
 
                 full_response.append(chunk)
+                chunk_sizes.append(len(chunk))
 
             response_text = "".join(full_response)
             end_time = time.perf_counter()
             latency_ms = (end_time - start_time) * 1000
 
             # Calculate Timing Stats
-            timing_stats = TimingAnalyzer.analyze(ttft, chunk_times)
+            timing_stats = TimingAnalyzer.analyze(ttft, chunk_times, chunk_sizes)
 
             passed = bool(response_text.strip()) and latency_ms > 0
 
@@ -103,10 +181,10 @@ class TimingProbe:
                 raw_response=response_text,
                 ttft_ms=timing_stats.ttft_ms,
                 mean_itl_ms=timing_stats.mean_itl_ms,
-                metric_scores={},
+                metric_scores=timing_stats.features(),
                 metadata={
                     "research_ref": "[2502.20589]",
-                    "config": self.config.model_dump(),
+                    "config": copy_plain(self._config_dump),
                     "chunk_count": timing_stats.chunk_count,
                 },
             )
@@ -0,0 +1,314 @@
+"""
+Dataset-backed probe runs - accuracy with confidence intervals over local item files.
+
+Items are streamed from JSONL/CSV via a memory-mapped offset index, so
+GSM8K-sized (and much larger) files are sampled without loading them.
+
+Ref: [2504.04823] Quantization Hurts Reasoning (few-point accuracy drops).
+"""
+
+import asyncio
+import csv
+import json
+import mmap
+import os
+import random
+import time
+from array import array
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any
+
+from nerfprobe_core.core import CostEstimate, LLMGateway, ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.core.usage import extract_usage, sum_tokens
+from nerfprobe_core.probes.config import BaseProbeConfig, DatasetConfig
+from nerfprobe_core.probes.seeding import probe_rng
+
+
+class DatasetReader:
+    """
+    Random-access reader over a JSONL or single-line-record CSV file.
+
+    Builds an array of line start offsets over an mmap of the file; rows are
+    parsed only when requested. When stratifying, one streaming pass records a
+    compact stratum id per row.
+    """
+
+    def __init__(self, config: DatasetConfig):
+        self.config = config
+        self.path = Path(config.path)
+        self.format = (config.format or self.path.suffix.lstrip(".")).lower()
+        if self.format not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported dataset format: {self.format!r} (expected 'jsonl' or 'csv')")
+
+        self._file = open(self.path, "rb")
+        try:
+            # mmap cannot map an empty file; an empty buffer indexes to zero items
+            size = os.fstat(self._file.fileno()).st_size
+            self._mm: mmap.mmap | bytes = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        except BaseException:
+            self._file.close()
+            raise
+        self._header: list[str] = []
+        self._offsets = array("Q")
+        self._strata = array("I")
+        self._stratum_names: list[str] = []
+        try:
+            self._build_index()
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "DatasetReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _build_index(self) -> None:
+        mm = self._mm
+        size = len(mm)
+        pos = 0
+
+        if self.format == "csv" and size:
+            end = mm.find(b"\n")
+            end = size if end == -1 else end
+            self._header = next(csv.reader([mm[:end].decode("utf-8-sig")]))
+            pos = end + 1
+
+        stratify = self.config.stratify_field
+        stratum_ids: dict[str, int] = {}
+
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            end = size if end == -1 else end
+            if mm[pos:end].strip():
+                self._offsets.append(pos)
+                if stratify is not None:
+                    try:
+                        key = str(self._parse(pos, end).get(stratify, ""))
+                    except (ValueError, AttributeError):
+                        key = ""  # Malformed row; it fails as an item error when sampled
+                    if key not in stratum_ids:
+                        stratum_ids[key] = len(self._stratum_names)
+                        self._stratum_names.append(key)
+                    self._strata.append(stratum_ids[key])
+            pos = end + 1
+
+    def _parse(self, start: int, end: int) -> dict[str, Any]:
+        line = self._mm[start:end].decode("utf-8").rstrip("\r")
+        if self.format == "jsonl":
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"Dataset row is not an object: {line[:80]!r}")
+            return row
+        return dict(zip(self._header, next(csv.reader([line])), strict=False))
+
+    def item(self, index: int) -> dict[str, Any]:
+        """Parse the row at a given item index."""
+        start = self._offsets[index]
+        end = self._mm.find(b"\n", start)
+        return self._parse(start, len(self._mm) if end == -1 else end)
+
+    def stratum(self, index: int) -> str | None:
+        """Stratum label of an item (None when not stratifying)."""
+        return self._stratum_names[self._strata[index]] if self._strata else None
+
+    def sample(self, rng: random.Random, size: int | None) -> Sequence[int]:
+        """
+        Item indices to evaluate: all items, a uniform sample, or a
+        proportionally allocated stratified sample.
+        """
+        total = len(self)
+        if size is None or size >= total:
+            return range(total)
+        if not self._strata:
+            return sorted(rng.sample(range(total), size))
+
+        counts = [0] * len(self._stratum_names)
+        for sid in self._strata:
+            counts[sid] += 1
+
+        # Largest-remainder allocation so per-stratum quotas sum to `size`.
+        exact = [c * size / total for c in counts]
+        quotas = [int(q) for q in exact]
+        by_remainder = sorted(range(len(counts)), key=lambda i: exact[i] - quotas[i], reverse=True)
+        for i in by_remainder[: size - sum(quotas)]:
+            quotas[i] += 1
+
+        # One streaming pass with a reservoir per stratum.
+        reservoirs: list[list[int]] = [[] for _ in counts]
+        seen = [0] * len(counts)
+        for idx, sid in enumerate(self._strata):
+            seen[sid] += 1
+            res = reservoirs[sid]
+            if len(res) < quotas[sid]:
+                res.append(idx)
+            else:
+                j = rng.randrange(seen[sid])
+                if j < quotas[sid]:
+                    res[j] = idx
+        return sorted(i for res in reservoirs for i in res)
+
+
+def extract_answer(raw: Any) -> str:
+    """Normalize a dataset answer; GSM8K rationales end with '#### <answer>'."""
+    text = str(raw)
+    if "####" in text:
+        text = text.rsplit("####", 1)[1]
+    return text.strip()
+
+
+def wilson_interval(successes: int, total: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if total == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / total
+    denom = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denom
+    half = z * ((p * (1 - p) / total + z * z / (4 * total * total)) ** 0.5) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+async def run_dataset(
+    config: BaseProbeConfig,
+    dataset: DatasetConfig,
+    target: ModelTarget,
+    generator: LLMGateway,
+    probe_type: ProbeType,
+    score_item: Callable[[str, str], bool],
+    research_ref: str,
+    item_cost: CostEstimate,
+) -> ProbeResult:
+    """
+    Evaluate sampled dataset items concurrently and aggregate into one ProbeResult.
+
+    Only counters are kept per item, so memory stays flat regardless of how
+    many items are evaluated. The file is indexed and sampled in a worker
+    thread. The run is skipped if the sampled items times `item_cost` exceed
+    dataset.max_tokens, which defaults to config.max_tokens_per_run per item
+    (0 = no limit). A row that fails to parse or format counts as an error
+    for that item only.
+
+    Args:
+        score_item: (response, expected_answer) -> correct
+        item_cost: Estimated cost of one item (the probe's expected_cost)
+    """
+    start = time.perf_counter()
+    seed, rng = probe_rng(config.seed)
+
+    reader = await asyncio.to_thread(DatasetReader, dataset)
+    try:
+        sampled = await asyncio.to_thread(reader.sample, rng, dataset.sample_size)
+    except BaseException:
+        reader.close()
+        raise
+
+    planned_tokens = len(sampled) * item_cost.total_tokens
+    budget = dataset.max_tokens if dataset.max_tokens is not None else config.max_tokens_per_run * len(sampled)
+    if 0 < budget < planned_tokens:
+        reader.close()
+        return ProbeResult(
+            probe_name=config.name,
+            probe_type=probe_type,
+            target=target,
+            passed=False,
+            score=0.0,
+            latency_ms=0.0,
+            raw_response="SKIPPED: Exceeds token budget",
+            metadata={
+                "error": "Token budget exceeded",
+                "items": len(sampled),
+                "cost": planned_tokens,
+                "budget": budget,
+            },
+        )
+
+    correct = 0
+    evaluated = 0
+    errors = 0
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    per_stratum: dict[str, list[int]] = {}
+
+    with reader:
+        indices = iter(sampled)
+
+        async def worker() -> None:
+            nonlocal correct, evaluated, errors, input_tokens, output_tokens
+            for idx in indices:
+                try:
+                    row = reader.item(idx)
+                    prompt = dataset.prompt_template.format(prompt=row.get(dataset.prompt_field, ""))
+                    expected = extract_answer(row.get(dataset.answer_field, ""))
+                    response = await generator.generate(target, prompt)
+                    in_tok, out_tok = extract_usage(response)
+                    input_tokens = sum_tokens(input_tokens, in_tok)
+                    output_tokens = sum_tokens(output_tokens, out_tok)
+                    ok = score_item(str(response), expected)
+                except Exception:
+                    errors += 1
+                    ok = False
+
+                evaluated += 1
+                correct += ok
+                stratum = reader.stratum(idx)
+                if stratum is not None:
+                    counts = per_stratum.setdefault(stratum, [0, 0])
+                    counts[0] += ok
+                    counts[1] += 1
+
+        await asyncio.gather(*(worker() for _ in range(max(1, dataset.concurrency))))
+        dataset_size = len(reader)
+
+    latency_ms = (time.perf_counter() - start) * 1000
+    accuracy = correct / evaluated if evaluated else 0.0
+    ci_low, ci_high = wilson_interval(correct, evaluated, dataset.confidence)
+    passed = evaluated > 0 and ci_high >= dataset.min_accuracy
+
+    failure_reason = None
+    if evaluated == 0:
+        failure_reason = "Empty dataset"
+    elif errors == evaluated:
+        failure_reason = "All requests failed"
+    elif not passed:
+        failure_reason = f"Accuracy {accuracy:.2f} [{ci_low:.2f}, {ci_high:.2f}] < {dataset.min_accuracy}"
+
+    return ProbeResult(
+        probe_name=config.name,
+        probe_type=probe_type,
+        target=target,
+        passed=passed,
+        score=accuracy,
+        latency_ms=latency_ms,
+        raw_response=f"Dataset run: {correct}/{evaluated} correct",
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        error_reason=failure_reason,
+        metric_scores={
+            "accuracy": accuracy,
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+            "items": float(evaluated),
+            "errors": float(errors),
+        },
+        metadata={
+            "research_ref": research_ref,
+            "config": config.model_dump(),
+            "seed": seed,
+            "dataset_path": dataset.path,
+            "dataset_size": dataset_size,
+            "confidence": dataset.confidence,
+            "stratum_accuracy": {k: c / n for k, (c, n) in per_stratum.items()},
+        },
+    )
@@ -0,0 +1,177 @@
+"""
+Probe fusion - pack several short probes for one target into a single request.
+
+Math, Fact and Calibration prompts and the RoutingProbe easy prompts each need
+only a few output tokens, so the per-request prompt overhead and round trip
+dominate their cost. Fusion asks them together under a numbered answer format,
+splits the reply back out and scores every part with its probe's own scorer.
+Each probe still gets its own ProbeResult, flagged with metadata["fused"] and
+carrying a proportional share of the request's tokens.
+
+Probes take part by implementing FusableProbe (core.scorer). Fusion is
+opt-in: call run_fused() instead of running the probes one by one.
+"""
+
+import asyncio
+import re
+import time
+
+from nerfprobe_core.core import LLMGateway, ModelTarget, ProbeResult
+from nerfprobe_core.core.estimator import exceeds_budget
+from nerfprobe_core.core.scorer import FusableProbe, ProbeProtocol
+from nerfprobe_core.core.usage import extract_usage
+
+_FUSED_HEADER = (
+    "Answer each numbered question independently. Start each answer on a new line "
+    "with the question's number in square brackets, e.g. '[1] ...'. "
+    "Follow any answer format a question asks for.\n\n"
+)
+_ANSWER_MARKER = re.compile(r"^\s*\[(\d+)\]", re.MULTILINE)
+
+
+def fusable_prompts(probe: ProbeProtocol) -> list[str]:
+    """Prompts of a probe that can be fused (empty if the probe cannot take part)."""
+    if isinstance(probe, FusableProbe):
+        return probe.fusable_prompts()
+    return []
+
+
+def build_fused_prompt(prompts: list[str]) -> str:
+    """Numbered multi-question prompt."""
+    return _FUSED_HEADER + "\n\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+
+
+def split_fused_response(response: str, count: int) -> list[str]:
+    """Split a '[n] answer' reply into `count` answers; missing answers are empty."""
+    answers = [""] * count
+    markers = list(_ANSWER_MARKER.finditer(response))
+    for i, marker in enumerate(markers):
+        num = int(marker.group(1))
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(response)
+        if 1 <= num <= count and not answers[num - 1]:
+            answers[num - 1] = response[marker.end() : end].strip()
+    return answers
+
+
+def attribute_tokens(total: int, weights: list[int]) -> list[int]:
+    """Split a token count proportionally to weights (largest remainder, sums to total)."""
+    weight_sum = sum(weights)
+    if weight_sum == 0:
+        weights, weight_sum = [1] * len(weights), len(weights)
+    exact = [total * w / weight_sum for w in weights]
+    shares = [int(x) for x in exact]
+    by_remainder = sorted(range(len(weights)), key=lambda i: exact[i] - shares[i], reverse=True)
+    for i in by_remainder[: total - sum(shares)]:
+        shares[i] += 1
+    return shares
+
+
+def _error_result(probe: FusableProbe, target: ModelTarget, error: Exception, latency_ms: float) -> ProbeResult:
+    err_msg = str(error)
+    reason = "Error"
+    if "429" in err_msg:
+        reason = "Rate Limit"
+    elif "401" in err_msg:
+        reason = "Auth Error"
+    elif "500" in err_msg or "503" in err_msg:
+        reason = "Server Error"
+
+    return ProbeResult(
+        probe_name=getattr(probe.config, "name", type(probe).__name__),
+        probe_type=probe.probe_type,
+        target=target,
+        passed=False,
+        score=0.0,
+        latency_ms=latency_ms,
+        raw_response=f"ERROR: {error!s}",
+        error_reason=reason,
+        metadata={"error": str(error), "fused": True},
+    )
+
+
+def _skipped_result(probe: FusableProbe, target: ModelTarget) -> ProbeResult:
+    return ProbeResult(
+        probe_name=getattr(probe.config, "name", type(probe).__name__),
+        probe_type=probe.probe_type,
+        target=target,
+        passed=False,
+        score=0.0,
+        latency_ms=0.0,
+        raw_response="SKIPPED: Exceeds token budget",
+        metadata={"status": "SKIPPED", "cost": probe.estimated_cost.total_tokens},
+    )
+
+
+async def run_fused(probes: list[ProbeProtocol], target: ModelTarget, generator: LLMGateway) -> list[ProbeResult]:
+    """
+    Run probes against one target, fusing every compatible prompt into one request.
+
+    Probes that cannot be fused run normally (concurrently with the fused
+    request); fusable probes over the token budget are skipped. Every probe
+    gets a result, in the order of `probes`.
+    """
+    results: list[ProbeResult | None] = [None] * len(probes)
+    fused: list[tuple[int, FusableProbe, list[str]]] = []
+    for i, probe in enumerate(probes):
+        if not isinstance(probe, FusableProbe) or not (prompts := probe.fusable_prompts()):
+            continue
+        if exceeds_budget(probe, target):
+            results[i] = _skipped_result(probe, target)
+        else:
+            fused.append((i, probe, prompts))
+    # A lone fusable probe gains nothing from the numbered format
+    if len(fused) < 2 and sum(len(prompts) for _, _, prompts in fused) < 2:
+        fused = []
+    fused_indexes = {i for i, _, _ in fused}
+
+    async def run_single(i: int) -> None:
+        results[i] = await probes[i].run(target, generator)
+
+    async def run_fused_request() -> None:
+        prompts = [prompt for _, _, probe_prompts in fused for prompt in probe_prompts]
+        start = time.perf_counter()
+        try:
+            response = await generator.generate(target, build_fused_prompt(prompts))
+        except Exception as e:
+            latency_ms = (time.perf_counter() - start) * 1000
+            for i, probe, _ in fused:
+                results[i] = _error_result(probe, target, e, latency_ms)
+            return
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        input_tokens, output_tokens = extract_usage(response)
+        answers = split_fused_response(str(response), len(prompts))
+        # Unreported counts stay None for every part
+        input_shares = None if input_tokens is None else attribute_tokens(input_tokens, [len(p) for p in prompts])
+        output_shares = None if output_tokens is None else attribute_tokens(output_tokens, [len(a) for a in answers])
+
+        pos = 0
+        for i, probe, probe_prompts in fused:
+            span = slice(pos, pos + len(probe_prompts))
+            first = pos + 1
+            pos += len(probe_prompts)
+            if not all(answers[span]):
+                missing = [first + k for k, answer in enumerate(answers[span]) if not answer]
+                error = ValueError(f"No answer for question(s) {missing} in the fused response")
+                results[i] = _error_result(probe, target, error, latency_ms)
+                continue
+            try:
+                results[i] = await probe.score_fused(
+                    target,
+                    generator,
+                    answers[span],
+                    latency_ms,
+                    None if input_shares is None else sum(input_shares[span]),
+                    None if output_shares is None else sum(output_shares[span]),
+                )
+            except Exception as e:
+                results[i] = _error_result(probe, target, e, latency_ms)
+
+    tasks = [run_single(i) for i in range(len(probes)) if results[i] is None and i not in fused_indexes]
+    if fused:
+        tasks.append(run_fused_request())
+    await asyncio.gather(*tasks)
+
+    # Every branch above assigns its probes' results
+    assert all(result is not None for result in results)
+    return [result for result in results if result is not None]
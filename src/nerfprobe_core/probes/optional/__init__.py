@@ -1,11 +1,31 @@
-"""Optional tier probes - require logprobs or special handling."""
+"""Optional tier probes - require logprobs or special handling.
 
-from nerfprobe_core.probes.optional.calibration_probe import CalibrationProbe
-from nerfprobe_core.probes.optional.multilingual_probe import MultilingualProbe
-from nerfprobe_core.probes.optional.zeroprint_probe import ZeroPrintProbe
+Probe modules are imported on first attribute access.
+"""
+
+from typing import TYPE_CHECKING
+
+from nerfprobe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from nerfprobe_core.probes.optional.calibration_probe import CalibrationProbe
+    from nerfprobe_core.probes.optional.multilingual_probe import MultilingualProbe
+    from nerfprobe_core.probes.optional.temporal_probe import TemporalProbe
+    from nerfprobe_core.probes.optional.zeroprint_probe import ZeroPrintProbe
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CalibrationProbe": "nerfprobe_core.probes.optional.calibration_probe",
+        "MultilingualProbe": "nerfprobe_core.probes.optional.multilingual_probe",
+        "TemporalProbe": "nerfprobe_core.probes.optional.temporal_probe",
+        "ZeroPrintProbe": "nerfprobe_core.probes.optional.zeroprint_probe",
+    },
+)
 
 __all__ = [
     "CalibrationProbe",
     "ZeroPrintProbe",
     "MultilingualProbe",
+    "TemporalProbe",
 ]
@@ -6,6 +6,7 @@ Requires: Simple factual questions with expected high confidence.
 """
 
 import time
+from typing import Any
 
 from nerfprobe_core.core import (
     CostEstimate,
@@ -13,7 +14,10 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
 from nerfprobe_core.probes.config import CalibrationProbeConfig
 from nerfprobe_core.scorers.calibration import CalibrationScorer
 
@@ -24,8 +28,11 @@ class CalibrationProbe:
     Tests if model expresses appropriate confidence for factual questions.
     """
 
+    probe_type = ProbeType.CALIBRATION
+
     def __init__(self, config: CalibrationProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = CalibrationScorer(
             expected_answer=config.expected_answer,
             min_confidence=config.min_confidence,
@@ -40,7 +47,7 @@ class CalibrationProbe:
         return CostEstimate(input_tokens=50, output_tokens=50)
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.CALIBRATION,
@@ -80,15 +87,40 @@ class CalibrationProbe:
                 metadata={"error": str(e)},
             )
 
+        # Extract usage
+        input_tokens, output_tokens = extract_usage(response_text)
+        return self._build_result(target, response_text, latency_ms, input_tokens, output_tokens)
+
+    def fusable_prompts(self) -> list[str]:
+        """The single prompt."""
+        return [self.config.prompt]
+
+    async def score_fused(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        answers: list[str],
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> ProbeResult:
+        """Score the answer split out of a fused request (see probes.fusion)."""
+        return self._build_result(target, answers[0], latency_ms, input_tokens, output_tokens, fused=True)
+
+    def _build_result(
+        self,
+        target: ModelTarget,
+        response_text: str,
+        latency_ms: float,
+        input_tokens: int | None,
+        output_tokens: int | None,
+        fused: bool = False,
+    ) -> ProbeResult:
+        """Score a response; shared by direct and fused runs."""
         score = self._scorer.score(response_text)
         metrics = self._scorer.metrics(response_text)
         passed = score == 1.0
 
-        # Extract usage
-        usage = getattr(response_text, "usage", {})
-        input_tokens = usage.get("prompt_tokens")
-        output_tokens = usage.get("completion_tokens")
-
         failure_reason = None
         if not passed:
             if not metrics["is_correct"]:
@@ -96,6 +128,14 @@ class CalibrationProbe:
             else:
                 failure_reason = f"Confidence {metrics['confidence']} too low"
 
+        metadata: dict[str, Any] = {
+            "research_ref": "[2511.07585]",
+            "config": copy_plain(self._config_dump),
+            "is_correct": metrics["is_correct"],
+        }
+        if fused:
+            metadata["fused"] = True
+
         return ProbeResult(
             probe_name=self.config.name,
             probe_type=ProbeType.CALIBRATION,
@@ -108,9 +148,5 @@ class CalibrationProbe:
             output_tokens=output_tokens,
             error_reason=failure_reason,
             metric_scores={"confidence": metrics["confidence"]},
-            metadata={
-                "research_ref": "[2511.07585]",
-                "config": self.config.model_dump(),
-                "is_correct": metrics["is_correct"],
-            },
+            metadata=metadata,
         )
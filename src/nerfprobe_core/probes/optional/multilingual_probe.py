@@ -12,7 +12,12 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
+    sum_tokens,
 )
+from nerfprobe_core.core.estimator import exceeds_budget
+from nerfprobe_core.core.tokens import approx_token_count
 from nerfprobe_core.probes.config import MultilingualProbeConfig
 from nerfprobe_core.scorers.multilingual import MultilingualScorer
 
@@ -39,7 +44,11 @@ class MultilingualProbe:
 
     def __init__(self, config: MultilingualProbeConfig):
         self._config = config
-        self._scorer = MultilingualScorer(expected_keywords={})
+        self._config_dump = config.model_dump()
+        self._scorer = MultilingualScorer(
+            verify_language=config.verify_language,
+            min_script_purity=config.min_script_purity,
+        )
 
     @property
     def config(self) -> MultilingualProbeConfig:
@@ -47,11 +56,19 @@ class MultilingualProbe:
 
     @property
     def estimated_cost(self) -> CostEstimate:
-        num_langs = len(self.config.languages)
-        return CostEstimate(input_tokens=50 * num_langs, output_tokens=50 * num_langs)
+        # A translation is about as long as its source; non-Latin output is
+        # priced by the same script-aware count.
+        input_tokens = sum(approx_token_count(self._prompt(lang)) for lang in self.config.languages)
+        return CostEstimate(input_tokens=input_tokens, output_tokens=input_tokens)
+
+    def _prompt(self, lang: str) -> str:
+        prompt = self.config.prompt_template
+        if "{target_language}" in prompt:
+            prompt = prompt.format(target_language=LANG_NAMES.get(lang, lang))
+        return prompt
 
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
-        if self.config.max_tokens_per_run > 0 and self.estimated_cost.total_tokens > self.config.max_tokens_per_run:
+        if exceeds_budget(self, target):
             return ProbeResult(
                 probe_name=self.config.name,
                 probe_type=ProbeType.MULTILINGUAL,
@@ -65,21 +82,16 @@ class MultilingualProbe:
 
         start = time.perf_counter()
         responses: dict[str, str] = {}
-        total_input_tokens = 0
-        total_output_tokens = 0
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
 
         try:
             for lang in self.config.languages:
-                prompt = self.config.prompt_template
-                if "{target_language}" in prompt:
-                    lang_name = LANG_NAMES.get(lang, lang)
-                    prompt = prompt.format(target_language=lang_name)
-
-                resp = await generator.generate(target, prompt)
+                resp = await generator.generate(target, self._prompt(lang))
 
-                u = getattr(resp, "usage", {})
-                total_input_tokens += u.get("prompt_tokens", 0)
-                total_output_tokens += u.get("completion_tokens", 0)
+                in_tok, out_tok = extract_usage(resp)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
 
                 responses[lang] = resp
 
@@ -99,6 +111,10 @@ class MultilingualProbe:
         metrics = self._scorer.metrics(responses)
         score = metrics["consistency_score"]
         passed = metrics["passed"]
+        metric_scores = {"consistency": score}
+        if self.config.verify_language:
+            metric_scores["script_purity"] = metrics["min_script_purity"]
+            metric_scores["language_confidence"] = metrics["mean_language_confidence"]
 
         return ProbeResult(
             probe_name=self.config.name,
@@ -111,10 +127,11 @@ class MultilingualProbe:
             input_tokens=total_input_tokens,
             output_tokens=total_output_tokens,
             error_reason="Diff > Threshold" if not passed else None,
-            metric_scores={"consistency": score},
+            metric_scores=metric_scores,
             metadata={
                 "research_ref": "[2024.findings-emnlp.935]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "details": metrics["details"],
+                "detected_languages": metrics.get("detected", {}),
             },
         )
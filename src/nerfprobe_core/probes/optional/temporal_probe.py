@@ -0,0 +1,259 @@
+"""
+TemporalProbe - Effective knowledge cutoff via binary search over dated events.
+
+A served model whose knowledge boundary moves away from the advertised
+cutoff is a strong sign of a silent model swap.
+
+Requires: a local JSONL event file with "date", "question" and "answer" fields.
+It has no default, so the probe is not part of any CLI tier.
+"""
+
+import asyncio
+import functools
+import json
+import math
+import os
+import random
+import re
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from nerfprobe_core.core import (
+    CostEstimate,
+    LLMGateway,
+    ModelTarget,
+    ProbeResult,
+    ProbeType,
+    copy_plain,
+    extract_usage,
+    sum_tokens,
+)
+from nerfprobe_core.core.estimator import exceeds_budget
+from nerfprobe_core.models import get_model_info
+from nerfprobe_core.probes.config import TemporalConsistencyConfig
+from nerfprobe_core.probes.seeding import probe_rng
+
+_NUMBERED_LINE = re.compile(r"^\W*(\d+)\s*[:.)\-]\s*(.*)$", re.MULTILINE)
+_NON_WORD = re.compile(r"[^\w\s]")
+
+_PROMPT_HEADER = (
+    "Answer each question briefly from your own knowledge. "
+    "Reply with one line per question in the form '<number>: <answer>'. "
+    "If you do not know, answer 'unknown'.\n\n"
+)
+
+_INPUT_TOKENS_PER_QUESTION = 40
+_OUTPUT_TOKENS_PER_QUESTION = 15
+
+
+def _month_index(d: date) -> int:
+    return d.year * 12 + d.month - 1
+
+
+def _month_start(index: int) -> date:
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_end(index: int) -> date:
+    return _month_start(index + 1) - timedelta(days=1)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def load_events(path: str | Path) -> dict[int, list[dict[str, Any]]]:
+    """Load a JSONL event file grouped by month index."""
+    months: dict[int, list[dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            when = date.fromisoformat(str(event["date"])[:10])
+            months.setdefault(_month_index(when), []).append(event)
+    return months
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_events(path: str, mtime_ns: int) -> dict[int, list[dict[str, Any]]]:
+    return load_events(path)
+
+
+def _read_events(path: str) -> dict[int, list[dict[str, Any]]]:
+    """load_events() cached by (path, mtime); the result is shared, so treat it as read-only."""
+    return _cached_events(path, os.stat(path).st_mtime_ns)
+
+
+class TemporalProbe:
+    """
+    Estimates the served model's effective knowledge cutoff.
+
+    Months in the window around the expected cutoff are binary-searched for
+    the last month the model still answers correctly, so a 25-month window
+    costs about five batched requests instead of a full sweep.
+    """
+
+    def __init__(self, config: TemporalConsistencyConfig):
+        self._config = config
+        self._config_dump = config.model_dump()
+
+    @property
+    def config(self) -> TemporalConsistencyConfig:
+        return self._config
+
+    @property
+    def estimated_cost(self) -> CostEstimate:
+        steps = math.ceil(math.log2(2 * self._config.window_months + 2))
+        per_step = self._config.questions_per_step
+        return CostEstimate(
+            input_tokens=steps * (50 + per_step * _INPUT_TOKENS_PER_QUESTION),
+            output_tokens=steps * per_step * _OUTPUT_TOKENS_PER_QUESTION,
+        )
+
+    def _expected_cutoff(self, target: ModelTarget) -> date | None:
+        if self._config.cutoff_date is not None:
+            return self._config.cutoff_date
+        info = get_model_info(target.model_name)
+        return info.knowledge_cutoff if info else None
+
+    def _is_correct(self, answer: str, expected: str) -> bool:
+        got, want = _normalize(answer), _normalize(expected)
+        if not got or not want:
+            return False
+        if self._config.strict_event_check:
+            return got == want
+        return f" {want} " in f" {got} "
+
+    async def _ask_month(
+        self,
+        target: ModelTarget,
+        generator: LLMGateway,
+        events: list[dict[str, Any]],
+        rng: random.Random,
+    ) -> tuple[float, int | None, int | None]:
+        """Ask one month's sampled questions in a single request; returns (accuracy, in, out)."""
+        batch = rng.sample(events, min(self._config.questions_per_step, len(events)))
+        questions = "\n".join(f"{i}: {event['question']}" for i, event in enumerate(batch, 1))
+        response = await generator.generate(target, _PROMPT_HEADER + questions)
+        input_tokens, output_tokens = extract_usage(response)
+
+        answers = {int(num): text.strip() for num, text in _NUMBERED_LINE.findall(str(response))}
+        correct = sum(self._is_correct(answers.get(i, ""), str(event["answer"])) for i, event in enumerate(batch, 1))
+        return correct / len(batch), input_tokens, output_tokens
+
+    def _failure(self, target: ModelTarget, reason: str, raw_response: str, latency_ms: float) -> ProbeResult:
+        return ProbeResult(
+            probe_name=self.config.name,
+            probe_type=ProbeType.TEMPORAL,
+            target=target,
+            passed=False,
+            score=0.0,
+            latency_ms=latency_ms,
+            raw_response=raw_response,
+            error_reason=reason,
+            metadata={"error": raw_response},
+        )
+
+    async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if exceeds_budget(self, target):
+            return ProbeResult(
+                probe_name=self.config.name,
+                probe_type=ProbeType.TEMPORAL,
+                target=target,
+                passed=False,
+                score=0.0,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Exceeds token budget",
+                metadata={"error": "Token budget exceeded"},
+            )
+
+        expected = self._expected_cutoff(target)
+        if expected is None:
+            return self._failure(target, "No cutoff", "ERROR: No expected knowledge cutoff for model", 0.0)
+        if self.config.events_path is None:
+            return self._failure(target, "No events", "ERROR: events_path is not configured", 0.0)
+
+        center = _month_index(expected)
+        window = self.config.window_months
+        try:
+            events = await asyncio.to_thread(_read_events, self.config.events_path)
+        except (OSError, ValueError, KeyError) as e:
+            return self._failure(target, "Bad events", f"ERROR: Cannot load events: {e!s}", 0.0)
+        months = sorted(m for m in events if center - window <= m <= center + window)
+        if not months:
+            return self._failure(target, "No events", "ERROR: No events within the search window", 0.0)
+
+        seed, rng = probe_rng(self.config.seed)
+        start = time.perf_counter()
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
+        trace: list[dict[str, Any]] = []
+
+        # Last known month index into `months`; -1 = nothing in the window is known
+        lo, hi, last_known = 0, len(months) - 1, -1
+        try:
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                accuracy, in_tok, out_tok = await self._ask_month(target, generator, events[months[mid]], rng)
+                total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                total_output_tokens = sum_tokens(total_output_tokens, out_tok)
+                known = accuracy >= self.config.known_threshold
+                trace.append({"month": _month_start(months[mid]).isoformat()[:7], "accuracy": accuracy})
+                if known:
+                    last_known = mid
+                    lo = mid + 1
+                else:
+                    hi = mid - 1
+        except Exception as e:
+            err_msg = str(e)
+            reason = "Error"
+            if "429" in err_msg:
+                reason = "Rate Limit"
+            elif "401" in err_msg:
+                reason = "Auth Error"
+            elif "500" in err_msg or "503" in err_msg:
+                reason = "Server Error"
+            return self._failure(target, reason, f"ERROR: {e!s}", (time.perf_counter() - start) * 1000)
+
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        if last_known >= 0:
+            effective = _month_end(months[last_known])
+        else:
+            effective = _month_start(months[0]) - timedelta(days=1)
+        shift_days = (effective - expected).days
+        passed = abs(shift_days) <= self.config.tolerance_days
+        score = max(0.0, 1.0 - abs(shift_days) / max(1, window * 30))
+
+        failure_reason = None
+        if not passed:
+            direction = "later" if shift_days > 0 else "earlier"
+            failure_reason = f"Knowledge cutoff {abs(shift_days)} days {direction} than expected ({expected})"
+
+        return ProbeResult(
+            probe_name=self.config.name,
+            probe_type=ProbeType.TEMPORAL,
+            target=target,
+            passed=passed,
+            score=score,
+            latency_ms=latency_ms,
+            raw_response=f"Effective cutoff {effective.isoformat()} (expected {expected.isoformat()})",
+            input_tokens=total_input_tokens,
+            output_tokens=total_output_tokens,
+            error_reason=failure_reason,
+            metric_scores={
+                "cutoff_shift_days": float(shift_days),
+                "requests": float(len(trace)),
+            },
+            metadata={
+                "research_ref": "Dated-event knowledge cutoff search",
+                "config": copy_plain(self._config_dump),
+                "seed": seed,
+                "expected_cutoff": expected.isoformat(),
+                "effective_cutoff": effective.isoformat(),
+                "search_trace": trace,
+            },
+        )
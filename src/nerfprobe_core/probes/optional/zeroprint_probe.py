@@ -13,6 +13,9 @@ from nerfprobe_core.core import (
     ModelTarget,
     ProbeResult,
     ProbeType,
+    copy_plain,
+    extract_usage,
+    sum_tokens,
 )
 from nerfprobe_core.probes.config import ZeroPrintProbeConfig
 from nerfprobe_core.scorers.entropy import EntropyScorer
@@ -26,6 +29,7 @@ class ZeroPrintProbe:
 
     def __init__(self, config: ZeroPrintProbeConfig):
         self._config = config
+        self._config_dump = config.model_dump()
         self._scorer = EntropyScorer()
 
     @property
@@ -42,8 +46,8 @@ class ZeroPrintProbe:
     async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
         start_global = time.perf_counter()
         responses: list[str] = []
-        total_input_tokens = 0
-        total_output_tokens = 0
+        total_input_tokens: int | None = None
+        total_output_tokens: int | None = None
 
         # Iterative Generation
         for _ in range(self.config.iterations):
@@ -51,22 +55,23 @@ class ZeroPrintProbe:
                 # Try logprobs if required and supported
                 if getattr(self.config, "require_logprobs", False) and hasattr(generator, "generate_with_logprobs"):
                     result = await generator.generate_with_logprobs(target, self.config.prompt)
-                    total_input_tokens += getattr(result, "input_tokens", 0) or 0
-                    total_output_tokens += getattr(result, "output_tokens", 0) or 0
+                    in_tok, out_tok = extract_usage(result)
+                    total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                    total_output_tokens = sum_tokens(total_output_tokens, out_tok)
                     resp = result.text
                 else:
                     resp = await generator.generate(target, self.config.prompt)
-                    u = getattr(resp, "usage", {})
-                    total_input_tokens += u.get("prompt_tokens", 0)
-                    total_output_tokens += u.get("completion_tokens", 0)
+                    in_tok, out_tok = extract_usage(resp)
+                    total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                    total_output_tokens = sum_tokens(total_output_tokens, out_tok)
                 responses.append(resp)
             except NotImplementedError:
                 # Fallback if gateway doesn't support logprobs
                 try:
                     resp = await generator.generate(target, self.config.prompt)
-                    u = getattr(resp, "usage", {})
-                    total_input_tokens += u.get("prompt_tokens", 0)
-                    total_output_tokens += u.get("completion_tokens", 0)
+                    in_tok, out_tok = extract_usage(resp)
+                    total_input_tokens = sum_tokens(total_input_tokens, in_tok)
+                    total_output_tokens = sum_tokens(total_output_tokens, out_tok)
                     responses.append(resp)
                 except Exception as e:
                     responses.append(f"ERROR: {e!s}")
@@ -98,7 +103,7 @@ class ZeroPrintProbe:
             },
             metadata={
                 "research_ref": "[2407.01235]",
-                "config": self.config.model_dump(),
+                "config": copy_plain(self._config_dump),
                 "distribution": metrics["_metadata"].get("distribution", {}),
             },
         )
@@ -0,0 +1,178 @@
+"""
+Probe class registry and config-driven probe construction.
+
+Probes are registered as "module:Class" strings and imported on first
+lookup, so selecting one probe never imports the others. Third-party
+probes are discovered through the "nerfprobe.probes" entry-point group,
+e.g. in the plugin's pyproject.toml:
+
+    [project.entry-points."nerfprobe.probes"]
+    my_probe = "my_package.probes:MyProbe"
+
+Entry points are listed without being loaded; a plugin module is imported
+only when its key is looked up.
+"""
+
+import importlib
+from collections.abc import Iterator, Mapping
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any
+
+from nerfprobe_core.core.scorer import ProbeProtocol
+from nerfprobe_core.probes.config import BaseProbeConfig
+
+ENTRY_POINT_GROUP = "nerfprobe.probes"
+
+# Built-in probes: registry key -> "module:Class"
+BUILTIN_PROBES: dict[str, str] = {
+    # Core
+    "math": "nerfprobe_core.probes.core.math_probe:MathProbe",
+    "style": "nerfprobe_core.probes.core.style_probe:StyleProbe",
+    "timing": "nerfprobe_core.probes.core.timing_probe:TimingProbe",
+    "code": "nerfprobe_core.probes.core.code_probe:CodeProbe",
+    "fact": "nerfprobe_core.probes.core.fact_probe:FactProbe",
+    # Advanced
+    "fingerprint": "nerfprobe_core.probes.advanced.fingerprint_probe:FingerprintProbe",
+    "context": "nerfprobe_core.probes.advanced.context_probe:ContextProbe",
+    "routing": "nerfprobe_core.probes.advanced.routing_probe:RoutingProbe",
+    "repetition": "nerfprobe_core.probes.advanced.repetition_probe:RepetitionProbe",
+    "constraint": "nerfprobe_core.probes.advanced.constraint_probe:ConstraintProbe",
+    "logic": "nerfprobe_core.probes.advanced.logic_probe:LogicProbe",
+    "cot": "nerfprobe_core.probes.advanced.cot_probe:ChainOfThoughtProbe",
+    "json": "nerfprobe_core.probes.advanced.json_probe:JsonProbe",
+    "consistency": "nerfprobe_core.probes.advanced.consistency_probe:ConsistencyProbe",
+    # Optional
+    "calibration": "nerfprobe_core.probes.optional.calibration_probe:CalibrationProbe",
+    "zeroprint": "nerfprobe_core.probes.optional.zeroprint_probe:ZeroPrintProbe",
+    "multilingual": "nerfprobe_core.probes.optional.multilingual_probe:MultilingualProbe",
+    "temporal": "nerfprobe_core.probes.optional.temporal_probe:TemporalProbe",
+}
+
+# Config class name -> registry key, used to build a probe from its config alone
+CONFIG_KEYS: dict[str, str] = {
+    "MathProbeConfig": "math",
+    "StyleProbeConfig": "style",
+    "TimingProbeConfig": "timing",
+    "CodeProbeConfig": "code",
+    "FactProbeConfig": "fact",
+    "FingerprintProbeConfig": "fingerprint",
+    "ContextProbeConfig": "context",
+    "RoutingProbeConfig": "routing",
+    "RepetitionProbeConfig": "repetition",
+    "ConstraintProbeConfig": "constraint",
+    "LogicPuzzleProbeConfig": "logic",
+    "ChainOfThoughtProbeConfig": "cot",
+    "JsonProbeConfig": "json",
+    "ConsistencyProbeConfig": "consistency",
+    "CalibrationProbeConfig": "calibration",
+    "ZeroPrintProbeConfig": "zeroprint",
+    "MultilingualProbeConfig": "multilingual",
+    "TemporalConsistencyConfig": "temporal",
+}
+
+
+def _import_spec(spec: str) -> type[Any]:
+    module_name, _, attr = spec.partition(":")
+    obj: type[Any] = getattr(importlib.import_module(module_name), attr)
+    return obj
+
+
+class ProbeRegistry(Mapping[str, type[Any]]):
+    """
+    Mapping of probe key to probe class that imports classes on first lookup.
+
+    Keys, `in` and iteration never import probe modules. Built-ins take
+    precedence over entry points with the same name.
+    """
+
+    def __init__(self, specs: Mapping[str, str], group: str | None = ENTRY_POINT_GROUP):
+        self._specs: dict[str, str | EntryPoint | type[Any]] = dict(specs)
+        self._classes: dict[str, type[Any]] = {}
+        self._group = group
+        self._scanned = group is None
+
+    def _scan_entry_points(self) -> None:
+        if self._scanned:
+            return
+        self._scanned = True
+        assert self._group is not None
+        for ep in entry_points(group=self._group):
+            self._specs.setdefault(ep.name, ep)
+
+    def register(self, key: str, probe: str | type[Any]) -> None:
+        """Register a probe class or a lazy "module:Class" spec under `key`."""
+        self._specs[key] = probe
+        self._classes.pop(key, None)
+
+    def spec(self, key: str) -> str:
+        """Import spec of a registered probe, without importing it."""
+        if key not in self._specs:
+            self._scan_entry_points()
+        target = self._specs[key]
+        if isinstance(target, EntryPoint):
+            return target.value
+        if isinstance(target, str):
+            return target
+        return f"{target.__module__}:{target.__qualname__}"
+
+    def __getitem__(self, key: str) -> type[Any]:
+        cls = self._classes.get(key)
+        if cls is not None:
+            return cls
+        if key not in self._specs:
+            self._scan_entry_points()
+        target = self._specs[key]
+        if isinstance(target, EntryPoint):
+            cls = target.load()
+        elif isinstance(target, str):
+            cls = _import_spec(target)
+        else:
+            cls = target
+        self._classes[key] = cls
+        return cls
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._specs:
+            return True
+        self._scan_entry_points()
+        return key in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan_entry_points()
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        self._scan_entry_points()
+        return len(self._specs)
+
+
+# Probe class registry
+PROBE_REGISTRY = ProbeRegistry(BUILTIN_PROBES)
+
+
+def probe_key_for_config(config: BaseProbeConfig) -> str:
+    """
+    Registry key of the probe that consumes this config. A `probe_key` class
+    attribute wins (so plugin subclasses of built-in configs route to the
+    plugin); otherwise subclasses resolve to their built-in base.
+    """
+    key = getattr(type(config), "probe_key", None)
+    if isinstance(key, str):
+        return key
+    for cls in type(config).__mro__:
+        if cls.__name__ in CONFIG_KEYS:
+            return CONFIG_KEYS[cls.__name__]
+    raise KeyError(f"No registered probe for config type {type(config).__name__}")
+
+
+def create_probe(config: BaseProbeConfig, key: str | None = None) -> ProbeProtocol:
+    """
+    Instantiate a registered probe.
+
+    Args:
+        config: Probe configuration.
+        key: Registry key; inferred from the config type if omitted.
+    """
+    probe_cls = PROBE_REGISTRY[key or probe_key_for_config(config)]
+    probe: ProbeProtocol = probe_cls(config)
+    return probe
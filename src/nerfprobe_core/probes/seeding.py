@@ -0,0 +1,24 @@
+"""Seed handling for reproducible randomized prompt material."""
+
+import random
+
+_SYSTEM_RANDOM = random.SystemRandom()
+
+
+def resolve_seed(seed: int | None) -> int:
+    """
+    Return the seed to use for one probe run.
+
+    A configured seed is used as-is so prompts are identical across runs and
+    targets. Without one, a fresh seed is drawn; probes record it in result
+    metadata so the run can be replayed exactly.
+    """
+    if seed is not None:
+        return seed
+    return _SYSTEM_RANDOM.randrange(2**32)
+
+
+def probe_rng(seed: int | None) -> tuple[int, random.Random]:
+    """Resolve a seed and return it with a probe-local Random instance."""
+    resolved = resolve_seed(seed)
+    return resolved, random.Random(resolved)
@@ -0,0 +1,25 @@
+"""Utility probes - wrappers that run other probes.
+
+Probe modules are imported on first attribute access.
+"""
+
+from typing import TYPE_CHECKING
+
+from nerfprobe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from nerfprobe_core.probes.utility.comparison_probe import ComparisonProbe
+    from nerfprobe_core.probes.utility.sequential_probe import SequentialProbe
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ComparisonProbe": "nerfprobe_core.probes.utility.comparison_probe",
+        "SequentialProbe": "nerfprobe_core.probes.utility.sequential_probe",
+    },
+)
+
+__all__ = [
+    "ComparisonProbe",
+    "SequentialProbe",
+]
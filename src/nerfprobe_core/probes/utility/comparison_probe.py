@@ -0,0 +1,173 @@
+"""
+ComparisonProbe - Paired target vs reference runs in the same time window.
+
+Running both models concurrently per trial cancels out provider-wide load
+and time-of-day effects that separate sweeps would confound with a nerf.
+"""
+
+import asyncio
+import math
+import time
+
+from nerfprobe_core.core import (
+    CostEstimate,
+    LLMGateway,
+    ModelTarget,
+    ProbeResult,
+    ProbeType,
+    copy_plain,
+    sum_tokens,
+)
+from nerfprobe_core.core.estimator import exceeds_budget
+from nerfprobe_core.probes.config import ComparisonProbeConfig
+from nerfprobe_core.probes.registry import create_probe, probe_key_for_config
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def _stderr(values: list[float]) -> float:
+    """Standard error of the mean (0.0 for fewer than two values)."""
+    if len(values) < 2:
+        return 0.0
+    m = _mean(values)
+    return math.sqrt(sum((v - m) ** 2 for v in values) / (len(values) - 1) / len(values))
+
+
+class ComparisonProbe:
+    """
+    Runs a wrapped probe against the target and a reference model concurrently.
+    Reports paired score, latency and token deltas (target minus reference).
+    """
+
+    def __init__(self, config: ComparisonProbeConfig):
+        self._config = config
+        self._config_dump = config.model_dump()
+        self._probe_key = probe_key_for_config(config.wrapped_probe_config)
+        # Separate instances so per-probe caches never interleave across models
+        self._target_probe = create_probe(config.wrapped_probe_config, self._probe_key)
+        self._reference_probe = create_probe(config.wrapped_probe_config, self._probe_key)
+
+    @property
+    def config(self) -> ComparisonProbeConfig:
+        return self._config
+
+    @property
+    def reference(self) -> ModelTarget:
+        return ModelTarget(
+            provider_id=self._config.reference_provider_id,
+            model_name=self._config.reference_model_name,
+        )
+
+    @property
+    def estimated_cost(self) -> CostEstimate:
+        per_run = self._target_probe.estimated_cost
+        runs = 2 * self._config.paired_trials
+        return CostEstimate(input_tokens=per_run.input_tokens * runs, output_tokens=per_run.output_tokens * runs)
+
+    async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        if exceeds_budget(self, target):
+            return ProbeResult(
+                probe_name=self.config.name,
+                probe_type=ProbeType.COMPARISON,
+                target=target,
+                passed=False,
+                score=0.0,
+                latency_ms=0.0,
+                raw_response="SKIPPED: Exceeds token budget",
+                metadata={"error": "Token budget exceeded"},
+            )
+
+        start = time.perf_counter()
+        reference = self.reference
+        score_deltas: list[float] = []
+        latency_deltas: list[float] = []
+        token_deltas: list[float] = []
+        trials: list[dict[str, float | bool]] = []
+        dropped: list[str] = []  # Pairs where either side errored or was skipped
+        research_ref = None
+        input_tokens: int | None = None
+        output_tokens: int | None = None
+
+        for _ in range(max(1, self._config.paired_trials)):
+            ours, theirs = await asyncio.gather(
+                self._target_probe.run(target, generator),
+                self._reference_probe.run(reference, generator),
+            )
+            research_ref = research_ref or ours.metadata.get("research_ref")
+            ours_tokens = (ours.input_tokens or 0) + (ours.output_tokens or 0)
+            theirs_tokens = (theirs.input_tokens or 0) + (theirs.output_tokens or 0)
+            input_tokens = sum_tokens(input_tokens, ours.input_tokens, theirs.input_tokens)
+            output_tokens = sum_tokens(output_tokens, ours.output_tokens, theirs.output_tokens)
+
+            # A broken side says nothing about the gap between the models
+            if not ours.is_valid or not theirs.is_valid:
+                broken = ours if not ours.is_valid else theirs
+                side = "target" if broken is ours else "reference"
+                dropped.append(f"{side}: {broken.raw_response[:100]}")
+                continue
+
+            # Positive score delta = target scores lower than the reference
+            score_deltas.append(theirs.score - ours.score)
+            latency_deltas.append(ours.latency_ms - theirs.latency_ms)
+            token_deltas.append(float(ours_tokens - theirs_tokens))
+            trials.append(
+                {
+                    "target_score": ours.score,
+                    "reference_score": theirs.score,
+                    "target_passed": ours.passed,
+                    "reference_passed": theirs.passed,
+                    "target_latency_ms": ours.latency_ms,
+                    "reference_latency_ms": theirs.latency_ms,
+                }
+            )
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        score_delta = _mean(score_deltas)
+        latency_delta = _mean(latency_deltas)
+        token_delta = _mean(token_deltas)
+
+        score_ok = score_delta <= self._config.threshold_score_delta
+        latency_ok = latency_delta <= self._config.threshold_latency_delta_ms
+        passed = score_ok and latency_ok
+
+        failure_reason = None
+        if not trials:
+            passed = False
+            failure_reason = f"No valid paired trials ({len(dropped)} dropped)"
+        elif not score_ok:
+            failure_reason = f"Score -{score_delta:.2f} vs {reference}"
+        elif not latency_ok:
+            failure_reason = f"Latency +{latency_delta:.0f}ms vs {reference}"
+
+        return ProbeResult(
+            probe_name=self.config.name,
+            probe_type=ProbeType.COMPARISON,
+            target=target,
+            passed=passed,
+            score=max(0.0, min(1.0, 1.0 - score_delta)) if trials else 0.0,
+            latency_ms=latency_ms,
+            raw_response=f"Compared {self._probe_key} against {reference} over {len(trials)} paired trials",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            error_reason=failure_reason,
+            metric_scores={
+                "score_delta": score_delta,
+                "score_delta_stderr": _stderr(score_deltas),
+                "latency_delta_ms": latency_delta,
+                "latency_delta_stderr_ms": _stderr(latency_deltas),
+                "token_delta": token_delta,
+                "trials": float(len(trials)),
+                "dropped_trials": float(len(dropped)),
+            },
+            metadata={
+                # Paired design; the findings come from the wrapped probe's reference
+                "research_ref": research_ref or "Paired target/reference comparison",
+                "config": copy_plain(self._config_dump),
+                "wrapped_probe": self._probe_key,
+                "reference": str(reference),
+                "trials": trials,
+                "dropped_trials": dropped,
+            },
+        )
@@ -0,0 +1,254 @@
+"""
+SequentialProbe - Early-stopping degraded/healthy decisions over repeated runs.
+
+Ref: Wald (1945) Sequential Tests of Statistical Hypotheses.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+
+from nerfprobe_core.core import (
+    CostEstimate,
+    LLMGateway,
+    ModelTarget,
+    ProbeResult,
+    ProbeType,
+    copy_plain,
+    sum_tokens,
+)
+from nerfprobe_core.core.estimator import expected_cost
+from nerfprobe_core.probes.config import SequentialTestConfig
+from nerfprobe_core.probes.registry import create_probe
+
+DEGRADED = "degraded"
+HEALTHY = "healthy"
+INCONCLUSIVE = "inconclusive"
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta (Lentz's method)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def beta_cdf(x: float, a: float, b: float) -> float:
+    """Regularized incomplete beta I_x(a, b), i.e. the Beta(a, b) CDF."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    front = math.exp(log_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+@dataclass
+class SequentialTest:
+    """
+    Pure sequential decision logic over outcomes in [0, 1].
+
+    SPRT accumulates the Bernoulli log-likelihood ratio of degraded (p1) vs
+    baseline (p0) and stops at Wald's boundaries. The Bayesian variant keeps
+    a Beta(1, 1) posterior and stops once the posterior mass on either side
+    of the midpoint between p0 and p1 reaches the configured confidence.
+    """
+
+    p0: float
+    p1: float
+    alpha: float
+    beta: float
+    method: str = "sprt"
+    successes: float = 0.0
+    failures: float = 0.0
+    llr: float = 0.0
+    outcomes: list[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.p1 < self.p0 < 1.0:
+            raise ValueError("Require 0 < degraded_pass_rate < baseline_pass_rate < 1")
+        if self.method not in ("sprt", "bayes"):
+            raise ValueError(f"Unknown sequential method: {self.method!r}")
+
+    @property
+    def upper_boundary(self) -> float:
+        """Decide degraded at or above this (LLR, or posterior P(degraded))."""
+        if self.method == "sprt":
+            return math.log((1.0 - self.beta) / self.alpha)
+        return 1.0 - self.alpha
+
+    @property
+    def lower_boundary(self) -> float:
+        """Decide healthy at or below this (LLR, or posterior P(degraded))."""
+        if self.method == "sprt":
+            return math.log(self.beta / (1.0 - self.alpha))
+        return self.beta
+
+    @property
+    def statistic(self) -> float:
+        """Current LLR (sprt) or posterior probability of degradation (bayes)."""
+        if self.method == "sprt":
+            return self.llr
+        threshold = (self.p0 + self.p1) / 2.0
+        return beta_cdf(threshold, 1.0 + self.successes, 1.0 + self.failures)
+
+    @property
+    def samples(self) -> int:
+        return len(self.outcomes)
+
+    def update(self, outcome: float) -> str:
+        """Add one outcome and return the current decision."""
+        x = min(1.0, max(0.0, outcome))
+        self.outcomes.append(x)
+        self.successes += x
+        self.failures += 1.0 - x
+        self.llr += x * math.log(self.p1 / self.p0) + (1.0 - x) * math.log((1.0 - self.p1) / (1.0 - self.p0))
+        return self.decision
+
+    @property
+    def decision(self) -> str:
+        stat = self.statistic
+        if stat >= self.upper_boundary:
+            return DEGRADED
+        if stat <= self.lower_boundary:
+            return HEALTHY
+        return INCONCLUSIVE
+
+
+class SequentialProbe:
+    """
+    Runs a wrapped probe repeatedly and stops as soon as the evidence for
+    "degraded vs baseline" reaches the configured error rates.
+    """
+
+    def __init__(self, config: SequentialTestConfig):
+        self._config = config
+        self._config_dump = config.model_dump()
+        self._probe = create_probe(config.wrapped_probe_config)
+
+    @property
+    def config(self) -> SequentialTestConfig:
+        return self._config
+
+    @property
+    def estimated_cost(self) -> CostEstimate:
+        """Worst case: max_samples runs of the wrapped probe."""
+        per_run = self._probe.estimated_cost
+        return CostEstimate(
+            input_tokens=per_run.input_tokens * self._config.max_samples,
+            output_tokens=per_run.output_tokens * self._config.max_samples,
+        )
+
+    async def run(self, target: ModelTarget, generator: LLMGateway) -> ProbeResult:
+        start = time.perf_counter()
+        test = SequentialTest(
+            p0=self._config.baseline_pass_rate,
+            p1=self._config.degraded_pass_rate,
+            alpha=self._config.alpha,
+            beta=self._config.beta,
+            method=self._config.method,
+        )
+
+        per_run_tokens = expected_cost(self._probe, target).total_tokens
+        budget = self._config.max_tokens_per_run
+        probe_type = ProbeType.COMPARISON
+        input_tokens: int | None = None
+        output_tokens: int | None = None
+        spent = 0  # Actual tokens, or the estimate when a run reports no usage
+        runs = 0
+        errors = 0
+        excluded = 0  # Errored or skipped runs, left out of the test
+        budget_exhausted = False
+        decision = INCONCLUSIVE
+
+        while runs < self._config.max_samples:
+            if budget > 0 and spent + per_run_tokens > budget:
+                budget_exhausted = True
+                break
+
+            result = await self._probe.run(target, generator)
+            runs += 1
+            probe_type = result.probe_type
+            used = (result.input_tokens or 0) + (result.output_tokens or 0)
+            input_tokens = sum_tokens(input_tokens, result.input_tokens)
+            output_tokens = sum_tokens(output_tokens, result.output_tokens)
+            spent += used or per_run_tokens
+            errors += result.raw_response.startswith("ERROR")
+
+            # A rate limit or budget skip is not evidence of degradation
+            if not result.is_valid:
+                excluded += 1
+                if result.raw_response.startswith("SKIPPED"):
+                    break  # The wrapped probe will skip every time
+                continue
+
+            decision = test.update(result.score if self._config.use_score else float(result.passed))
+            if decision != INCONCLUSIVE and test.samples >= self._config.min_samples:
+                break
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        pass_rate = test.successes / test.samples if test.samples else 0.0
+        passed = decision != DEGRADED
+
+        reason = None
+        if test.samples == 0 and excluded:
+            passed = False
+            reason = f"No valid runs ({excluded} errored or skipped)"
+        elif decision == DEGRADED:
+            reason = f"Degraded after {test.samples} runs (pass rate {pass_rate:.2f})"
+        elif budget_exhausted:
+            reason = "Token budget exhausted before a decision"
+
+        return ProbeResult(
+            probe_name=self._config.name,
+            probe_type=probe_type,
+            target=target,
+            passed=passed,
+            score=pass_rate,
+            latency_ms=latency_ms,
+            raw_response=f"Sequential {self._config.method}: {decision} after {test.samples} runs",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            error_reason=reason,
+            metric_scores={
+                "samples_used": float(test.samples),
+                "pass_rate": pass_rate,
+                "statistic": test.statistic,
+                "upper_boundary": test.upper_boundary,
+                "lower_boundary": test.lower_boundary,
+            },
+            metadata={
+                "research_ref": "[Wald 1945] SPRT",
+                "config": copy_plain(self._config_dump),
+                "decision": decision,
+                "method": self._config.method,
+                "outcomes": test.outcomes,
+                "runs": runs,
+                "errors": errors,
+                "excluded": excluded,
+                "budget_exhausted": budget_exhausted,
+            },
+        )
@@ -4,11 +4,15 @@ from nerfprobe_core.scorers.calibration import CalibrationScorer
 from nerfprobe_core.scorers.code import CodeScorer
 from nerfprobe_core.scorers.constraint import ConstraintScorer
 from nerfprobe_core.scorers.cot import ChainOfThoughtScorer
+from nerfprobe_core.scorers.diversity import lexical_diversity
 from nerfprobe_core.scorers.entropy import EntropyScorer
+from nerfprobe_core.scorers.language import detect_language, detect_languages
 from nerfprobe_core.scorers.logic import LogicScorer
+from nerfprobe_core.scorers.loops import detect_loops
 from nerfprobe_core.scorers.math import MathScorer
 from nerfprobe_core.scorers.multilingual import MultilingualScorer
 from nerfprobe_core.scorers.repetition import RepetitionScorer
+from nerfprobe_core.scorers.segmentation import ScriptSegmenter, get_segmenter
 from nerfprobe_core.scorers.ttr import TTRScorer
 
 __all__ = [
@@ -25,4 +29,13 @@ __all__ = [
     "CalibrationScorer",
     "EntropyScorer",
     "MultilingualScorer",
+    # Lexical diversity
+    "lexical_diversity",
+    "detect_loops",
+    # Language detection
+    "detect_language",
+    "detect_languages",
+    # Segmentation
+    "ScriptSegmenter",
+    "get_segmenter",
 ]
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from nerfprobe_core.scorers.segmentation import Segmenter, get_segmenter
+
 
 class ConstraintScorer:
     """
@@ -10,6 +12,9 @@ class ConstraintScorer:
     - word_count: Check if word count is within [min, max]
     - negative: Check if response contains prohibited words
 
+    Words are counted with the "chars" segmenter by default: one per CJK
+    character, the usual unit for length limits in those languages.
+
     Ref: [2409.11055] Quantization trade-offs
     """
 
@@ -19,11 +24,13 @@ class ConstraintScorer:
         min_words: int | None = None,
         max_words: int | None = None,
         forbidden_words: list[str] | None = None,
+        segmenter: str | Segmenter = "chars",
     ):
         self.constraint_type = constraint_type
         self.min_words = min_words
         self.max_words = max_words
         self.forbidden_words = forbidden_words or []
+        self._segment = get_segmenter(segmenter)
 
     def score(self, response: str) -> float:
         """Return 1.0 if constraints met, 0.0 otherwise."""
@@ -51,7 +58,7 @@ class ConstraintScorer:
 
     def _count_words(self, text: str) -> int:
         """Count words in text."""
-        return len(text.split())
+        return len(self._segment(text))
 
     def _score_word_count(self, response: str) -> float:
         """Check if word count is within bounds."""
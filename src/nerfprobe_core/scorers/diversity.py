@@ -0,0 +1,156 @@
+"""
+Lexical diversity - length-robust vocabulary metrics from one frequency table.
+
+TTR falls as text gets longer, so short and long outputs are not
+comparable. These metrics are computed in linear time from the token
+stream and a single Counter of it (plus its frequency spectrum):
+
+- MTLD: mean length of token runs that keep TTR above 0.72, averaged
+  over a forward and a backward pass. Higher = more diverse.
+- HD-D: expected TTR of a random 42-token sample, from the
+  hypergeometric distribution. Higher = more diverse.
+- Yule's K: vocabulary concentration, independent of length. Higher =
+  more repetitive.
+- Compression ratio: raw bytes / zlib-compressed bytes. Looping text
+  compresses well, so higher = more repetitive.
+
+Ref: McCarthy & Jarvis (2010), Behavior Research Methods 42(2).
+"""
+
+import math
+import zlib
+from collections import Counter
+from collections.abc import Sequence
+
+# Metric name -> whether higher values mean more diverse text
+HIGHER_IS_BETTER: dict[str, bool] = {
+    "ttr": True,
+    "min_local_ttr": True,
+    "mtld": True,
+    "hdd": True,
+    "yules_k": False,
+    "compression_ratio": False,
+}
+
+MTLD_THRESHOLD = 0.72
+HDD_SAMPLE_SIZE = 42
+
+
+def _mtld_pass(tokens: Sequence[str], threshold: float) -> float:
+    factors = 0.0
+    types: set[str] = set()
+    count = 0
+    for token in tokens:
+        count += 1
+        types.add(token)
+        if len(types) <= threshold * count:
+            factors += 1
+            types.clear()
+            count = 0
+    if count:
+        # Partial factor for the unfinished run
+        factors += (1 - len(types) / count) / (1 - threshold)
+    return len(tokens) / factors if factors else float(len(tokens))
+
+
+def mtld(tokens: Sequence[str], threshold: float = MTLD_THRESHOLD) -> float:
+    """Measure of Textual Lexical Diversity (mean of forward and backward passes)."""
+    if not tokens:
+        return 0.0
+    return (_mtld_pass(tokens, threshold) + _mtld_pass(tokens[::-1], threshold)) / 2
+
+
+def hdd(spectrum: Counter[int], total: int, sample_size: int = HDD_SAMPLE_SIZE) -> float:
+    """
+    HD-D from a frequency spectrum (frequency -> number of types).
+
+    Each type contributes its probability of appearing in a random sample
+    of `sample_size` tokens, divided by the sample size. Texts shorter than
+    the sample are scored on a sample of their full length (i.e. TTR).
+    """
+    if not total:
+        return 0.0
+    s = min(sample_size, total)
+    log_all = math.lgamma(total + 1) - math.lgamma(total - s + 1)
+    expected_types = 0.0
+    for freq, types in spectrum.items():
+        rest = total - freq
+        # P(type absent from the sample) = C(N - f, s) / C(N, s)
+        p_absent = math.exp(math.lgamma(rest + 1) - math.lgamma(rest - s + 1) - log_all) if rest >= s else 0.0
+        expected_types += types * (1.0 - p_absent)
+    return expected_types / s
+
+
+def yules_k(spectrum: Counter[int], total: int) -> float:
+    """Yule's characteristic K = 10^4 * (sum m^2 V_m - N) / N^2."""
+    if not total:
+        return 0.0
+    return 1e4 * (sum(m * m * v for m, v in spectrum.items()) - total) / (total * total)
+
+
+def compression_ratio(text: str) -> float:
+    """UTF-8 size over zlib-compressed size (0.0 for empty text)."""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
+
+
+def lexical_diversity(tokens: Sequence[str], text: str, counts: Counter[str] | None = None) -> dict[str, float]:
+    """
+    MTLD, HD-D, Yule's K and compression ratio of a tokenized text.
+
+    Args:
+        tokens: Token stream (e.g. from a segmenter).
+        text: The text the tokens came from, for the compression ratio.
+        counts: Counter of `tokens`, if the caller already built one.
+    """
+    if counts is None:
+        counts = Counter(tokens)
+    spectrum = Counter(counts.values())
+    total = len(tokens)
+    return {
+        "mtld": mtld(tokens),
+        "hdd": hdd(spectrum, total),
+        "yules_k": yules_k(spectrum, total),
+        "compression_ratio": compression_ratio(text),
+    }
+
+
+def min_window_ttr(tokens: Sequence[str], window: int) -> float:
+    """
+    Lowest TTR over every run of `window` consecutive tokens.
+
+    The window's counts are updated as it slides, so this is O(n) rather
+    than O(n * window). Requires 0 < window <= len(tokens).
+    """
+    counts: dict[str, int] = {}
+    for token in tokens[:window]:
+        counts[token] = counts.get(token, 0) + 1
+    lowest = len(counts)
+    for old, new in zip(tokens, tokens[window:], strict=False):
+        if old == new:
+            continue
+        if counts[old] == 1:
+            del counts[old]
+        else:
+            counts[old] -= 1
+        counts[new] = counts.get(new, 0) + 1
+        if len(counts) < lowest:
+            lowest = len(counts)
+    return lowest / window
+
+
+def meets_threshold(metric: str, value: float, threshold: float) -> bool:
+    """Whether a metric value is on the diverse side of its threshold."""
+    return value >= threshold if HIGHER_IS_BETTER[metric] else value <= threshold
+
+
+__all__ = [
+    "HIGHER_IS_BETTER",
+    "compression_ratio",
+    "hdd",
+    "lexical_diversity",
+    "meets_threshold",
+    "min_window_ttr",
+    "mtld",
+    "yules_k",
+]
@@ -2,11 +2,16 @@ import json
 import re
 from typing import Any
 
-from jsonschema import ValidationError, validate
-
 from nerfprobe_core.core.scorer import ScorerProtocol
 
 
+def _validate(data: Any, schema: dict[str, Any]) -> None:
+    # jsonschema is slow to import; load it only when a schema is checked
+    from jsonschema import validate
+
+    validate(instance=data, schema=schema)
+
+
 class JsonScorer(ScorerProtocol):
     """
     Validates JSON structure and schema adherence.
@@ -50,10 +55,10 @@ class JsonScorer(ScorerProtocol):
             data = json.loads(json_text)
 
             if self.schema:
-                validate(instance=data, schema=self.schema)
+                _validate(data, self.schema)
 
             return 1.0
-        except (json.JSONDecodeError, ValidationError, Exception):
+        except Exception:  # JSONDecodeError or jsonschema ValidationError
             return 0.0
 
     def metrics(self, response: Any) -> dict[str, Any]:
@@ -73,7 +78,7 @@ class JsonScorer(ScorerProtocol):
         try:
             data = json.loads(json_text)
             if self.schema:
-                validate(instance=data, schema=self.schema)
+                _validate(data, self.schema)
             is_valid = True
         except Exception as e:
             errors.append(str(e))
@@ -0,0 +1,197 @@
+"""
+Language ID - Unicode script tables plus character trigram profiles.
+
+Scripts are counted by translating text through a precomputed BMP table
+that maps every code point to a one-letter script code, then counting the
+codes with str.count; a batch of responses is joined and translated in one
+call. Languages that share the Latin script are told apart by rank-weighted
+trigram profiles bundled in data/language_profiles.json; the rest follow
+from the script (kana separates Japanese from Chinese).
+"""
+
+import functools
+import json
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+# Script code -> name
+SCRIPTS: dict[str, str] = {
+    "L": "Latin",
+    "C": "Cyrillic",
+    "G": "Greek",
+    "A": "Arabic",
+    "H": "Hebrew",
+    "D": "Devanagari",
+    "T": "Thai",
+    "O": "Hangul",
+    "J": "Hiragana",
+    "K": "Katakana",
+    "Z": "Han",
+}
+
+_SCRIPT_RANGES: dict[str, tuple[tuple[int, int], ...]] = {
+    "L": ((0x41, 0x5A), (0x61, 0x7A), (0xC0, 0xD6), (0xD8, 0xF6), (0xF8, 0x24F), (0x1E00, 0x1EFF),
+          (0xFF21, 0xFF3A), (0xFF41, 0xFF5A)),
+    "G": ((0x370, 0x3FF), (0x1F00, 0x1FFF)),
+    "C": ((0x400, 0x52F),),
+    "H": ((0x591, 0x5F4),),
+    "A": ((0x600, 0x6FF), (0x750, 0x77F), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)),
+    "D": ((0x900, 0x97F),),
+    "T": ((0xE00, 0xE7F),),
+    "O": ((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)),
+    "J": ((0x3040, 0x309F),),
+    "K": ((0x30A0, 0x30FF), (0x31F0, 0x31FF), (0xFF66, 0xFF9F)),
+    "Z": ((0x3005, 0x3005), (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)),
+}  # fmt: skip
+
+# Language code -> scripts a response in that language is written in
+LANGUAGE_SCRIPTS: dict[str, frozenset[str]] = {
+    **{lang: frozenset("L") for lang in ("en", "fr", "de", "es", "pt", "it", "nl", "sv", "pl", "tr", "vi", "id")},
+    **{lang: frozenset("C") for lang in ("ru", "uk", "bg", "sr")},
+    "el": frozenset("G"),
+    "ar": frozenset("A"),
+    "fa": frozenset("A"),
+    "he": frozenset("H"),
+    "hi": frozenset("D"),
+    "th": frozenset("T"),
+    "ko": frozenset("OZ"),
+    "ja": frozenset("JKZ"),
+    "zh": frozenset("Z"),
+}
+
+# Single-script languages identified by script alone
+_SCRIPT_LANGUAGE = {"C": "ru", "G": "el", "A": "ar", "H": "he", "D": "hi", "T": "th", "O": "ko"}
+# Scripts of Chinese, Japanese and Korean text
+_CJK = "OJKZ"
+
+_SEPARATOR = "\x00"
+_NON_LETTER = re.compile(r"[\W\d_]+")
+# Leading characters scored against the trigram profiles; more adds time, not accuracy
+_RANK_CHARS = 600
+_PROFILES_PATH = Path(__file__).parent / "data" / "language_profiles.json"
+
+
+@functools.cache
+def _script_table() -> str:
+    """BMP code point -> script code ('.' for none); built on first use."""
+    table = ["."] * 0x10000
+    for code, ranges in _SCRIPT_RANGES.items():
+        for lo, hi in ranges:
+            table[lo : hi + 1] = [code] * (hi - lo + 1)
+    table[ord(_SEPARATOR)] = _SEPARATOR
+    return "".join(table)
+
+
+@functools.cache
+def _profiles() -> tuple[tuple[str, ...], dict[str, tuple[float, ...]]]:
+    """
+    (languages, trigram -> Zipf weight per language) from the bundled
+    ranked lists, merged so each trigram of a text is one dict lookup.
+    """
+    data: dict[str, list[str]] = json.loads(_PROFILES_PATH.read_text(encoding="utf-8"))["profiles"]
+    languages = tuple(data)
+    weights: dict[str, list[float]] = {}
+    for i, grams in enumerate(data.values()):
+        top = math.log(len(grams) + 1)
+        for rank, g in enumerate(grams):
+            weights.setdefault(g, [0.0] * len(languages))[i] = top - math.log(rank + 1)
+    return languages, {g: tuple(w) for g, w in weights.items()}
+
+
+def trigrams(text: str) -> list[str]:
+    """Lowercased letter trigrams with word boundaries marked by spaces."""
+    t = f" {_NON_LETTER.sub(' ', text.lower()).strip()} "
+    return [t[i : i + 3] for i in range(len(t) - 2)]
+
+
+@dataclass(frozen=True, slots=True)
+class LanguageGuess:
+    """Detection result for one text."""
+
+    language: str | None  # ISO 639-1 code, None if undetermined
+    script: str | None  # Dominant script name
+    script_counts: dict[str, int]  # Script code -> letters
+    confidence: float  # 0-1
+
+    @property
+    def letters(self) -> int:
+        return sum(self.script_counts.values())
+
+    def purity(self, scripts: frozenset[str]) -> float:
+        """Share of letters written in any of the given script codes."""
+        total = self.letters
+        return sum(self.script_counts.get(s, 0) for s in scripts) / total if total else 0.0
+
+
+def _rank_latin(text: str) -> tuple[str | None, float]:
+    """Best-scoring profiled language and its margin over the runner-up."""
+    languages, weights = _profiles()
+    hits = [w for w in map(weights.get, trigrams(text[:_RANK_CHARS])) if w]
+    if not hits:
+        return None, 0.0
+    scores = sorted(zip(map(sum, zip(*hits, strict=True)), languages, strict=True), reverse=True)
+    best, lang = scores[0]
+    if best <= 0:
+        return None, 0.0
+    runner_up = scores[1][0] if len(scores) > 1 else 0.0
+    return lang, 1.0 - runner_up / best
+
+
+def _guess(text: str, translated: str) -> LanguageGuess:
+    counts = {code: n for code in SCRIPTS if (n := translated.count(code))}
+    total = sum(counts.values())
+    if not total:
+        return LanguageGuess(None, None, counts, 0.0)
+
+    # Han, kana and Hangul compete as one block: Japanese splits its letters
+    # across Hiragana, Katakana and Han, and Korean may mix Hanja into Hangul
+    cjk = sum(counts.get(code, 0) for code in _CJK)
+    dominant = max(counts, key=lambda code: cjk if code in _CJK else counts[code])
+    purity = counts[dominant] / total
+
+    if dominant in _CJK:
+        kana = counts.get("J", 0) + counts.get("K", 0)
+        hangul = counts.get("O", 0)
+        # Japanese mixes kana into Han text; Chinese has essentially none
+        if hangul > kana and hangul >= 0.1 * cjk:
+            cjk_language = "ko"
+        else:
+            cjk_language = "ja" if kana >= 0.1 * cjk else "zh"
+        script = max((code for code in _CJK if code in counts), key=counts.__getitem__)
+        return LanguageGuess(cjk_language, SCRIPTS[script], counts, cjk / total)
+    if dominant == "L":
+        latin_language, margin = _rank_latin(text)
+        return LanguageGuess(latin_language, SCRIPTS[dominant], counts, purity * margin)
+    return LanguageGuess(_SCRIPT_LANGUAGE.get(dominant), SCRIPTS[dominant], counts, purity)
+
+
+def detect_languages(texts: Sequence[str]) -> list[LanguageGuess]:
+    """Detect the language of each text; all texts are script-mapped in one translate call."""
+    if not texts:
+        return []
+    joined = _SEPARATOR.join(t.replace(_SEPARATOR, " ") for t in texts)
+    translated = joined.translate(_script_table()).split(_SEPARATOR)
+    return [_guess(text, mapped) for text, mapped in zip(texts, translated, strict=True)]
+
+
+def detect_language(text: str) -> LanguageGuess:
+    return detect_languages([text])[0]
+
+
+def is_identifiable(language: str) -> bool:
+    """Whether detection can name this language (not just its script)."""
+    return language in _profiles()[0] or language in ("ja", "zh") or language in _SCRIPT_LANGUAGE.values()
+
+
+__all__ = [
+    "LANGUAGE_SCRIPTS",
+    "SCRIPTS",
+    "LanguageGuess",
+    "detect_language",
+    "detect_languages",
+    "is_identifiable",
+    "trigrams",
+]
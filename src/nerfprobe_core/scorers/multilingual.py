@@ -2,17 +2,35 @@
 
 from typing import Any
 
+from nerfprobe_core.scorers.language import LANGUAGE_SCRIPTS, LanguageGuess, detect_languages, is_identifiable
+
 
 class MultilingualScorer:
     """
     Evaluates responses across multiple languages.
 
+    With `verify_language`, each response must be written in the requested
+    language: at least `min_script_purity` of its letters in that
+    language's scripts, and, once it has `min_chars` letters, identified
+    as that language where the language can be told apart (see
+    language.is_identifiable). Expected keywords, when given, are also
+    required.
+
     Ref: [2024.findings-emnlp.935]
     """
 
-    def __init__(self, expected_keywords: dict[str, list[str]] | None = None):
+    def __init__(
+        self,
+        expected_keywords: dict[str, list[str]] | None = None,
+        verify_language: bool = True,
+        min_script_purity: float = 0.6,
+        min_chars: int = 20,
+    ):
         # Mapping lang code -> list of expected keywords
         self.expected_keywords = expected_keywords or {}
+        self.verify_language = verify_language
+        self.min_script_purity = min_script_purity
+        self.min_chars = min_chars  # Shorter responses get the script check only
 
     def score(self, responses: dict[str, str]) -> float:
         """
@@ -24,36 +42,56 @@ class MultilingualScorer:
         Returns:
             Percentage of languages that passed
         """
-        passed_count = 0
-        total_langs = len(responses)
-
-        if total_langs == 0:
+        if not responses:
             return 0.0
-
-        for lang, resp in responses.items():
-            if self._check_lang(lang, resp):
-                passed_count += 1
-
-        return passed_count / total_langs
+        score: float = self.metrics(responses)["consistency_score"]
+        return score
 
     def metrics(self, responses: dict[str, str]) -> dict[str, Any]:
         """Return detailed per-language metrics."""
-        details = {}
-        passed_count = 0
-
-        for lang, resp in responses.items():
-            passed = self._check_lang(lang, resp)
-            details[lang] = passed
-            if passed:
-                passed_count += 1
-
-        score = passed_count / len(responses) if responses else 0.0
-
-        return {
+        details: dict[str, bool] = {}
+        detected: dict[str, str | None] = {}
+        purity: dict[str, float] = {}
+        confidence: dict[str, float] = {}
+
+        guesses = detect_languages(list(responses.values())) if self.verify_language else []
+        for i, (lang, resp) in enumerate(responses.items()):
+            if not self.verify_language:
+                details[lang] = self._check_lang(lang, resp)
+                continue
+            guess = guesses[i]
+            details[lang] = self._check_lang(lang, resp) and self._check_script(lang, guess)
+            detected[lang] = guess.language
+            purity[lang] = guess.purity(LANGUAGE_SCRIPTS.get(lang, frozenset()))
+            confidence[lang] = guess.confidence if guess.language == lang else 0.0
+
+        score = sum(details.values()) / len(responses) if responses else 0.0
+        metrics: dict[str, Any] = {
             "passed": score == 1.0,  # All must pass for consistency
             "consistency_score": score,
             "details": details,
         }
+        if self.verify_language:
+            metrics.update(
+                detected=detected,
+                script_purity=purity,
+                language_confidence=confidence,
+                min_script_purity=min(purity.values(), default=0.0),
+                mean_language_confidence=sum(confidence.values()) / len(confidence) if confidence else 0.0,
+            )
+        return metrics
+
+    def _check_script(self, lang: str, guess: LanguageGuess) -> bool:
+        """Check the response is written in the requested language."""
+        scripts = LANGUAGE_SCRIPTS.get(lang)
+        if scripts is None:
+            # Unknown language code: nothing to verify against
+            return True
+        if guess.purity(scripts) < self.min_script_purity:
+            return False
+        if guess.letters >= self.min_chars and is_identifiable(lang):
+            return guess.language == lang
+        return True
 
     def _check_lang(self, lang: str, response: str) -> bool:
         """Check if response passes for given language."""
@@ -1,87 +1,121 @@
 """Repetition scorer - N-gram analysis for phrase looping detection."""
 
 from collections import Counter
+from collections.abc import Iterator
 from typing import Any
 
+from nerfprobe_core.scorers.diversity import lexical_diversity, min_window_ttr
+from nerfprobe_core.scorers.loops import detect_loops
+from nerfprobe_core.scorers.segmentation import Segmenter, get_segmenter
+
 
 class RepetitionScorer:
     """
     Detects phrase looping by analyzing N-gram repetitions.
+
+    Word n-grams are counted as rolling hashes over token IDs instead of
+    materialized tuples. With base = vocabulary size the hash is exact (one
+    integer per distinct n-gram), so counts are never merged by collisions.
+    metrics() also runs character-level loop detection (scorers.loops),
+    which catches loops whose copies differ in punctuation or whitespace.
+
     Ref: [2403.06408] Perturbation Lens
     """
 
-    def __init__(self, ngram_size: int = 4, max_repeats: int = 2, sliding_window_size: int = 50):
+    def __init__(
+        self,
+        ngram_size: int = 4,
+        max_repeats: int = 2,
+        sliding_window_size: int = 50,
+        segmenter: str | Segmenter = "script",
+        min_loop_chars: int = 40,
+        max_loop_coverage: float | None = None,
+    ):
         self.ngram_size = ngram_size
         self.max_repeats = max_repeats
         self.sliding_window_size = sliding_window_size
+        self._segment = get_segmenter(segmenter)
+        self.min_loop_chars = min_loop_chars  # Shortest character repeat counted as a loop
+        self.max_loop_coverage = max_loop_coverage  # None = loops don't affect score()
 
     def score(self, response: str) -> float:
         """Returns 1.0 if no excessive repetition, 0.0 otherwise."""
-        max_count = self._get_max_repetition_count(response)
-        return 1.0 if max_count <= self.max_repeats else 0.0
+        counts = self._ngram_counts(self._segment(response))
+        max_count = max(counts.values(), default=0)
+        if max_count > self.max_repeats:
+            return 0.0
+        if self.max_loop_coverage is not None:
+            if detect_loops(response, self.min_loop_chars).coverage > self.max_loop_coverage:
+                return 0.0
+        return 1.0
 
     def metrics(self, response: str) -> dict[str, Any]:
         """Return detailed repetition metrics."""
-        max_count = self._get_max_repetition_count(response)
-        unique_ngrams, total_ngrams = self._get_ngram_stats(response)
+        tokens = self._segment(response)
+        counts = self._ngram_counts(tokens)
+        max_count = max(counts.values(), default=0)
+        total_ngrams = counts.total()
+        unique_ngrams = len(counts)
 
         # Global N-gram TTR
         global_ttr = unique_ngrams / total_ngrams if total_ngrams > 0 else 0.0
 
         # Local sliding window TTR
-        min_local_ttr = self._get_sliding_window_ttr(response)
+        min_local_ttr = self._get_sliding_window_ttr(tokens)
+
+        # Length-robust diversity over the (case-folded) word stream
+        diversity = lexical_diversity([token.lower() for token in tokens], response)
+
+        loops = detect_loops(response, self.min_loop_chars)
+        passed = max_count <= self.max_repeats and (
+            self.max_loop_coverage is None or loops.coverage <= self.max_loop_coverage
+        )
 
         return {
             "max_repeats": float(max_count),
             "ngram_ttr": global_ttr,
             "min_local_ttr": min_local_ttr,
-            "passed": 1.0 if max_count <= self.max_repeats else 0.0,
+            "passed": 1.0 if passed else 0.0,
+            "longest_repeat_chars": float(len(loops.longest_repeat)),
+            "repeat_period": float(loops.period),
+            "loop_coverage": loops.coverage,
+            **diversity,
             "_metadata": {
                 "ngram_size": self.ngram_size,
                 "total_ngrams": total_ngrams,
                 "unique_ngrams": unique_ngrams,
                 "window_size": self.sliding_window_size,
+                "normalized_chars": loops.length,
+                "tandem_loop": loops.is_tandem,
             },
         }
 
-    def _get_ngrams(self, tokens: list[str]) -> list[tuple[str, ...]]:
-        """Extract N-grams from token list."""
-        if len(tokens) < self.ngram_size:
-            return []
-        return [tuple(tokens[i : i + self.ngram_size]) for i in range(len(tokens) - self.ngram_size + 1)]
-
-    def _get_max_repetition_count(self, response: str) -> int:
-        """Get count of most repeated N-gram."""
-        tokens = response.split()
-        ngrams = self._get_ngrams(tokens)
-        if not ngrams:
-            return 0
-        counts = Counter(ngrams)
-        return counts.most_common(1)[0][1] if counts else 0
-
-    def _get_ngram_stats(self, response: str) -> tuple[int, int]:
-        """Get unique and total N-gram counts."""
-        tokens = response.split()
-        ngrams = self._get_ngrams(tokens)
-        if not ngrams:
-            return 0, 0
-        return len(set(ngrams)), len(ngrams)
-
-    def _get_sliding_window_ttr(self, response: str) -> float:
+    def _ngram_hashes(self, tokens: list[str]) -> Iterator[int]:
+        """Exact rolling hash of each N-gram, from token IDs in base vocabulary size."""
+        n = self.ngram_size
+        if len(tokens) < n:
+            return
+        ids: dict[str, int] = {}
+        codes = [ids.setdefault(token, len(ids)) for token in tokens]
+        base = len(ids)
+        top = base ** (n - 1)
+        h = 0
+        for code in codes[: n - 1]:
+            h = h * base + code
+        for i in range(n - 1, len(codes)):
+            h = h * base + codes[i]
+            yield h
+            h -= codes[i - n + 1] * top
+
+    def _ngram_counts(self, tokens: list[str]) -> Counter[int]:
+        return Counter(self._ngram_hashes(tokens))
+
+    def _get_sliding_window_ttr(self, tokens: list[str]) -> float:
         """
         Calculate TTR within sliding windows.
         Returns minimum TTR found (detects local degradation).
         """
-        tokens = response.split()
-        if len(tokens) < self.sliding_window_size:
+        if len(tokens) < self.sliding_window_size or self.sliding_window_size <= 0:
             unique = len(set(tokens))
             return unique / len(tokens) if tokens else 0.0
-
-        ttrs = []
-        for i in range(len(tokens) - self.sliding_window_size + 1):
-            window = tokens[i : i + self.sliding_window_size]
-            unique_count = len(set(window))
-            ttr = unique_count / self.sliding_window_size
-            ttrs.append(ttr)
-
-        return min(ttrs) if ttrs else 1.0
+        return min_window_ttr(tokens, self.sliding_window_size)
@@ -0,0 +1,114 @@
+"""
+Segmentation - Script-aware word segmentation for lexical scorers.
+
+str.split() turns a paragraph of Chinese or Japanese into one "word", so
+TTR and n-gram repetition scores are meaningless for scripts written
+without spaces. ScriptSegmenter makes one regex pass that yields:
+
+- whitespace-delimited words for space-delimited scripts, with
+  punctuation left attached exactly as str.split() leaves it, so TTR and
+  repetition scores (and thresholds calibrated on them) are unchanged for
+  text without no-space scripts;
+- character n-grams inside runs of Han, Hiragana, Katakana, Thai, Lao,
+  Khmer and Myanmar text (bigrams by default, which approximate words).
+  CJK punctuation separates tokens like whitespace does.
+
+Scorers take a `segmenter` argument: a name from SEGMENTERS or any
+callable mapping text to a list of tokens.
+"""
+
+import re
+from collections.abc import Callable
+
+Segmenter = Callable[[str], list[str]]
+
+# Scripts written without spaces between words
+_NO_SPACE = (
+    "\u0e00-\u0e7f"  # Thai
+    "\u0e80-\u0eff"  # Lao
+    "\u1000-\u109f"  # Myanmar
+    "\u1780-\u17ff"  # Khmer
+    "\u3005\u3007"  # Iteration mark, ideographic zero
+    "\u3040-\u30ff"  # Hiragana, Katakana
+    "\u31f0-\u31ff"  # Katakana phonetic extensions
+    "\u3400-\u4dbf"  # CJK extension A
+    "\u4e00-\u9fff"  # CJK unified ideographs
+    "\uf900-\ufaff"  # CJK compatibility ideographs
+    "\uff66-\uff9f"  # Half-width Katakana
+    "\U00020000-\U0003134f"  # CJK extensions B-G
+)
+
+# CJK symbols/punctuation and full-width punctuation: separators, like spaces
+_CJK_PUNCT = "\u3000-\u3004\u3008-\u303f\uff01-\uff0f\uff1a-\uff20\uff3b-\uff40\uff5b-\uff65"
+
+_WORD = rf"[^\s{_NO_SPACE}{_CJK_PUNCT}]+"
+_RUN_CHAR = f"[{_NO_SPACE}]"
+
+
+def _compile(ngram: int) -> re.Pattern[str]:
+    """
+    Single-group pattern whose findall() yields the token list directly.
+
+    For ngram > 1, the token is captured by a lookahead at each run
+    character: a full n-gram if one starts there, or a whole run shorter
+    than n at its first character. The match then consumes one character
+    (or one word), so overlapping n-grams come out of one regex pass.
+    """
+    if ngram == 1:
+        return re.compile(f"({_RUN_CHAR}|{_WORD})")
+    short_run = f"(?<!{_RUN_CHAR}){_RUN_CHAR}{{1,{ngram - 1}}}(?!{_RUN_CHAR})"
+    return re.compile(f"(?=({_RUN_CHAR}{{{ngram}}}|{short_run}|{_WORD}))(?:{_RUN_CHAR}|{_WORD})")
+
+
+class ScriptSegmenter:
+    """
+    Words for space-delimited scripts, character n-grams for the rest.
+
+    Args:
+        ngram: Character n-gram size inside no-space runs (1 = single
+            characters). Runs shorter than `ngram` are kept whole.
+    """
+
+    def __init__(self, ngram: int = 2):
+        if ngram < 1:
+            raise ValueError("ngram must be >= 1")
+        self.ngram = ngram
+        self._findall = _compile(ngram).findall
+
+    def __call__(self, text: str) -> list[str]:
+        if text.isascii():
+            # Fast path: no run scripts or CJK punctuation possible
+            return text.split()
+        found: list[str] = self._findall(text)
+        return found
+
+
+def whitespace_segmenter(text: str) -> list[str]:
+    """str.split() segmentation: every character sequence between spaces is one token."""
+    return text.split()
+
+
+SEGMENTERS: dict[str, Segmenter] = {
+    "script": ScriptSegmenter(),
+    "chars": ScriptSegmenter(ngram=1),
+    "whitespace": whitespace_segmenter,
+}
+
+
+def get_segmenter(segmenter: str | Segmenter) -> Segmenter:
+    """Resolve a segmenter name (see SEGMENTERS) or pass a callable through."""
+    if callable(segmenter):
+        return segmenter
+    try:
+        return SEGMENTERS[segmenter]
+    except KeyError:
+        raise ValueError(f"Unknown segmenter {segmenter!r}; expected one of {sorted(SEGMENTERS)}") from None
+
+
+__all__ = [
+    "SEGMENTERS",
+    "ScriptSegmenter",
+    "Segmenter",
+    "get_segmenter",
+    "whitespace_segmenter",
+]
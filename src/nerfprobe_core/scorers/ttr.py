@@ -1,22 +1,30 @@
 """TTR scorer - Type-Token Ratio for vocabulary degradation detection."""
 
+from collections import Counter
 from typing import Any
 
+from nerfprobe_core.scorers.diversity import lexical_diversity, min_window_ttr
+from nerfprobe_core.scorers.segmentation import Segmenter, get_segmenter
+
 
 class TTRScorer:
     """
     Calculates Type-Token Ratio (TTR) to detect vocabulary degradation.
-    Pure logic component with no external dependencies.
+    Pure logic component with no external dependencies. Tokens come from a
+    script-aware segmenter, so CJK output is scored on character bigrams.
+    metrics() also reports the length-robust measures from
+    scorers.diversity (MTLD, HD-D, Yule's K, compression ratio).
 
     Ref: [2403.06408] Perturbation Lens.
     """
 
-    def __init__(self, sliding_window_size: int = 50):
+    def __init__(self, sliding_window_size: int = 50, segmenter: str | Segmenter = "script"):
         self.sliding_window_size = sliding_window_size
+        self._segment = get_segmenter(segmenter)
 
     def calculate_ttr(self, text: str) -> float:
         """Calculate global Type-Token Ratio."""
-        tokens = text.lower().split()
+        tokens = self._segment(text.lower())
         if not tokens:
             return 0.0
         unique = set(tokens)
@@ -29,18 +37,13 @@ class TTRScorer:
 
     def metrics(self, response: str) -> dict[str, Any]:
         """Return detailed TTR metrics including local window analysis."""
-        ttr = self.calculate_ttr(response)
-        tokens = response.lower().split()
+        tokens = self._segment(response.lower())
+        counts = Counter(tokens)
+        ttr = len(counts) / len(tokens) if tokens else 0.0
 
         # Sliding window TTR for detecting local repetition
-        min_local_ttr = 1.0
         if self.sliding_window_size > 0 and len(tokens) >= self.sliding_window_size:
-            ttrs = []
-            for i in range(len(tokens) - self.sliding_window_size + 1):
-                window = tokens[i : i + self.sliding_window_size]
-                unique_local = len(set(window))
-                ttrs.append(unique_local / self.sliding_window_size)
-            min_local_ttr = min(ttrs) if ttrs else 1.0
+            min_local_ttr = min_window_ttr(tokens, self.sliding_window_size)
         else:
             min_local_ttr = ttr  # Fallback to global if text too short
 
@@ -48,4 +51,5 @@ class TTRScorer:
             "ttr": ttr,
             "min_local_ttr": min_local_ttr,
             "token_count": len(tokens),
+            **lexical_diversity(tokens, response, counts),
         }
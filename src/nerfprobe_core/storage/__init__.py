@@ -0,0 +1,34 @@
+"""
+Storage module - local persistence and export for probe results.
+
+Export functions import their optional dependencies (pyarrow, numpy) on call.
+"""
+
+from nerfprobe_core.storage.blob_store import (
+    BlobStore,
+    load_metadata,
+    load_raw_response,
+    offload_result,
+    restore_result,
+)
+from nerfprobe_core.storage.export import (
+    iter_record_batches,
+    to_arrow_table,
+    to_numpy,
+    write_parquet,
+)
+from nerfprobe_core.storage.results_store import ProbeAggregate, ResultsStore
+
+__all__ = [
+    "BlobStore",
+    "ProbeAggregate",
+    "ResultsStore",
+    "iter_record_batches",
+    "load_metadata",
+    "load_raw_response",
+    "offload_result",
+    "restore_result",
+    "to_arrow_table",
+    "to_numpy",
+    "write_parquet",
+]
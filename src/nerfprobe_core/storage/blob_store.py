@@ -0,0 +1,160 @@
+"""
+BlobStore - Deduplicated, compressed content-addressed storage for responses.
+
+Offloading keeps in-memory ProbeResults small: raw_response is cut to a
+short preview and the full text is stored once under its sha256 digest, so
+the many identical answers from deterministic probes cost one blob. Long
+response strings in metadata (e.g. FingerprintProbe's response lists) are
+replaced by {"$blob": "<digest>"} references the same way; only those
+marker dicts are resolved on load, so no metadata string is ever mistaken
+for a reference.
+"""
+
+import hashlib
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+
+from nerfprobe_core.core.entities import ProbeResult
+
+BLOB_KEY = "$blob"
+
+
+class BlobStore:
+    """
+    Content-addressed store of zlib-compressed UTF-8 text.
+
+    With a `root`, blobs are files sharded by the first two hex digits of
+    their digest and survive the process; without one they are held
+    compressed in memory.
+    """
+
+    def __init__(self, root: str | Path | None = None, level: int = 6):
+        self.root = Path(root) if root is not None else None
+        self.level = level
+        self._memory: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        if self.root is not None:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str) -> Path:
+        assert self.root is not None
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, text: str) -> str:
+        """Store text and return its sha256 hex digest (a no-op if already stored)."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self:
+            return digest
+
+        compressed = zlib.compress(data, self.level)
+        if self.root is None:
+            with self._lock:
+                self._memory.setdefault(digest, compressed)
+            return digest
+
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Return the text stored under a digest (KeyError if unknown)."""
+        if self.root is None:
+            compressed = self._memory[digest]
+        else:
+            try:
+                compressed = self._path(digest).read_bytes()
+            except FileNotFoundError:
+                raise KeyError(digest) from None
+        return zlib.decompress(compressed).decode("utf-8")
+
+    def __contains__(self, digest: object) -> bool:
+        if not isinstance(digest, str):
+            return False
+        if self.root is None:
+            return digest in self._memory
+        return self._path(digest).exists()
+
+    def __len__(self) -> int:
+        if self.root is None:
+            return len(self._memory)
+        return sum(1 for shard in self.root.iterdir() if shard.is_dir() for f in shard.iterdir() if f.suffix != ".tmp")
+
+
+def _offload_value(value: Any, store: BlobStore, min_chars: int) -> Any:
+    if isinstance(value, str) and len(value) > min_chars:
+        return {BLOB_KEY: store.put(value)}
+    if isinstance(value, list):
+        return [_offload_value(v, store, min_chars) for v in value]
+    if isinstance(value, dict):
+        return {k: _offload_value(v, store, min_chars) for k, v in value.items()}
+    return value
+
+
+def _load_value(value: Any, store: BlobStore) -> Any:
+    # A dict holding only BLOB_KEY is a reference; any other dict is recursed into
+    if isinstance(value, dict):
+        if value.keys() == {BLOB_KEY}:
+            return store.get(value[BLOB_KEY])
+        return {k: _load_value(v, store) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_load_value(v, store) for v in value]
+    return value
+
+
+def offload_result(result: ProbeResult, store: BlobStore, preview_chars: int = 200) -> ProbeResult:
+    """
+    Move the full raw_response (and long metadata strings) into the store.
+
+    Returns a copy holding a preview in raw_response and the digest in
+    raw_response_ref. Short responses and already-offloaded results are
+    returned unchanged.
+    """
+    if result.raw_response_ref is not None:
+        return result
+
+    update: dict[str, Any] = {}
+    if len(result.raw_response) > preview_chars:
+        update["raw_response"] = result.raw_response[:preview_chars]
+        update["raw_response_ref"] = store.put(result.raw_response)
+
+    metadata = {
+        key: _offload_value(value, store, preview_chars) if key != "config" else value
+        for key, value in result.metadata.items()
+    }
+    if metadata != result.metadata:
+        update["metadata"] = metadata
+
+    return result.model_copy(update=update) if update else result
+
+
+def load_raw_response(result: ProbeResult, store: BlobStore) -> str:
+    """Full raw_response of a possibly offloaded result."""
+    if result.raw_response_ref is None:
+        return result.raw_response
+    return store.get(result.raw_response_ref)
+
+
+def load_metadata(result: ProbeResult, store: BlobStore) -> dict[str, Any]:
+    """Metadata with {"$blob": "<digest>"} references resolved."""
+    return {key: _load_value(value, store) for key, value in result.metadata.items()}
+
+
+def restore_result(result: ProbeResult, store: BlobStore) -> ProbeResult:
+    """Inverse of offload_result."""
+    metadata = load_metadata(result, store)
+    if result.raw_response_ref is None and metadata == result.metadata:
+        return result
+    return result.model_copy(
+        update={
+            "raw_response": load_raw_response(result, store),
+            "raw_response_ref": None,
+            "metadata": metadata,
+        }
+    )
@@ -0,0 +1,244 @@
+"""
+Columnar export of ProbeResults to Arrow/Parquet and NumPy.
+
+Results are consumed in fixed-size chunks, so exporting a long history keeps
+memory bounded by the chunk size. Each chunk is packed into a
+ProbeResultBatch first; its typed arrays and interned name tables map
+directly onto Arrow buffers and dictionary-encoded columns.
+metric_scores are flattened into one float64 column per metric,
+named "metric.<name>".
+
+Requires: pyarrow for Arrow/Parquet (pip install 'nerfprobe-core[arrow]'),
+numpy for to_numpy (pip install 'nerfprobe-core[analysis]').
+"""
+
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from nerfprobe_core.core.batch import ProbeResultBatch
+from nerfprobe_core.core.entities import ProbeResult
+
+METRIC_PREFIX = "metric."
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Arrow export requires pyarrow. Install with: pip install 'nerfprobe-core[arrow]'") from e
+    return pa
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy export requires numpy. Install with: pip install 'nerfprobe-core[analysis]'") from e
+    return np
+
+
+def _chunks(results: Iterable[ProbeResult], chunk_size: int) -> Iterator[ProbeResultBatch]:
+    it = iter(results)
+    while chunk := list(itertools.islice(it, chunk_size)):
+        yield ProbeResultBatch(chunk)
+
+
+def _metric_names(results: Iterable[ProbeResult]) -> list[str]:
+    names: dict[str, None] = {}
+    for result in results:
+        names.update(dict.fromkeys(result.metric_scores))
+    return sorted(names)
+
+
+def _resolve_metrics(
+    results: Iterable[ProbeResult], metrics: Sequence[str] | None, chunk_size: int
+) -> tuple[list[str] | None, Iterator[ProbeResultBatch]]:
+    """
+    Metric columns to export. Explicit `metrics` win; a list/tuple of results
+    is scanned up front; for other iterables the first chunk decides and
+    metrics first seen later are dropped.
+    """
+    if metrics is not None:
+        return list(metrics), _chunks(results, chunk_size)
+    if isinstance(results, Sequence):
+        return _metric_names(results), _chunks(results, chunk_size)
+    return None, _chunks(results, chunk_size)
+
+
+def arrow_schema(metrics: Sequence[str], include_raw: bool = False) -> Any:
+    """Arrow schema of exported record batches."""
+    pa = _require_pyarrow()
+    names = pa.dictionary(pa.uint32(), pa.string())
+    fields = [
+        pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+        pa.field("target", names),
+        pa.field("probe_name", names),
+        pa.field("probe_type", names),
+        pa.field("passed", pa.bool_()),
+        pa.field("score", pa.float64()),
+        pa.field("latency_ms", pa.float64()),
+        pa.field("ttft_ms", pa.float64()),
+        pa.field("mean_itl_ms", pa.float64()),
+        pa.field("input_tokens", pa.int64()),
+        pa.field("output_tokens", pa.int64()),
+        pa.field("error_reason", pa.string()),
+        pa.field("raw_response_ref", pa.string()),
+    ]
+    if include_raw:
+        fields.append(pa.field("raw_response", pa.string()))
+    fields.extend(pa.field(METRIC_PREFIX + name, pa.float64()) for name in metrics)
+    return pa.schema(fields)
+
+
+def _record_batch(batch: ProbeResultBatch, schema: Any, metrics: Sequence[str], include_raw: bool) -> Any:
+    pa = _require_pyarrow()
+    import pyarrow.compute as pc
+
+    def dictionary(codes: Any, values: list[str]) -> Any:
+        return pa.DictionaryArray.from_arrays(pa.array(codes, pa.uint32()), pa.array(values, pa.string()))
+
+    def nullable_float(values: Any) -> Any:
+        return pa.array(values, pa.float64(), from_pandas=True)  # NaN -> null
+
+    def nullable_int(values: Any) -> Any:
+        arr = pa.array(values, pa.int64())
+        return pc.if_else(pc.equal(arr, -1), pa.scalar(None, pa.int64()), arr)
+
+    columns = [
+        pa.array(batch.timestamps_us, pa.int64()).cast(pa.timestamp("us", tz="UTC")),
+        dictionary(batch.target_codes, [str(t) for t in batch.targets]),
+        dictionary(batch.probe_name_codes, batch.probe_names),
+        dictionary(batch.probe_type_codes, [t.value for t in batch.probe_types]),
+        pa.array(batch.passed, pa.int8()).cast(pa.bool_()),
+        pa.array(batch.scores, pa.float64()),
+        pa.array(batch.latency_ms, pa.float64()),
+        nullable_float(batch.ttft_ms),
+        nullable_float(batch.mean_itl_ms),
+        nullable_int(batch.input_tokens),
+        nullable_int(batch.output_tokens),
+        pa.array(batch.error_reasons, pa.string()),
+        pa.array(batch.raw_response_refs, pa.string()),
+    ]
+    if include_raw:
+        columns.append(pa.array(batch.raw_responses, pa.string()))
+    for name in metrics:
+        columns.append(pa.array([scores.get(name) for scores in batch.metric_scores], pa.float64()))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def iter_record_batches(
+    results: Iterable[ProbeResult],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    metrics: Sequence[str] | None = None,
+    include_raw: bool = False,
+) -> Iterator[Any]:
+    """
+    Stream results as pyarrow.RecordBatches of at most chunk_size rows.
+
+    All batches share one schema. Without `metrics`, metric columns come from
+    all results when given a list, else from the first chunk.
+    """
+    names, chunks = _resolve_metrics(results, metrics, chunk_size)
+    schema = None
+    for batch in chunks:
+        if names is None:
+            names = _metric_names(iter(batch))
+        if schema is None:
+            schema = arrow_schema(names, include_raw)
+        yield _record_batch(batch, schema, names, include_raw)
+
+
+def to_arrow_table(
+    results: Iterable[ProbeResult],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    metrics: Sequence[str] | None = None,
+    include_raw: bool = False,
+) -> Any:
+    """Collect results into a pyarrow.Table."""
+    pa = _require_pyarrow()
+    batches = list(iter_record_batches(results, chunk_size, metrics, include_raw))
+    if not batches:
+        return arrow_schema(metrics or [], include_raw).empty_table()
+    return pa.Table.from_batches(batches)
+
+
+def write_parquet(
+    results: Iterable[ProbeResult],
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    metrics: Sequence[str] | None = None,
+    include_raw: bool = False,
+    compression: str = "zstd",
+) -> int:
+    """Stream results into a Parquet file, one row group per chunk. Returns rows written."""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for record_batch in iter_record_batches(results, chunk_size, metrics, include_raw):
+            if writer is None:
+                writer = pq.ParquetWriter(str(path), record_batch.schema, compression=compression)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+        if writer is None:
+            pq.write_table(arrow_schema(metrics or [], include_raw).empty_table(), str(path))
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def to_numpy(results: Iterable[ProbeResult], metrics: Sequence[str] | None = None) -> Any:
+    """
+    NumPy structured array with one record per result.
+
+    Timestamps are UTC; string fields are object columns; missing ttft/itl
+    are NaN and missing token counts are -1. Metric fields are named "metric.<name>" (NaN if absent).
+    """
+    np = _require_numpy()
+    batch = ProbeResultBatch(results)
+    names = list(metrics) if metrics is not None else _metric_names(iter(batch))
+
+    dtype = [
+        ("timestamp", "datetime64[us]"),
+        ("target", object),
+        ("probe_name", object),
+        ("probe_type", object),
+        ("passed", bool),
+        ("score", np.float64),
+        ("latency_ms", np.float64),
+        ("ttft_ms", np.float64),
+        ("mean_itl_ms", np.float64),
+        ("input_tokens", np.int64),
+        ("output_tokens", np.int64),
+    ] + [(METRIC_PREFIX + name, np.float64) for name in names]
+
+    out = np.empty(len(batch), dtype=dtype)
+    out["timestamp"] = np.frombuffer(batch.timestamps_us, dtype=np.int64).astype("datetime64[us]")
+    out["target"] = np.array([str(t) for t in batch.targets], dtype=object)[
+        np.frombuffer(batch.target_codes, dtype=np.uint32)
+    ]
+    out["probe_name"] = np.array(batch.probe_names, dtype=object)[
+        np.frombuffer(batch.probe_name_codes, dtype=np.uint32)
+    ]
+    out["probe_type"] = np.array([t.value for t in batch.probe_types], dtype=object)[
+        np.frombuffer(batch.probe_type_codes, dtype=np.uint32)
+    ]
+    out["passed"] = np.frombuffer(batch.passed, dtype=np.int8).astype(bool)
+    for field, column in (
+        ("score", batch.scores),
+        ("latency_ms", batch.latency_ms),
+        ("ttft_ms", batch.ttft_ms),
+        ("mean_itl_ms", batch.mean_itl_ms),
+    ):
+        out[field] = np.frombuffer(column, dtype=np.float64)
+    out["input_tokens"] = np.frombuffer(batch.input_tokens, dtype=np.int64)
+    out["output_tokens"] = np.frombuffer(batch.output_tokens, dtype=np.int64)
+    for name in names:
+        out[METRIC_PREFIX + name] = [scores.get(name, np.nan) for scores in batch.metric_scores]
+    return out
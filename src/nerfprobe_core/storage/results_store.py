@@ -0,0 +1,346 @@
+"""
+ResultsStore - Append-only SQLite store for ProbeResults with time-series queries.
+
+Results are queued by add() and written by a background thread in batched
+transactions, so a concurrent runner can ingest thousands of results per
+second without blocking its event loop. The database runs in WAL mode, so
+queries proceed while the writer appends.
+
+Scalar fields live in an indexed `results` table keyed by
+(target, probe_name, timestamp); the bulky raw_response and metadata go in
+a separate `blobs` table and are only read when asked for.
+"""
+
+import datetime
+import json
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from nerfprobe_core.core.entities import ModelTarget, ProbeResult, ProbeType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    provider_id TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    probe_name TEXT NOT NULL,
+    probe_type TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    passed INTEGER NOT NULL,
+    score REAL NOT NULL,
+    latency_ms REAL NOT NULL,
+    ttft_ms REAL,
+    mean_itl_ms REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    error_reason TEXT,
+    metric_scores TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_target_probe_ts ON results (target, probe_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_ts ON results (timestamp);
+CREATE TABLE IF NOT EXISTS blobs (
+    result_id INTEGER PRIMARY KEY REFERENCES results (id),
+    raw_response TEXT NOT NULL,
+    raw_response_ref TEXT,
+    metadata TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "id, target, provider_id, model_name, probe_name, probe_type, timestamp, passed, score, "
+    "latency_ms, ttft_ms, mean_itl_ms, input_tokens, output_tokens, error_reason, metric_scores"
+)
+_INSERT_RESULT = f"INSERT INTO results ({_COLUMNS}) VALUES ({', '.join('?' * 16)})"
+_INSERT_BLOB = "INSERT INTO blobs (result_id, raw_response, raw_response_ref, metadata) VALUES (?, ?, ?, ?)"
+
+_STOP = object()
+
+
+@dataclass
+class ProbeAggregate:
+    """Summary statistics for one (target, probe_name) over a query window."""
+
+    target: str
+    probe_name: str
+    runs: int
+    pass_rate: float
+    mean_score: float
+    mean_latency_ms: float
+    input_tokens: int
+    output_tokens: int
+    first: datetime.datetime
+    last: datetime.datetime
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class ResultsStore:
+    """
+    Local append-only store of ProbeResults.
+
+    Args:
+        path: SQLite database file (created if missing).
+        batch_size: Maximum results written per transaction.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = 1000):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._writer_conn = _connect(self.path)
+        self._writer_conn.executescript(_SCHEMA)
+        row = self._writer_conn.execute("SELECT COALESCE(MAX(id), 0) FROM results").fetchone()
+        self._next_id = int(row[0]) + 1
+
+        self._reader_conn = _connect(self.path)
+        self._reader_lock = threading.Lock()
+
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_loop, name="nerfprobe-results-writer", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add(self, result: ProbeResult) -> None:
+        """Queue one result for writing. Never blocks; safe to call from an event loop."""
+        if self._closed:
+            raise RuntimeError("ResultsStore is closed")
+        self._queue.put_nowait(result)
+
+    def add_many(self, results: Iterable[ProbeResult]) -> None:
+        """Queue several results for writing."""
+        for result in results:
+            self.add(result)
+
+    def flush(self) -> None:
+        """Block until every queued result is committed (use asyncio.to_thread from async code)."""
+        self._queue.join()
+        if self._error is not None:
+            raise RuntimeError("Results writer failed") from self._error
+
+    def close(self) -> None:
+        """Flush pending results and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._writer_conn.close()
+        self._reader_conn.close()
+        if self._error is not None:
+            raise RuntimeError("Results writer failed") from self._error
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            results = [item for item in batch if item is not _STOP]
+            try:
+                if results and self._error is None:
+                    self._write_batch(results)
+            except BaseException as e:  # Surface on the next flush()/close()
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, results: list[ProbeResult]) -> None:
+        rows = []
+        blobs = []
+        for result in results:
+            row_id = self._next_id
+            self._next_id += 1
+            target = result.target
+            rows.append(
+                (
+                    row_id,
+                    str(target),
+                    target.provider_id,
+                    target.model_name,
+                    result.probe_name,
+                    result.probe_type.value,
+                    result.timestamp.timestamp(),
+                    int(result.passed),
+                    result.score,
+                    result.latency_ms,
+                    result.ttft_ms,
+                    result.mean_itl_ms,
+                    result.input_tokens,
+                    result.output_tokens,
+                    result.error_reason,
+                    json.dumps(result.metric_scores),
+                )
+            )
+            blobs.append(
+                (row_id, result.raw_response, result.raw_response_ref, json.dumps(result.metadata, default=str))
+            )
+
+        conn = self._writer_conn
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT_RESULT, rows)
+            conn.executemany(_INSERT_BLOB, blobs)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._next_id -= len(results)
+            raise
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _fetch(self, sql: str, params: Iterable[Any]) -> list[tuple[Any, ...]]:
+        with self._reader_lock:
+            return self._reader_conn.execute(sql, tuple(params)).fetchall()
+
+    @staticmethod
+    def _where(
+        target: ModelTarget | str | None,
+        probe_name: str | None,
+        start: datetime.datetime | None,
+        end: datetime.datetime | None,
+        alias: str = "",
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if target is not None:
+            clauses.append(f"{alias}target = ?")
+            params.append(str(target))
+        if probe_name is not None:
+            clauses.append(f"{alias}probe_name = ?")
+            params.append(probe_name)
+        if start is not None:
+            clauses.append(f"{alias}timestamp >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            clauses.append(f"{alias}timestamp < ?")
+            params.append(end.timestamp())
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _to_results(self, rows: list[tuple[Any, ...]], include_blobs: bool) -> list[ProbeResult]:
+        blobs: dict[int, tuple[str, str | None, str]] = {}
+        if include_blobs and rows:
+            ids = [row[0] for row in rows]
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(ids), 900):
+                chunk = ids[i : i + 900]
+                sql = f"SELECT result_id, raw_response, raw_response_ref, metadata FROM blobs WHERE result_id IN ({','.join('?' * len(chunk))})"
+                for result_id, raw, ref, meta in self._fetch(sql, chunk):
+                    blobs[result_id] = (raw, ref, meta)
+
+        results = []
+        for row in rows:
+            raw, ref, meta = blobs.get(row[0], ("", None, "{}"))
+            results.append(
+                ProbeResult.trusted(
+                    target=ModelTarget(provider_id=row[2], model_name=row[3]),
+                    probe_name=row[4],
+                    probe_type=ProbeType(row[5]),
+                    timestamp=datetime.datetime.fromtimestamp(row[6], tz=datetime.UTC),
+                    passed=bool(row[7]),
+                    score=row[8],
+                    latency_ms=row[9],
+                    ttft_ms=row[10],
+                    mean_itl_ms=row[11],
+                    input_tokens=row[12],
+                    output_tokens=row[13],
+                    error_reason=row[14],
+                    metric_scores=json.loads(row[15]),
+                    raw_response=raw,
+                    raw_response_ref=ref,
+                    metadata=json.loads(meta),
+                )
+            )
+        return results
+
+    def __len__(self) -> int:
+        return int(self._fetch("SELECT COUNT(*) FROM results", ())[0][0])
+
+    def window(
+        self,
+        target: ModelTarget | str | None = None,
+        probe_name: str | None = None,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        include_blobs: bool = False,
+        limit: int | None = None,
+    ) -> list[ProbeResult]:
+        """
+        Results in [start, end), oldest first.
+
+        Without include_blobs, raw_response is empty and metadata is {}.
+        """
+        where, params = self._where(target, probe_name, start, end)
+        sql = f"SELECT {_COLUMNS} FROM results{where} ORDER BY timestamp, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._to_results(self._fetch(sql, params), include_blobs)
+
+    def latest(self, target: ModelTarget | str, include_blobs: bool = False) -> dict[str, ProbeResult]:
+        """Most recent result per probe for one target."""
+        # SQLite returns the row holding MAX(timestamp) for bare columns
+        sql = f"SELECT {_COLUMNS}, MAX(timestamp) FROM results WHERE target = ? GROUP BY probe_name"
+        results = self._to_results(self._fetch(sql, (str(target),)), include_blobs)
+        return {result.probe_name: result for result in results}
+
+    def aggregate(
+        self,
+        target: ModelTarget | str | None = None,
+        probe_name: str | None = None,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ) -> list[ProbeAggregate]:
+        """Per (target, probe_name) pass rate, mean score/latency and token totals."""
+        where, params = self._where(target, probe_name, start, end)
+        sql = (
+            "SELECT target, probe_name, COUNT(*), AVG(passed), AVG(score), AVG(latency_ms), "
+            "COALESCE(SUM(input_tokens), 0), COALESCE(SUM(output_tokens), 0), MIN(timestamp), MAX(timestamp) "
+            f"FROM results{where} GROUP BY target, probe_name ORDER BY target, probe_name"
+        )
+        return [
+            ProbeAggregate(
+                target=row[0],
+                probe_name=row[1],
+                runs=row[2],
+                pass_rate=row[3],
+                mean_score=row[4],
+                mean_latency_ms=row[5],
+                input_tokens=row[6],
+                output_tokens=row[7],
+                first=datetime.datetime.fromtimestamp(row[8], tz=datetime.UTC),
+                last=datetime.datetime.fromtimestamp(row[9], tz=datetime.UTC),
+            )
+            for row in self._fetch(sql, params)
+        ]
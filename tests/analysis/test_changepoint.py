@@ -0,0 +1,73 @@
+"""Tests for streaming change-point detection."""
+
+import datetime
+import random
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.analysis import ChangePointMonitor, StreamDetector
+from nerfprobe_core.analysis.changepoint import DOWN, UP
+
+T0 = datetime.datetime(2025, 1, 1)
+TARGET = ModelTarget(provider_id="test", model_name="model-a")
+
+
+def _result(hour, ttr, latency, target=TARGET):
+    return ProbeResult(
+        probe_name="style",
+        probe_type=ProbeType.STYLE,
+        target=target,
+        timestamp=T0 + datetime.timedelta(hours=hour),
+        passed=True,
+        score=1.0,
+        latency_ms=latency,
+        metric_scores={"ttr": ttr},
+        raw_response="",
+    )
+
+
+class TestStreamDetector:
+    @pytest.mark.parametrize("method", ["cusum", "page_hinkley"])
+    def test_detects_shift_with_onset(self, method):
+        rng = random.Random(0)
+        detector = StreamDetector(method=method)
+        events = []
+        for i in range(200):
+            x = rng.gauss(0.7 if i < 100 else 0.5, 0.02)
+            change = detector.update(x, T0 + datetime.timedelta(hours=i))
+            if change:
+                events.append(change)
+        assert len(events) == 1
+        direction, onset, shifted_mean, _ = events[0]
+        assert direction == DOWN
+        assert abs((onset - (T0 + datetime.timedelta(hours=100))).total_seconds()) <= 3 * 3600
+        assert shifted_mean == pytest.approx(0.5, abs=0.05)
+
+    def test_stable_stream_is_quiet(self):
+        rng = random.Random(1)
+        detector = StreamDetector()
+        assert not any(detector.update(rng.gauss(0.7, 0.02), T0) for _ in range(2000))
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            StreamDetector(method="nope")
+
+
+class TestChangePointMonitor:
+    def test_emits_events_per_metric(self):
+        rng = random.Random(2)
+        monitor = ChangePointMonitor(metrics=["ttr", "latency_ms"])
+        events = monitor.update_many(
+            _result(h, rng.gauss(0.7, 0.02), rng.gauss(300 if h < 50 else 600, 10)) for h in range(100)
+        )
+        assert [(e.metric, e.direction) for e in events] == [("latency_ms", UP)]
+        assert events[0].target == "test/model-a"
+        assert events[0].magnitude > 5
+        assert len(monitor) == 2
+
+    def test_stream_count_bounded(self):
+        monitor = ChangePointMonitor(metrics=["ttr"], max_streams=10)
+        for i in range(50):
+            monitor.update(_result(0, 0.7, 300, ModelTarget(provider_id="p", model_name=f"m{i}")))
+        assert len(monitor) == 10
@@ -0,0 +1,69 @@
+"""Tests for TimingFingerprintIndex."""
+
+import random
+
+import pytest
+
+from nerfprobe_core import ModelTarget
+from nerfprobe_core.probes.core.timing_probe import TIMING_FEATURES, TimingAnalyzer
+
+pytest.importorskip("numpy")
+
+from nerfprobe_core.analysis.fingerprint_index import TimingFingerprintIndex  # noqa: E402
+
+FAST = ModelTarget(provider_id="openai", model_name="fast-model")
+SLOW = ModelTarget(provider_id="openai", model_name="slow-model")
+
+
+def _features(rng: random.Random, itl_ms: float, chunk_chars: int) -> dict[str, float]:
+    chunk_times = [rng.gauss(itl_ms, itl_ms * 0.1) for _ in range(40)]
+    sizes = [chunk_chars + rng.randint(-1, 1) for _ in range(41)]
+    return TimingAnalyzer.analyze(itl_ms * 10, chunk_times, sizes).features()
+
+
+@pytest.fixture
+def populated(tmp_path):
+    rng = random.Random(0)
+    index = TimingFingerprintIndex(tmp_path / "fp")
+    for _ in range(50):
+        index.add(FAST, _features(rng, 8.0, 4))
+        index.add(SLOW, _features(rng, 60.0, 12))
+    index.flush()
+    return index
+
+
+class TestTimingAnalyzer:
+    def test_features_cover_all_names(self):
+        stats = TimingAnalyzer.analyze(100.0, [10.0, 20.0, 30.0], [3, 4, 5, 6])
+        feats = stats.features()
+        assert set(feats) == set(TIMING_FEATURES)
+        assert feats["itl_p50_ms"] == 20.0
+        assert abs(sum(feats[f"itl_hist_{i}"] for i in range(8)) - 1.0) < 1e-9
+
+
+class TestTimingFingerprintIndex:
+    def test_classifies_nearest_stack(self, populated):
+        rng = random.Random(1)
+        match = populated.classify(_features(rng, 8.0, 4), k=5, expected=FAST)
+        assert match.label == str(FAST)
+        assert match.matches_expected
+        assert match.confidence > 0.9
+
+    def test_detects_swapped_stack(self, populated):
+        rng = random.Random(2)
+        match = populated.classify(_features(rng, 60.0, 12), expected=FAST)
+        assert match.label == str(SLOW)
+        assert not match.matches_expected
+
+    def test_persists_and_reloads_readonly(self, populated, tmp_path):
+        reopened = TimingFingerprintIndex(tmp_path / "fp", readonly=True)
+        assert len(reopened) == 100
+        assert set(reopened.labels) == {str(FAST), str(SLOW)}
+        neighbors = reopened.query(_features(random.Random(3), 60.0, 12), k=3, label=SLOW)
+        assert len(neighbors) == 3
+        assert all(n.label == str(SLOW) for n in neighbors)
+
+    def test_empty_index(self, tmp_path):
+        index = TimingFingerprintIndex(tmp_path / "empty")
+        match = index.classify({"ttft_ms": 100.0})
+        assert match.label is None
@@ -1,5 +1,21 @@
 """pytest configuration."""
 
+import pytest
+
+import nerfprobe_core.models as models
+
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "asyncio: mark test as async")
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(tmp_path, monkeypatch):
+    """Point the model registry's layers and cache at a per-test directory."""
+    root = tmp_path / "nerfprobe"
+    root.mkdir()
+    monkeypatch.setenv("NERFPROBE_CACHE_DIR", str(root))
+    monkeypatch.setenv("NERFPROBE_SITE_MODELS", str(root / "site.yaml"))
+    monkeypatch.setenv("NERFPROBE_USER_MODELS", str(root / "user.yaml"))
+    monkeypatch.setattr(models, "_registry", None)
+    return root
@@ -0,0 +1,101 @@
+"""Tests for ComparisonProbe."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeType
+from nerfprobe_core.probes import ComparisonProbe
+from nerfprobe_core.probes.config import ComparisonProbeConfig, MathProbeConfig
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="suspect-model")
+
+
+def _config(**kwargs):
+    wrapped = MathProbeConfig(name="math", prompt="15 * 12 + 8?", expected_answer="188")
+    return ComparisonProbeConfig(reference_model_name="reference-model", wrapped_probe_config=wrapped, **kwargs)
+
+
+class TestComparisonProbe:
+    @pytest.mark.asyncio
+    async def test_runs_target_and_reference_concurrently(self, target):
+        in_flight = 0
+        peak = 0
+
+        async def generate(model, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "188"
+
+        gateway = AsyncMock()
+        gateway.generate.side_effect = generate
+        result = await ComparisonProbe(_config(paired_trials=3)).run(target, gateway)
+        assert peak == 2
+        assert gateway.generate.call_count == 6
+        assert result.probe_type == ProbeType.COMPARISON
+        assert result.passed is True
+        assert result.metric_scores["score_delta"] == 0.0
+        assert result.metric_scores["trials"] == 3
+
+    @pytest.mark.asyncio
+    async def test_score_drop_fails(self, target):
+        gateway = AsyncMock()
+        gateway.generate.side_effect = lambda model, prompt: "190" if model == target else "188"
+        result = await ComparisonProbe(_config()).run(target, gateway)
+        assert result.passed is False
+        assert result.metric_scores["score_delta"] == 1.0
+        assert "Score" in result.error_reason
+
+    def test_budget_covers_both_models(self):
+        probe = ComparisonProbe(_config(paired_trials=2))
+        assert probe.estimated_cost.total_tokens == 4 * 100
+
+    @pytest.mark.asyncio
+    async def test_metadata_keeps_wrapped_config_fields(self, target):
+        gateway = AsyncMock()
+        gateway.generate.return_value = "188"
+        result = await ComparisonProbe(_config()).run(target, gateway)
+        wrapped = result.metadata["config"]["wrapped_probe_config"]
+        assert wrapped["prompt"] == "15 * 12 + 8?"
+        assert wrapped["expected_answer"] == "188"
+        assert result.metadata["research_ref"] == "[2504.04823]"
+
+    @pytest.mark.asyncio
+    async def test_broken_reference_does_not_pass_target(self, target):
+        async def generate(model, prompt):
+            if model.model_name == "reference-model":
+                raise Exception("401 Unauthorized")
+            return "188"
+
+        gateway = AsyncMock()
+        gateway.generate.side_effect = generate
+        result = await ComparisonProbe(_config(paired_trials=2)).run(target, gateway)
+        assert result.passed is False
+        assert result.score == 0.0
+        assert result.error_reason == "No valid paired trials (2 dropped)"
+        assert result.metadata["dropped_trials"][0].startswith("reference: ERROR")
+
+    @pytest.mark.asyncio
+    async def test_errored_pair_dropped(self, target):
+        calls = 0
+
+        async def generate(model, prompt):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise Exception("503 Service Unavailable")
+            return "188" if model.model_name == "reference-model" else "0"
+
+        gateway = AsyncMock()
+        gateway.generate.side_effect = generate
+        result = await ComparisonProbe(_config(paired_trials=3)).run(target, gateway)
+        assert result.metric_scores["trials"] == 2
+        assert result.metric_scores["dropped_trials"] == 1
+        assert result.metric_scores["score_delta"] == 1.0
@@ -0,0 +1,250 @@
+"""Tests for ContextProbe."""
+
+import re
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeType
+from nerfprobe_core.probes.advanced import ContextProbe
+from nerfprobe_core.probes.advanced.context_probe import Haystack
+from nerfprobe_core.probes.config import ContextProbeConfig
+
+
+@pytest.fixture
+def mock_gateway():
+    return AsyncMock()
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="test-model")
+
+
+class TestHaystack:
+    def test_exact_word_count(self):
+        haystack = Haystack(1001)
+        assert len(haystack.text.split()) == 1001
+
+    def test_needle_inserted_at_depth(self):
+        haystack = Haystack(1000)
+        prompt = haystack.render([(0.5, "NEEDLE.")], prefix="Context:\n", suffix="\nEnd")
+        words = prompt.split()
+        position = words.index("NEEDLE.") / len(words)
+        assert 0.45 < position < 0.55
+        assert prompt.startswith("Context:\n")
+        assert prompt.endswith("\nEnd")
+
+    def test_word_limit_uses_prefix(self):
+        haystack = Haystack(1000)
+        prompt = haystack.render([(0.9, "NEEDLE.")], word_count=200)
+        assert 195 < len(prompt.split()) < 215
+
+    def test_diverse_filler_is_seeded(self):
+        a = Haystack(500, seed=7, diverse=True)
+        b = Haystack(500, seed=7, diverse=True)
+        c = Haystack(500, seed=8, diverse=True)
+        assert a.text == b.text
+        assert a.text != c.text
+        assert len(set(a.text.split(". "))) > 20
+
+
+class TestContextProbe:
+    @pytest.mark.asyncio
+    async def test_all_depths_pass(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        probe = ContextProbe(ContextProbeConfig(context_length=500))
+        result = await probe.run(target, mock_gateway)
+        assert result.probe_type == ProbeType.CONTEXT
+        assert result.passed is True
+        assert mock_gateway.generate.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_haystack_reused_across_runs(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        probe = ContextProbe(ContextProbeConfig(context_length=500))
+        await probe.run(target, mock_gateway)
+        first = probe._haystack
+        await probe.run(target, mock_gateway)
+        assert probe._haystack is first
+
+    @pytest.mark.asyncio
+    async def test_diverse_haystack_reused_when_unseeded(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        probe = ContextProbe(ContextProbeConfig(context_length=500, diverse_filler=True))
+        first = await probe.run(target, mock_gateway)
+        haystack = probe._haystack
+        second = await probe.run(target, mock_gateway)
+        assert probe._haystack is haystack
+        assert first.metadata["seed"] != second.metadata["seed"]
+
+    @pytest.mark.asyncio
+    async def test_diverse_filler_fits_default_budget(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        result = await ContextProbe(ContextProbeConfig(diverse_filler=True)).run(target, mock_gateway)
+        assert not result.raw_response.startswith("SKIPPED")
+        assert result.passed is True
+
+
+def _answer_from_context(prompt: str) -> str:
+    """Answer multi-needle questions by reading the premises in the prompt."""
+    lines = []
+    questions = prompt.split("Questions:\n")[1].split("\n\n")[0].splitlines()
+    for line in questions:
+        num, rest = line.split(". ", 1)
+        obj = re.search(r"Is (Ref-X\w+) magnetic", rest).group(1)
+        prop = re.search(rf"{obj} is composed of (\w+)\.", prompt).group(1)
+        negated = f"composed of {prop} are not magnetic" in prompt
+        lines.append(f"{num}: {'No' if negated else 'Yes'}")
+    return "\n".join(lines)
+
+
+class TestMultiNeedle:
+    def test_parse_numbered_answers(self):
+        parsed = ContextProbe._parse_numbered_answers("1: Yes\n2. no\n**3)** Yes")
+        assert parsed == {1: "yes", 2: "no", 3: "yes"}
+
+    @pytest.mark.asyncio
+    async def test_single_request_scores_each_depth(self, mock_gateway, target):
+        mock_gateway.generate.side_effect = lambda t, p: _answer_from_context(p)
+        probe = ContextProbe(ContextProbeConfig(context_length=600, multi_needle=True))
+        result = await probe.run(target, mock_gateway)
+        assert mock_gateway.generate.call_count == 1
+        assert result.passed is True
+        assert result.metadata["depth_results"] == {0.1: True, 0.5: True, 0.9: True}
+
+    @pytest.mark.asyncio
+    async def test_middle_failure_detected(self, mock_gateway, target):
+        def answer(t, p):
+            lines = _answer_from_context(p).splitlines()
+            flipped = "No" if lines[1].endswith("Yes") else "Yes"
+            lines[1] = f"2: {flipped}"
+            return "\n".join(lines)
+
+        mock_gateway.generate.side_effect = answer
+        probe = ContextProbe(ContextProbeConfig(context_length=600, multi_needle=True))
+        result = await probe.run(target, mock_gateway)
+        assert result.metadata["middle_failure"] is True
+        assert result.passed is False
+
+    def test_cost_counts_one_context(self):
+        single = ContextProbe(ContextProbeConfig(context_length=1000))
+        multi = ContextProbe(ContextProbeConfig(context_length=1000, multi_needle=True))
+        assert multi.estimated_cost.input_tokens * 3 == single.estimated_cost.input_tokens
+
+
+class TestEffectiveLengthSearch:
+    @staticmethod
+    def _limited(max_words: int):
+        def answer(t, p):
+            if len(p.split()) > max_words:
+                return "I could not find that."
+            return _answer_from_context(p)
+
+        return answer
+
+    @pytest.mark.asyncio
+    async def test_bisects_to_effective_length(self, mock_gateway, target):
+        mock_gateway.generate.side_effect = self._limited(5000)
+        config = ContextProbeConfig(
+            context_length=8000,
+            multi_needle=True,
+            search_effective_length=True,
+            max_tokens_per_run=10_000_000,
+        )
+        result = await ContextProbe(config).run(target, mock_gateway)
+        effective = result.metric_scores["effective_context_words"]
+        assert 4500 <= effective <= 5000
+        assert result.passed is False
+        assert result.metric_scores["calls_used"] == mock_gateway.generate.call_count
+        assert mock_gateway.generate.call_count < 10
+
+    @pytest.mark.asyncio
+    async def test_upper_bound_from_model_registry(self, mock_gateway):
+        mock_gateway.generate.side_effect = self._limited(10**9)
+        config = ContextProbeConfig(multi_needle=True, search_effective_length=True, search_max_tokens=10**9)
+        target = ModelTarget(provider_id="openai", model_name="gpt-5.2")
+        result = await ContextProbe(config).run(target, mock_gateway)
+        assert result.metric_scores["max_context_words"] > 100_000
+        assert result.metric_scores["effective_context_words"] == result.metric_scores["max_context_words"]
+        assert result.passed is True
+        assert mock_gateway.generate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_default_config_runs(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        result = await ContextProbe(ContextProbeConfig(search_effective_length=True)).run(target, mock_gateway)
+        assert not result.raw_response.startswith("SKIPPED")
+        assert result.passed is True
+        assert result.metric_scores["max_context_words"] == 4000
+
+    @pytest.mark.asyncio
+    async def test_upper_bound_shrinks_to_budget(self, mock_gateway):
+        mock_gateway.generate.return_value = "Yes"
+        probe = ContextProbe(ContextProbeConfig(search_effective_length=True))
+        target = ModelTarget(provider_id="openai", model_name="gpt-5.2")
+        result = await probe.run(target, mock_gateway)
+        upper = int(result.metric_scores["max_context_words"])
+        assert 1000 < upper < result.metric_scores["window_context_words"]
+        assert probe._search_cost(upper, target.model_name).total_tokens <= probe.config.search_max_tokens
+
+    def test_cost_sums_step_lengths(self):
+        probe = ContextProbe(ContextProbeConfig(multi_needle=True, search_resolution=0.25))
+        assert probe._search_lengths(8000) == [8000, 1000, 4500, 6250]
+        assert probe._search_cost(8000).input_tokens == sum(probe._haystack_tokens(n) for n in (8000, 1000, 4500, 6250))
+
+    @pytest.mark.asyncio
+    async def test_search_max_length(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        config = ContextProbeConfig(search_effective_length=True, search_max_length=2000)
+        result = await ContextProbe(config).run(target, mock_gateway)
+        assert result.metric_scores["max_context_words"] == 2000
+
+    @pytest.mark.asyncio
+    async def test_search_respects_budget(self, mock_gateway, target):
+        config = ContextProbeConfig(search_effective_length=True, search_max_tokens=1000)
+        result = await ContextProbe(config).run(target, mock_gateway)
+        assert result.raw_response.startswith("SKIPPED")
+        mock_gateway.generate.assert_not_called()
+
+
+class TestSeeding:
+    @pytest.mark.asyncio
+    async def test_same_seed_same_prompts(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        config = ContextProbeConfig(context_length=300, diverse_filler=True, seed=42)
+        first = await ContextProbe(config).run(target, mock_gateway)
+        prompts_a = [c.args[1] for c in mock_gateway.generate.call_args_list]
+        mock_gateway.generate.reset_mock()
+        await ContextProbe(config).run(target, mock_gateway)
+        prompts_b = [c.args[1] for c in mock_gateway.generate.call_args_list]
+        assert prompts_a == prompts_b
+        assert first.metadata["seed"] == 42
+
+    @pytest.mark.asyncio
+    async def test_unseeded_run_records_seed(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        result = await ContextProbe(ContextProbeConfig(context_length=300)).run(target, mock_gateway)
+        prompts = [c.args[1] for c in mock_gateway.generate.call_args_list]
+        mock_gateway.generate.reset_mock()
+        replay = ContextProbeConfig(context_length=300, seed=result.metadata["seed"])
+        await ContextProbe(replay).run(target, mock_gateway)
+        assert [c.args[1] for c in mock_gateway.generate.call_args_list] == prompts
+
+    @pytest.mark.asyncio
+    async def test_filler_seed_recorded(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        config = ContextProbeConfig(context_length=300, diverse_filler=True, filler_seed=5)
+        assert (await ContextProbe(config).run(target, mock_gateway)).metadata["filler_seed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_filler_seed_from_run_seed(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "Yes"
+        config = ContextProbeConfig(context_length=300, diverse_filler=True, filler_seed=None)
+        result = await ContextProbe(config).run(target, mock_gateway)
+        assert result.metadata["filler_seed"] == result.metadata["seed"]
+        prompts = [c.args[1] for c in mock_gateway.generate.call_args_list]
+        mock_gateway.generate.reset_mock()
+        replay = config.model_copy(update={"seed": result.metadata["seed"]})
+        await ContextProbe(replay).run(target, mock_gateway)
+        assert [c.args[1] for c in mock_gateway.generate.call_args_list] == prompts
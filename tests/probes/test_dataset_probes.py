@@ -0,0 +1,163 @@
+"""Tests for dataset-backed probe runs."""
+
+import json
+import re
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeType
+from nerfprobe_core.probes.config import DatasetConfig, FactProbeConfig, MathProbeConfig
+from nerfprobe_core.probes.core import FactProbe, MathProbe
+from nerfprobe_core.probes.dataset import DatasetReader, extract_answer, wilson_interval
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="test-model")
+
+
+@pytest.fixture
+def gsm_file(tmp_path):
+    path = tmp_path / "gsm.jsonl"
+    with open(path, "w") as f:
+        for i in range(300):
+            level = "hard" if i % 3 == 0 else "easy"
+            row = {
+                "question": f"Item {i}: what is {i} + 1?",
+                "answer": f"{i} + 1 = {i + 1}\n#### {i + 1}",
+                "level": level,
+            }
+            f.write(json.dumps(row) + "\n")
+    return path
+
+
+def _solver(correct_every: int):
+    async def generate(target, prompt):
+        n = int(re.search(r"what is (\d+)", prompt).group(1))
+        return f"The answer is {n + 1}" if n % correct_every == 0 else "I am not sure"
+
+    return generate
+
+
+class TestDatasetReader:
+    def test_offsets_and_items(self, gsm_file):
+        with DatasetReader(DatasetConfig(path=str(gsm_file))) as reader:
+            assert len(reader) == 300
+            assert reader.item(42)["question"].startswith("Item 42:")
+
+    def test_stratified_sample_is_proportional_and_seeded(self, gsm_file):
+        import random
+
+        config = DatasetConfig(path=str(gsm_file), stratify_field="level")
+        with DatasetReader(config) as reader:
+            a = list(reader.sample(random.Random(1), 30))
+            b = list(reader.sample(random.Random(1), 30))
+            assert a == b
+            assert len(a) == 30
+            assert sum(reader.stratum(i) == "hard" for i in a) == 10
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "facts.csv"
+        path.write_text("question,answer\nCapital of France?,Paris\nCapital of Japan?,Tokyo\n")
+        with DatasetReader(DatasetConfig(path=str(path))) as reader:
+            assert len(reader) == 2
+            assert reader.item(1) == {"question": "Capital of Japan?", "answer": "Tokyo"}
+
+
+class TestHelpers:
+    def test_extract_gsm8k_answer(self):
+        assert extract_answer("Some steps\n#### 72") == "72"
+        assert extract_answer(" Paris ") == "Paris"
+
+    def test_wilson_interval_brackets_proportion(self):
+        low, high = wilson_interval(80, 100)
+        assert low < 0.8 < high
+        assert high - low < 0.2
+
+
+class TestDatasetProbes:
+    @pytest.mark.asyncio
+    async def test_math_probe_accuracy_with_ci(self, gsm_file, target):
+        gateway = AsyncMock()
+        gateway.generate.side_effect = _solver(correct_every=2)
+        dataset = DatasetConfig(path=str(gsm_file), sample_size=100, concurrency=4, min_accuracy=0.9)
+        config = MathProbeConfig(name="gsm", prompt="", expected_answer="", dataset=dataset, seed=3)
+        result = await MathProbe(config).run(target, gateway)
+
+        assert result.probe_type == ProbeType.MATH
+        assert gateway.generate.call_count == 100
+        assert result.metric_scores["items"] == 100
+        assert 0.35 < result.score < 0.65
+        assert result.metric_scores["ci_low"] < result.score < result.metric_scores["ci_high"]
+        assert result.passed is False
+        assert result.metadata["seed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_fact_probe_csv_dataset(self, tmp_path, target):
+        path = tmp_path / "facts.csv"
+        path.write_text("question,answer\nCapital of France?,Paris\nCapital of Japan?,Tokyo\n")
+        gateway = AsyncMock()
+        gateway.generate.side_effect = lambda t, p: "Paris" if "France" in p else "Tokyo"
+        dataset = DatasetConfig(path=str(path), min_accuracy=0.5)
+        config = FactProbeConfig(name="facts", prompt="", expected_text="", dataset=dataset)
+        result = await FactProbe(config).run(target, gateway)
+        assert result.score == 1.0
+        assert result.passed is True
+
+    @pytest.mark.asyncio
+    async def test_dataset_run_respects_budget(self, gsm_file, target):
+        gateway = AsyncMock()
+        dataset = DatasetConfig(path=str(gsm_file), sample_size=100, max_tokens=5000)
+        config = MathProbeConfig(name="gsm", prompt="", expected_answer="", dataset=dataset)
+        result = await MathProbe(config).run(target, gateway)
+        assert result.raw_response.startswith("SKIPPED")
+        assert result.metadata["items"] == 100
+        assert result.metadata["budget"] == 5000
+        gateway.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_default_budget_scales_per_item(self, gsm_file, target):
+        gateway = AsyncMock()
+        gateway.generate.side_effect = _solver(correct_every=1)
+        dataset = DatasetConfig(path=str(gsm_file), sample_size=50)
+        config = MathProbeConfig(name="gsm", prompt="", expected_answer="", dataset=dataset, max_tokens_per_run=100)
+        result = await MathProbe(config).run(target, gateway)
+        assert result.metric_scores["items"] == 50
+
+        tight = config.model_copy(update={"max_tokens_per_run": 99})
+        assert (await MathProbe(tight).run(target, gateway)).raw_response.startswith("SKIPPED")
+
+    @pytest.mark.asyncio
+    async def test_empty_dataset(self, tmp_path, target):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        dataset = DatasetConfig(path=str(path))
+        config = MathProbeConfig(name="gsm", prompt="", expected_answer="", dataset=dataset)
+        result = await MathProbe(config).run(target, AsyncMock())
+        assert result.passed is False
+        assert result.error_reason == "Empty dataset"
+
+    @pytest.mark.asyncio
+    async def test_malformed_rows_fail_only_their_item(self, tmp_path, target):
+        path = tmp_path / "mixed.jsonl"
+        rows = [
+            json.dumps({"question": "what is 1 + 1?", "answer": "#### 2"}),
+            "{not json",
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"question": "what is 2 + 1?", "answer": "#### 3"}),
+        ]
+        path.write_text("\n".join(rows) + "\n")
+        gateway = AsyncMock()
+        gateway.generate.side_effect = _solver(correct_every=1)
+        dataset = DatasetConfig(path=str(path), prompt_template="{prompt} {missing}", min_accuracy=0.0)
+        config = MathProbeConfig(name="gsm", prompt="", expected_answer="", dataset=dataset)
+        result = await MathProbe(config).run(target, gateway)
+        assert result.metric_scores["items"] == 4
+        assert result.metric_scores["errors"] == 4
+        assert result.error_reason == "All requests failed"
+
+        dataset = dataset.model_copy(update={"prompt_template": "{prompt}"})
+        result = await MathProbe(config.model_copy(update={"dataset": dataset})).run(target, gateway)
+        assert result.metric_scores["errors"] == 2
+        assert result.score == 0.5
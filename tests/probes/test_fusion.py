@@ -0,0 +1,160 @@
+"""Tests for probe fusion."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget
+from nerfprobe_core.core.entities import StrWithUsage
+from nerfprobe_core.probes import (
+    CalibrationProbe,
+    CalibrationProbeConfig,
+    FactProbe,
+    FactProbeConfig,
+    MathProbe,
+    MathProbeConfig,
+    RoutingProbe,
+    RoutingProbeConfig,
+    StyleProbe,
+    StyleProbeConfig,
+    run_fused,
+)
+from nerfprobe_core.probes.fusion import attribute_tokens, build_fused_prompt, split_fused_response
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="test-model")
+
+
+class TestFusionHelpers:
+    def test_split_round_trip(self):
+        prompt = build_fused_prompt(["a?", "b?", "c?"])
+        assert "[3] c?" in prompt
+        answers = split_fused_response("[1] 188\n[3] Paris\nsecond line", 3)
+        assert answers == ["188", "", "Paris\nsecond line"]
+
+    def test_attribute_tokens_sums_to_total(self):
+        shares = attribute_tokens(100, [1, 1, 1])
+        assert sum(shares) == 100
+        assert max(shares) - min(shares) <= 1
+        assert attribute_tokens(10, [0, 0]) == [5, 5]
+
+
+class TestRunFused:
+    @pytest.mark.asyncio
+    async def test_fuses_compatible_probes_into_one_request(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="math", prompt="15 * 12 + 8?", expected_answer="188")),
+            FactProbe(FactProbeConfig(name="fact", prompt="Capital of Japan?", expected_text="Tokyo")),
+            CalibrationProbe(CalibrationProbeConfig(name="calibration")),
+        ]
+        gateway = AsyncMock()
+        gateway.generate.return_value = StrWithUsage(
+            "[1] 188\n[2] Tokyo\n[3] Answer: Paris. Confidence: 0.95",
+            {"prompt_tokens": 90, "completion_tokens": 30},
+        )
+
+        results = await run_fused(probes, target, gateway)
+        assert gateway.generate.call_count == 1
+        assert [r.probe_name for r in results] == ["math", "fact", "calibration"]
+        assert all(r.passed for r in results)
+        assert all(r.metadata["fused"] for r in results)
+        assert sum(r.input_tokens for r in results) == 90
+        assert sum(r.output_tokens for r in results) == 30
+
+    @pytest.mark.asyncio
+    async def test_routing_easy_prompts_fused_hard_prompts_direct(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="math", prompt="15 * 12 + 8?", expected_answer="188")),
+            RoutingProbe(RoutingProbeConfig()),
+            StyleProbe(StyleProbeConfig(name="style")),
+        ]
+
+        async def generate(model, prompt):
+            if prompt.startswith("Answer each numbered question"):
+                return "[1] 188\n[2] 57\n[3] Paris"
+            if "Solve for x" in prompt:
+                return "x=1 or x=3"
+            if "ontological" in prompt:
+                return "word " * 60
+            return "A varied and interesting piece of prose about the sea."
+
+        gateway = AsyncMock()
+        gateway.generate.side_effect = generate
+        results = await run_fused(probes, target, gateway)
+
+        # 1 fused + 2 hard routing prompts + 1 style
+        assert gateway.generate.call_count == 4
+        math, routing, style = results
+        assert math.passed and math.metadata["fused"]
+        assert routing.metadata["fused"] and routing.metadata["easy_results"] == [True, True]
+        assert "fused" not in style.metadata
+
+    @pytest.mark.asyncio
+    async def test_fused_request_error_marks_every_part(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="m1", prompt="1+1?", expected_answer="2")),
+            MathProbe(MathProbeConfig(name="m2", prompt="2+2?", expected_answer="4")),
+        ]
+        gateway = AsyncMock()
+        gateway.generate.side_effect = Exception("429 Too Many Requests")
+        results = await run_fused(probes, target, gateway)
+        assert [r.error_reason for r in results] == ["Rate Limit", "Rate Limit"]
+
+    @pytest.mark.asyncio
+    async def test_probe_subclass_is_fused(self, target):
+        class StrictMathProbe(MathProbe):
+            pass
+
+        probes = [
+            StrictMathProbe(MathProbeConfig(name="m1", prompt="1+1?", expected_answer="2")),
+            MathProbe(MathProbeConfig(name="m2", prompt="2+2?", expected_answer="4")),
+        ]
+        gateway = AsyncMock()
+        gateway.generate.return_value = "[1] 2\n[2] 4"
+        results = await run_fused(probes, target, gateway)
+        assert gateway.generate.call_count == 1
+        assert [r.passed for r in results] == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_missing_answer_gets_error_result(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="m1", prompt="1+1?", expected_answer="2")),
+            MathProbe(MathProbeConfig(name="m2", prompt="2+2?", expected_answer="4")),
+        ]
+        gateway = AsyncMock()
+        gateway.generate.return_value = "[1] 2"
+        results = await run_fused(probes, target, gateway)
+        assert len(results) == len(probes)
+        assert results[0].passed
+        assert results[1].raw_response.startswith("ERROR:")
+        assert results[1].metadata["fused"]
+
+    @pytest.mark.asyncio
+    async def test_over_budget_probe_skipped(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="m1", prompt="1+1?", expected_answer="2")),
+            MathProbe(MathProbeConfig(name="m2", prompt="2+2?", expected_answer="4")),
+            RoutingProbe(RoutingProbeConfig(max_tokens_per_run=100)),
+        ]
+        gateway = AsyncMock()
+        gateway.generate.return_value = "[1] 2\n[2] 4"
+        results = await run_fused(probes, target, gateway)
+        assert len(results) == len(probes)
+        assert gateway.generate.call_count == 1
+        assert [r.passed for r in results[:2]] == [True, True]
+        assert results[2].raw_response.startswith("SKIPPED")
+
+    @pytest.mark.asyncio
+    async def test_standalone_runs_share_the_budget_check(self, target):
+        probes = [
+            MathProbe(MathProbeConfig(name="m", prompt="1+1?", expected_answer="2", max_tokens_per_run=50)),
+            FactProbe(FactProbeConfig(name="f", prompt="Capital?", expected_text="Tokyo", max_tokens_per_run=50)),
+        ]
+        gateway = AsyncMock()
+        for probe in probes:
+            result = await probe.run(target, gateway)
+            assert result.raw_response.startswith("SKIPPED")
+            assert result.passed is False
+        gateway.generate.assert_not_called()
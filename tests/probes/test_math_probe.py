@@ -48,3 +48,13 @@ class TestMathProbe:
         result = await probe.run(target, mock_gateway)
         assert result.passed is False
         assert "ERROR" in result.raw_response
+
+    @pytest.mark.asyncio
+    async def test_results_get_their_own_config(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "252"
+        probe = MathProbe(MathProbeConfig(name="math_test", prompt="test", expected_answer="252"))
+        first = await probe.run(target, mock_gateway)
+        second = await probe.run(target, mock_gateway)
+        first.metadata["config"]["name"] = "mutated"
+        assert second.metadata["config"]["name"] == "math_test"
+        assert (await probe.run(target, mock_gateway)).metadata["config"]["name"] == "math_test"
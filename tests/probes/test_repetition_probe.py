@@ -27,3 +27,27 @@ class TestRepetitionProbe:
         probe = RepetitionProbe(config)
         result = await probe.run(target, mock_gateway)
         assert result.passed is True
+
+    @pytest.mark.asyncio
+    async def test_diversity_metric_criterion(self, mock_gateway, target):
+        # Few exact 4-gram repeats, but a tiny vocabulary
+        mock_gateway.generate.return_value = " ".join(
+            ["red blue green", "blue red green", "green blue red", "green red blue", "red green blue"] * 4
+        )
+        config = RepetitionProbeConfig(name="rep_test", max_repeats=10, min_ngram_ttr=0.0, diversity_metric="yules_k")
+        result = await RepetitionProbe(config).run(target, mock_gateway)
+        assert result.passed is False
+        assert result.error_reason.startswith("yules_k")
+
+    @pytest.mark.asyncio
+    async def test_loop_coverage_fails(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "The reforms began. " + "And the senate voted; and THE senate voted. " * 8
+        config = RepetitionProbeConfig(name="rep_test", max_repeats=100, min_ngram_ttr=0.0)
+        result = await RepetitionProbe(config).run(target, mock_gateway)
+        assert result.passed is True  # Loop coverage is reported but off by default
+        assert result.metric_scores["loop_coverage"] > 0.3
+
+        strict = config.model_copy(update={"max_loop_coverage": 0.3})
+        result = await RepetitionProbe(strict).run(target, mock_gateway)
+        assert result.passed is False
+        assert result.error_reason.startswith("Loop coverage")
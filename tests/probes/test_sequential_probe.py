@@ -0,0 +1,115 @@
+"""Tests for SequentialProbe."""
+
+import itertools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget
+from nerfprobe_core.probes import SequentialProbe
+from nerfprobe_core.probes.config import MathProbeConfig, SequentialTestConfig
+from nerfprobe_core.probes.utility.sequential_probe import DEGRADED, HEALTHY, SequentialTest, beta_cdf
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="test-model")
+
+
+def _math_config(**kwargs):
+    wrapped = MathProbeConfig(name="math", prompt="2+2?", expected_answer="4")
+    return SequentialTestConfig(wrapped_probe_config=wrapped, **kwargs)
+
+
+class TestSequentialTest:
+    def test_beta_cdf_uniform(self):
+        assert beta_cdf(0.3, 1.0, 1.0) == pytest.approx(0.3)
+        assert beta_cdf(0.5, 5.0, 5.0) == pytest.approx(0.5)
+
+    def test_sprt_all_failures_is_degraded(self):
+        test = SequentialTest(p0=0.95, p1=0.75, alpha=0.05, beta=0.1)
+        decisions = [test.update(0.0) for _ in range(3)]
+        assert decisions[-1] == DEGRADED
+
+    def test_sprt_all_passes_is_healthy(self):
+        test = SequentialTest(p0=0.95, p1=0.75, alpha=0.05, beta=0.1)
+        for _ in range(30):
+            if test.update(1.0) == HEALTHY:
+                break
+        assert test.decision == HEALTHY
+        assert test.samples < 30
+
+    def test_bayes_method(self):
+        test = SequentialTest(p0=0.95, p1=0.75, alpha=0.05, beta=0.1, method="bayes")
+        for _ in range(20):
+            test.update(0.0)
+        assert test.decision == DEGRADED
+
+    def test_invalid_rates(self):
+        with pytest.raises(ValueError):
+            SequentialTest(p0=0.5, p1=0.9, alpha=0.05, beta=0.1)
+
+
+class TestSequentialProbe:
+    @pytest.mark.asyncio
+    async def test_stops_early_when_degraded(self, target):
+        gateway = AsyncMock()
+        gateway.generate.return_value = "5"
+        result = await SequentialProbe(_math_config()).run(target, gateway)
+        assert result.passed is False
+        assert result.metadata["decision"] == DEGRADED
+        assert result.metric_scores["samples_used"] < 10
+        assert gateway.generate.call_count == result.metric_scores["samples_used"]
+
+    @pytest.mark.asyncio
+    async def test_healthy_model_passes(self, target):
+        gateway = AsyncMock()
+        gateway.generate.return_value = "4"
+        result = await SequentialProbe(_math_config()).run(target, gateway)
+        assert result.passed is True
+        assert result.metadata["decision"] == HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_max_samples_inconclusive(self, target):
+        gateway = AsyncMock()
+        answers = itertools.cycle(["4", "4", "4", "5"])
+        gateway.generate.side_effect = lambda t, p: next(answers)
+        result = await SequentialProbe(_math_config(max_samples=8)).run(target, gateway)
+        assert result.metric_scores["samples_used"] == 8
+        assert result.metadata["decision"] == "inconclusive"
+
+    @pytest.mark.asyncio
+    async def test_token_budget_stops_sampling(self, target):
+        gateway = AsyncMock()
+        gateway.generate.return_value = "4"
+        result = await SequentialProbe(_math_config(max_tokens_per_run=250)).run(target, gateway)
+        assert result.metric_scores["samples_used"] == 2
+        assert result.metadata["budget_exhausted"] is True
+
+    @pytest.mark.asyncio
+    async def test_gateway_errors_are_not_degradation(self, target):
+        gateway = AsyncMock()
+        gateway.generate.side_effect = Exception("429 Too Many Requests")
+        result = await SequentialProbe(_math_config(max_samples=5)).run(target, gateway)
+        assert result.metadata["decision"] == "inconclusive"
+        assert result.metadata["excluded"] == 5
+        assert result.metric_scores["samples_used"] == 0
+        assert result.passed is False
+        assert result.error_reason.startswith("No valid runs")
+
+    @pytest.mark.asyncio
+    async def test_errored_runs_excluded_from_test(self, target):
+        gateway = AsyncMock()
+        replies = iter([Exception("429 Too Many Requests"), Exception("503 Service Unavailable")])
+
+        async def generate(model, prompt):
+            reply = next(replies, "4")
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        gateway.generate.side_effect = generate
+        result = await SequentialProbe(_math_config()).run(target, gateway)
+        assert result.metadata["decision"] == HEALTHY
+        assert result.metadata["excluded"] == 2
+        assert 0.0 not in result.metadata["outcomes"]
@@ -38,3 +38,18 @@ class TestStyleProbe:
         probe = StyleProbe(config)
         result = await probe.run(target, mock_gateway)
         assert result.passed is False
+
+    @pytest.mark.asyncio
+    async def test_pass_metric_compression_ratio(self, mock_gateway, target):
+        mock_gateway.generate.return_value = "The robot waters the garden every morning. " * 30
+        config = StyleProbeConfig(name="style_test", pass_metric="compression_ratio", sliding_window_size=0)
+        probe = StyleProbe(config)
+        result = await probe.run(target, mock_gateway)
+        assert result.passed is False
+        assert result.error_reason.startswith("compression_ratio")
+        for key in ("mtld", "hdd", "yules_k", "compression_ratio"):
+            assert key in result.metric_scores
+
+    def test_unknown_pass_metric(self):
+        with pytest.raises(ValueError, match="pass_metric"):
+            StyleProbe(StyleProbeConfig(name="style_test", pass_metric="nope"))
@@ -0,0 +1,98 @@
+"""Tests for TemporalProbe."""
+
+import json
+import os
+import re
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeType
+from nerfprobe_core.probes import TemporalConsistencyConfig, TemporalProbe
+from nerfprobe_core.probes.optional.temporal_probe import _read_events
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="test-model")
+
+
+@pytest.fixture
+def events(tmp_path):
+    """Three events per month, 2024-01 through 2025-12."""
+    rows = {}
+    for year in (2024, 2025):
+        for month in range(1, 13):
+            for i in range(3):
+                question = f"Who won event {year}-{month}-{i}?"
+                rows[question] = (date(year, month, 10 + i), f"Team {year}{month}{i}")
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"date": d.isoformat(), "question": q, "answer": a}) for q, (d, a) in rows.items())
+    )
+    return path, rows
+
+
+def _gateway(rows, true_cutoff):
+    def generate(model, prompt):
+        lines = []
+        for num, question in re.findall(r"^(\d+): (.*)$", prompt, re.MULTILINE):
+            when, answer = rows[question]
+            lines.append(f"{num}: {answer if when <= true_cutoff else 'unknown'}")
+        return "\n".join(lines)
+
+    gateway = AsyncMock()
+    gateway.generate.side_effect = generate
+    return gateway
+
+
+class TestTemporalProbe:
+    @pytest.mark.asyncio
+    async def test_matching_cutoff_passes_with_few_requests(self, target, events):
+        path, rows = events
+        config = TemporalConsistencyConfig(cutoff_date=date(2024, 12, 31), events_path=str(path), seed=1)
+        result = await TemporalProbe(config).run(target, _gateway(rows, date(2024, 12, 31)))
+        assert result.probe_type == ProbeType.TEMPORAL
+        assert result.passed is True
+        assert result.metadata["effective_cutoff"] == "2024-12-31"
+        assert result.metric_scores["requests"] <= 5
+        assert result.metadata["research_ref"]
+
+    @pytest.mark.asyncio
+    async def test_shifted_cutoff_fails(self, target, events):
+        path, rows = events
+        config = TemporalConsistencyConfig(cutoff_date=date(2024, 12, 31), events_path=str(path), seed=1)
+        result = await TemporalProbe(config).run(target, _gateway(rows, date(2024, 6, 30)))
+        assert result.passed is False
+        assert result.metadata["effective_cutoff"] == "2024-06-30"
+        assert result.metric_scores["cutoff_shift_days"] < 0
+        assert "earlier" in result.error_reason
+
+    @pytest.mark.asyncio
+    async def test_unknown_cutoff_fails(self, target, events):
+        path, _ = events
+        gateway = AsyncMock()
+        result = await TemporalProbe(TemporalConsistencyConfig(events_path=str(path))).run(target, gateway)
+        assert result.passed is False
+        assert result.error_reason == "No cutoff"
+        gateway.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bad_events_file_fails(self, target, tmp_path):
+        gateway = AsyncMock()
+        config = TemporalConsistencyConfig(cutoff_date=date(2024, 12, 31), events_path=str(tmp_path / "missing.jsonl"))
+        result = await TemporalProbe(config).run(target, gateway)
+        assert result.passed is False
+        assert result.error_reason == "Bad events"
+        gateway.generate.assert_not_called()
+
+
+class TestEventCache:
+    def test_reused_until_file_changes(self, events):
+        path, _ = events
+        first = _read_events(str(path))
+        assert _read_events(str(path)) is first
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _read_events(str(path)) is not first
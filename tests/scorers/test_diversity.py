@@ -0,0 +1,67 @@
+"""Tests for lexical diversity metrics."""
+
+from collections import Counter
+
+import pytest
+
+from nerfprobe_core.scorers.diversity import (
+    compression_ratio,
+    hdd,
+    lexical_diversity,
+    meets_threshold,
+    mtld,
+    yules_k,
+)
+
+STORY = (
+    "Unit 7 had been built to weld steel beams, but after the factory closed it wandered into an abandoned "
+    "lot behind the old library. Weeds pushed through cracked asphalt, and a single sunflower leaned toward "
+    "the light. The robot knelt, servos whining, and studied the flower for hours."
+)
+LOOP = "The robot loves the garden. " * 20
+
+
+def _metrics(text):
+    return lexical_diversity(text.lower().split(), text)
+
+
+class TestLexicalDiversity:
+    def test_loop_scores_worse_than_story(self):
+        story, loop = _metrics(STORY), _metrics(LOOP)
+        assert story["mtld"] > loop["mtld"]
+        assert story["hdd"] > loop["hdd"]
+        assert story["yules_k"] < loop["yules_k"]
+        assert story["compression_ratio"] < loop["compression_ratio"]
+
+    def test_empty(self):
+        assert lexical_diversity([], "") == {"mtld": 0.0, "hdd": 0.0, "yules_k": 0.0, "compression_ratio": 0.0}
+
+    def test_mtld_factor_counting(self):
+        # Forward: TTR hits 0.6 at the 5th token (one factor), then 6 unique tokens
+        tokens = ["a", "b", "c", "a", "b", "c", "d", "e", "f", "a", "b"]
+        assert mtld(tokens) > 0
+        assert mtld([str(i) for i in range(50)]) == 50.0
+        assert mtld(["a"] * 10) == pytest.approx(2.0)
+
+    def test_hdd_short_text_is_ttr(self):
+        tokens = ["a", "b", "a", "c"]
+        spectrum = Counter(Counter(tokens).values())
+        assert hdd(spectrum, len(tokens)) == pytest.approx(3 / 4)
+
+    def test_hdd_all_unique(self):
+        spectrum = Counter({1: 100})
+        assert hdd(spectrum, 100) == pytest.approx(1.0)
+
+    def test_yules_k(self):
+        # N=4, frequencies {2, 1, 1}: (4 + 1 + 1 - 4) / 16 * 1e4
+        assert yules_k(Counter({2: 1, 1: 2}), 4) == pytest.approx(1250.0)
+        assert yules_k(Counter({1: 10}), 10) == 0.0
+
+    def test_compression_ratio(self):
+        assert compression_ratio("") == 0.0
+        assert compression_ratio("ab" * 1000) > 20
+
+    def test_meets_threshold_direction(self):
+        assert meets_threshold("mtld", 60.0, 40.0)
+        assert not meets_threshold("yules_k", 400.0, 300.0)
+        assert meets_threshold("compression_ratio", 1.8, 3.0)
@@ -0,0 +1,101 @@
+"""Tests for script and language detection."""
+
+import pytest
+
+from nerfprobe_core.scorers import MultilingualScorer, detect_language, detect_languages
+from nerfprobe_core.scorers.language import LANGUAGE_SCRIPTS, is_identifiable
+
+SAMPLES = {
+    "en": "Our team reviewed the proposal carefully and decided to postpone the launch until next spring.",
+    "fr": "Notre équipe a examiné la proposition avec soin et a décidé de reporter le lancement au printemps prochain.",
+    "de": "Unser Team hat den Vorschlag sorgfältig geprüft und beschlossen, den Start auf das nächste Frühjahr zu verschieben.",  # noqa: E501
+    "es": "Nuestro equipo revisó la propuesta con cuidado y decidió posponer el lanzamiento hasta la próxima primavera.",
+    "pt": "Nossa equipe analisou a proposta com cuidado e decidiu adiar o lançamento até a próxima primavera.",
+    "it": "Il nostro team ha esaminato attentamente la proposta e ha deciso di rinviare il lancio alla prossima primavera.",
+    "nl": "Ons team heeft het voorstel zorgvuldig bekeken en besloten de lancering uit te stellen tot volgend voorjaar.",
+    "ja": "私たちのチームは提案を慎重に検討し、来春まで発売を延期することにしました。",
+    "zh": "我们的团队仔细审查了该提案，并决定将发布推迟到明年春天。",
+    "ru": "Наша команда внимательно изучила предложение и решила отложить запуск до следующей весны.",
+    "ko": "우리 팀은 제안을 신중하게 검토한 후 출시를 내년 봄으로 연기하기로 결정했습니다.",
+}
+
+
+class TestDetectLanguage:
+    @pytest.mark.parametrize("lang", list(SAMPLES))
+    def test_detects_sample(self, lang):
+        guess = detect_language(SAMPLES[lang])
+        assert guess.language == lang
+        assert guess.confidence > 0
+        assert guess.purity(LANGUAGE_SCRIPTS[lang]) == 1.0
+
+    def test_batch_matches_single(self):
+        texts = list(SAMPLES.values())
+        assert detect_languages(texts) == [detect_language(t) for t in texts]
+
+    def test_empty_and_symbols(self):
+        for text in ("", "123 !!! ---"):
+            guess = detect_language(text)
+            assert guess.language is None
+            assert guess.letters == 0
+
+    def test_mixed_script_purity(self):
+        guess = detect_language("量子化 quantization error")
+        assert guess.script == "Latin"
+        assert 0 < guess.purity(LANGUAGE_SCRIPTS["zh"]) < 0.5
+
+    @pytest.mark.parametrize(
+        ("text", "lang"),
+        [
+            # English beats each of Hiragana, Katakana and Han but not their sum
+            ("量子化モデルの精度はbenchmarksで少し下がりました", "ja"),
+            ("言語模型 評價 benchmark 결과입니다", "ko"),
+            ("韓國語 文章에는 漢字가 섞여 있을 수 있습니다", "ko"),
+            ("量子化模型的基准测试 benchmark 结果", "zh"),
+        ],
+    )
+    def test_mixed_script_cjk(self, text, lang):
+        assert detect_language(text).language == lang
+
+    def test_separator_in_text(self):
+        guesses = detect_languages(["hello\x00world", "Привет"])
+        assert len(guesses) == 2
+        assert guesses[1].language == "ru"
+
+    def test_identifiable(self):
+        assert is_identifiable("fr")
+        assert is_identifiable("ja")
+        assert not is_identifiable("uk")
+
+
+class TestMultilingualScorerDetection:
+    def test_english_reply_to_japanese_request(self):
+        scorer = MultilingualScorer()
+        metrics = scorer.metrics({"en": SAMPLES["en"], "ja": SAMPLES["en"]})
+        assert metrics["details"] == {"en": True, "ja": False}
+        assert metrics["detected"]["ja"] == "en"
+        assert metrics["script_purity"]["ja"] == 0.0
+        assert metrics["language_confidence"]["ja"] == 0.0
+        assert not metrics["passed"]
+
+    def test_wrong_latin_language(self):
+        scorer = MultilingualScorer()
+        assert scorer.score({"fr": SAMPLES["es"]}) == 0.0
+        assert scorer.score({"fr": SAMPLES["fr"]}) == 1.0
+
+    def test_chinese_reply_to_japanese_request(self):
+        assert MultilingualScorer().score({"ja": SAMPLES["zh"]}) == 0.0
+
+    def test_all_correct(self):
+        metrics = MultilingualScorer().metrics(SAMPLES)
+        assert metrics["passed"]
+        assert metrics["min_script_purity"] == 1.0
+        assert metrics["mean_language_confidence"] > 0
+
+    def test_unknown_language_code(self):
+        assert MultilingualScorer().score({"xx": "anything at all"}) == 1.0
+
+    def test_verification_disabled(self):
+        scorer = MultilingualScorer(verify_language=False)
+        metrics = scorer.metrics({"ja": SAMPLES["en"]})
+        assert metrics["passed"]
+        assert "detected" not in metrics
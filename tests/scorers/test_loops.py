@@ -0,0 +1,74 @@
+"""Tests for suffix-automaton loop detection."""
+
+import random
+
+import pytest
+
+from nerfprobe_core.scorers.loops import detect_loops, normalize_for_loops
+
+
+def _naive_longest_repeat(t):
+    best = ""
+    for i in range(len(t)):
+        for j in range(i + len(best) + 1, len(t) + 1):
+            if t.find(t[i:j], i + 1) == -1:
+                break
+            best = t[i:j]
+    return best
+
+
+class TestDetectLoops:
+    def test_normalization(self):
+        assert normalize_for_loops("  Hello,  WORLD!\n\tHi_there ") == "hello world hi there"
+
+    def test_empty(self):
+        report = detect_loops("?!")
+        assert report.length == 0
+        assert report.longest_repeat == ""
+        assert report.period == 0
+        assert report.coverage == 0.0
+
+    def test_loop_differing_in_punctuation(self):
+        report = detect_loops("I think so. I think so! i think, so", min_loop_chars=5)
+        assert report.longest_repeat == "i think so i think so"
+        assert report.period == 11
+        assert report.is_tandem
+        assert report.coverage == 1.0
+
+    def test_distant_repeat_is_not_tandem(self):
+        text = "alpha beta gamma delta one two three alpha beta gamma delta"
+        report = detect_loops(text, min_loop_chars=10)
+        assert report.longest_repeat == "alpha beta gamma delta"
+        assert not report.is_tandem
+        assert 0 < report.coverage < 1
+
+    def test_no_long_repeats(self):
+        report = detect_loops("The quick brown fox jumps over the lazy dog.")
+        assert report.coverage == 0.0
+
+    def test_degenerate_tail(self):
+        text = "A normal opening paragraph about Roman reforms. " + "The senate voted again and again. " * 200
+        report = detect_loops(text)
+        assert report.period == len("the senate voted again and again ")
+        assert report.coverage > 0.9
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_naive(self, seed):
+        rng = random.Random(seed)
+        for _ in range(40):
+            text = "".join(rng.choice("ab c") for _ in range(rng.randint(1, 30)))
+            t = normalize_for_loops(text)
+            assert len(detect_loops(text).longest_repeat) == len(_naive_longest_repeat(t))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_coverage_matches_naive(self, seed):
+        rng = random.Random(seed)
+        for _ in range(40):
+            text = "".join(rng.choice("abcdéf 漢字") for _ in range(rng.randint(1, 60)))
+            t = normalize_for_loops(text)
+            # A character is covered iff some repeated window of min_loop_chars contains it
+            repeated = [i for i in range(len(t) - 2) if t.find(t[i : i + 3], i + 1) != -1 or t.find(t[i : i + 3]) < i]
+            covered = {j for i in repeated for j in range(i, i + 3)}
+            report = detect_loops(text, min_loop_chars=3)
+            assert len(report.longest_repeat) == len(_naive_longest_repeat(t))
+            assert report.coverage == (len(covered) / len(t) if t else 0.0)
@@ -18,3 +18,24 @@ class TestRepetitionScorer:
         scorer = RepetitionScorer(ngram_size=2, max_repeats=3)
         metrics = scorer.metrics("hello world hello world")
         assert "max_repeats" in metrics
+
+    def test_rolling_hash_counts_match_tuples(self):
+        scorer = RepetitionScorer(ngram_size=3)
+        metrics = scorer.metrics("a b c a b c a b d")
+        # 7 trigrams: (a b c) x2, (b c a) x2, (c a b) x2, (a b d) x1
+        assert metrics["max_repeats"] == 2.0
+        assert metrics["_metadata"]["total_ngrams"] == 7
+        assert metrics["_metadata"]["unique_ngrams"] == 4
+
+    def test_loop_metrics(self):
+        scorer = RepetitionScorer()
+        metrics = scorer.metrics("Intro text here. " + "We must go on, we must go on. " * 20)
+        assert metrics["loop_coverage"] > 0.8
+        assert metrics["repeat_period"] == len("we must go on ")
+        assert metrics["_metadata"]["tandem_loop"] is True
+
+    def test_loop_coverage_threshold(self):
+        # Punctuation varies between copies, so no word 4-gram needs to repeat often
+        text = "Stop. Now! Stop now? Stop, now. " * 3
+        assert RepetitionScorer(max_repeats=10).score(text) == 1.0
+        assert RepetitionScorer(max_repeats=10, min_loop_chars=10, max_loop_coverage=0.3).score(text) == 0.0
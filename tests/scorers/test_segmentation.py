@@ -0,0 +1,51 @@
+"""Tests for script-aware segmentation."""
+
+import pytest
+
+from nerfprobe_core.scorers import ConstraintScorer, RepetitionScorer, TTRScorer
+from nerfprobe_core.scorers.segmentation import ScriptSegmenter, get_segmenter
+
+
+class TestScriptSegmenter:
+    def test_spaced_text_matches_split(self):
+        for text in ["The dog's bone, the dog.", "A well-known fact -- really?", "Très  bien,\tmerci."]:
+            assert ScriptSegmenter()(text) == text.split()
+
+    def test_cjk_bigrams(self):
+        assert ScriptSegmenter()("量化器误差。abc 字") == ["量化", "化器", "器误", "误差", "abc", "字"]
+
+    def test_cjk_chars(self):
+        assert ScriptSegmenter(ngram=1)("日本語のテキスト") == list("日本語のテキスト")
+
+    def test_mixed_scripts(self):
+        tokens = ScriptSegmenter()("Привет, мир! 안녕하세요 GPU显存")
+        assert tokens == ["Привет,", "мир!", "안녕하세요", "GPU", "显存"]
+
+    def test_unknown_segmenter(self):
+        with pytest.raises(ValueError):
+            get_segmenter("nope")
+
+
+class TestScorersOnSpacedText:
+    def test_ttr_unchanged_from_whitespace(self):
+        text = "The well-known answer is clear. The answer, well, is clear; it is well known."
+        assert TTRScorer().metrics(text)["ttr"] == TTRScorer(segmenter="whitespace").metrics(text)["ttr"]
+
+
+class TestScorersOnCJK:
+    def test_ttr_detects_chinese_looping(self):
+        scorer = TTRScorer(sliding_window_size=10)
+        varied = "量化器最小化原始权重与量化级别之间的均方误差并保持模型精度稳定可靠"
+        looping = "我们我们我们我们我们我们我们我们我们我们我们我们"
+        assert scorer.score(varied) > 0.8
+        assert scorer.score(looping) < 0.3
+        assert TTRScorer(segmenter="whitespace").metrics(looping)["token_count"] == 1
+
+    def test_repetition_on_japanese(self):
+        looping = "同じ文を繰り返します。" * 5
+        assert RepetitionScorer(ngram_size=4, max_repeats=2).score(looping) == 0.0
+
+    def test_constraint_counts_characters(self):
+        scorer = ConstraintScorer(min_words=5, max_words=10)
+        assert scorer.metrics("海洋很深很蓝。")["word_count"] == 6
+        assert scorer.score("海洋很深很蓝。") == 1.0
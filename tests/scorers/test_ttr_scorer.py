@@ -23,3 +23,9 @@ class TestTTRScorer:
         metrics = scorer.metrics("hello world foo bar")
         assert "ttr" in metrics
         assert "min_local_ttr" in metrics
+
+    def test_metrics_contains_diversity(self):
+        scorer = TTRScorer()
+        metrics = scorer.metrics("hello world foo bar")
+        for key in ("mtld", "hdd", "yules_k", "compression_ratio"):
+            assert key in metrics
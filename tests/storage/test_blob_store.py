@@ -0,0 +1,101 @@
+"""Tests for BlobStore and result offloading."""
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.storage import (
+    BlobStore,
+    ResultsStore,
+    load_metadata,
+    load_raw_response,
+    offload_result,
+    restore_result,
+)
+
+
+def _result(raw, **metadata):
+    return ProbeResult(
+        probe_name="fingerprint",
+        probe_type=ProbeType.FINGERPRINT,
+        target=ModelTarget(provider_id="test", model_name="model-a"),
+        passed=True,
+        score=1.0,
+        latency_ms=10.0,
+        raw_response=raw,
+        metadata=metadata,
+    )
+
+
+@pytest.fixture(params=["memory", "disk"])
+def store(request, tmp_path):
+    return BlobStore() if request.param == "memory" else BlobStore(tmp_path / "blobs")
+
+
+class TestBlobStore:
+    def test_round_trip_and_dedup(self, store):
+        digest = store.put("hello " * 1000)
+        assert store.put("hello " * 1000) == digest
+        assert digest in store
+        assert store.get(digest) == "hello " * 1000
+        assert len(store) == 1
+
+    def test_unknown_digest(self, store):
+        with pytest.raises(KeyError):
+            store.get("0" * 64)
+
+
+class TestOffload:
+    def test_offload_and_restore(self, store):
+        raw = "x" * 5000
+        responses = ["I am model A. " * 50, "short"]
+        result = _result(raw, banner_responses=responses, config={"prompt": "p" * 500})
+
+        small = offload_result(result, store, preview_chars=100)
+        assert small.raw_response == raw[:100]
+        assert small.raw_response_ref is not None
+        assert set(small.metadata["banner_responses"][0]) == {"$blob"}
+        assert small.metadata["banner_responses"][1] == "short"
+        assert small.metadata["config"] == result.metadata["config"]
+
+        assert load_raw_response(small, store) == raw
+        assert load_metadata(small, store)["banner_responses"] == responses
+        assert restore_result(small, store) == result
+
+    def test_nested_dicts_offloaded(self, store):
+        answers = {"en": "An English answer. " * 30, "fr": {"long": "Une réponse. " * 30, "short": "oui"}}
+        result = _result("x" * 500, answers=answers, trials=[{"response": "y" * 300, "passed": True}])
+
+        small = offload_result(result, store, preview_chars=100)
+        assert set(small.metadata["answers"]["en"]) == {"$blob"}
+        assert set(small.metadata["answers"]["fr"]["long"]) == {"$blob"}
+        assert small.metadata["answers"]["fr"]["short"] == "oui"
+        assert set(small.metadata["trials"][0]["response"]) == {"$blob"}
+        assert small.metadata["trials"][0]["passed"] is True
+        assert restore_result(small, store) == result
+
+    def test_literal_blob_prefix_string_round_trips(self, store):
+        responses = ["blob:" + "0" * 64, "blob:not-a-digest"]
+        result = _result("x" * 500, banner_responses=responses, note="blob:abc")
+
+        small = offload_result(result, store, preview_chars=100)
+        assert small.metadata["banner_responses"] == responses
+        assert load_metadata(small, store)["note"] == "blob:abc"
+        assert restore_result(small, store) == result
+
+    def test_identical_answers_share_one_blob(self, store):
+        for _ in range(10):
+            offload_result(_result("same deterministic answer " * 20), store, preview_chars=50)
+        assert len(store) == 1
+
+    def test_short_result_unchanged(self, store):
+        result = _result("57")
+        assert offload_result(result, store) is result
+
+    def test_results_store_keeps_ref(self, store, tmp_path):
+        small = offload_result(_result("y" * 1000), store, preview_chars=10)
+        with ResultsStore(tmp_path / "results.db") as results:
+            results.add(small)
+            results.flush()
+            (loaded,) = results.window(include_blobs=True)
+        assert loaded.raw_response_ref == small.raw_response_ref
+        assert load_raw_response(loaded, store) == "y" * 1000
@@ -0,0 +1,77 @@
+"""Tests for columnar export."""
+
+import datetime
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.storage import iter_record_batches, to_arrow_table, to_numpy, write_parquet
+
+TARGET = ModelTarget(provider_id="test", model_name="model-a")
+
+
+def _results(n):
+    return [
+        ProbeResult(
+            probe_name="style" if i % 2 else "timing",
+            probe_type=ProbeType.STYLE if i % 2 else ProbeType.TIMING,
+            target=TARGET,
+            timestamp=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC) + datetime.timedelta(seconds=i),
+            passed=i % 3 != 0,
+            score=0.5,
+            latency_ms=100.0 + i,
+            ttft_ms=None if i % 2 else 50.0,
+            input_tokens=None if i % 2 else 10,
+            metric_scores={"ttr": 0.7} if i % 2 else {"itl_p50_ms": 12.0},
+            raw_response=f"response {i}",
+        )
+        for i in range(n)
+    ]
+
+
+class TestArrowExport:
+    def test_chunked_batches_share_schema(self):
+        pytest.importorskip("pyarrow")
+        batches = list(iter_record_batches(_results(25), chunk_size=10))
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert all(b.schema == batches[0].schema for b in batches)
+        assert "metric.ttr" in batches[0].schema.names
+        assert "raw_response" not in batches[0].schema.names
+
+    def test_table_values_and_nulls(self):
+        pytest.importorskip("pyarrow")
+        table = to_arrow_table(_results(4), include_raw=True)
+        rows = table.to_pylist()
+        assert rows[0]["probe_name"] == "timing"
+        assert rows[0]["ttft_ms"] == 50.0
+        assert rows[1]["ttft_ms"] is None
+        assert rows[1]["input_tokens"] is None
+        assert rows[1]["metric.ttr"] == 0.7
+        assert rows[0]["metric.ttr"] is None
+        assert rows[2]["raw_response"] == "response 2"
+        assert rows[3]["timestamp"] == datetime.datetime(2025, 1, 1, 0, 0, 3, tzinfo=datetime.UTC)
+
+    def test_write_parquet_from_generator(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "results.parquet"
+        rows = write_parquet(iter(_results(30)), path, chunk_size=8, metrics=["ttr"])
+        assert rows == 30
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 4
+        assert parquet.read().column("metric.ttr").null_count == 15
+
+
+class TestNumpyExport:
+    def test_structured_array(self):
+        np = pytest.importorskip("numpy")
+        arr = to_numpy(_results(4))
+        assert arr.shape == (4,)
+        assert list(arr["probe_name"]) == ["timing", "style", "timing", "style"]
+        assert np.isnan(arr["ttft_ms"][1])
+        assert arr["input_tokens"][1] == -1
+        assert arr["metric.ttr"][1] == 0.7
+        assert arr["timestamp"][1] == np.datetime64("2025-01-01T00:00:01")
+
+    def test_empty(self):
+        pytest.importorskip("numpy")
+        assert to_numpy([]).shape == (0,)
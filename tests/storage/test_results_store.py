@@ -0,0 +1,108 @@
+"""Tests for ResultsStore."""
+
+import asyncio
+import datetime
+
+import pytest
+
+from nerfprobe_core import ModelTarget, ProbeResult, ProbeType
+from nerfprobe_core.storage import ResultsStore
+
+T0 = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+
+
+def _result(target, probe_name="math", minutes=0, passed=True, score=1.0):
+    return ProbeResult(
+        probe_name=probe_name,
+        probe_type=ProbeType.MATH,
+        target=target,
+        timestamp=T0 + datetime.timedelta(minutes=minutes),
+        passed=passed,
+        score=score,
+        latency_ms=100.0 + minutes,
+        input_tokens=10,
+        output_tokens=5,
+        metric_scores={"passed": float(passed)},
+        raw_response=f"response {minutes}",
+        metadata={"minute": minutes},
+    )
+
+
+@pytest.fixture
+def target():
+    return ModelTarget(provider_id="test", model_name="model-a")
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(tmp_path / "results.db", batch_size=64) as s:
+        yield s
+
+
+class TestResultsStore:
+    @pytest.mark.asyncio
+    async def test_concurrent_ingest_from_event_loop(self, store, target):
+        async def producer(offset):
+            for i in range(250):
+                store.add(_result(target, minutes=offset * 250 + i))
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(producer(k) for k in range(4)))
+        await asyncio.to_thread(store.flush)
+        assert len(store) == 1000
+
+    def test_window_and_blobs(self, store, target):
+        store.add_many(_result(target, minutes=m) for m in range(10))
+        store.flush()
+
+        window = store.window(
+            target, "math", start=T0 + datetime.timedelta(minutes=3), end=T0 + datetime.timedelta(minutes=6)
+        )
+        assert [r.timestamp.minute for r in window] == [3, 4, 5]
+        assert window[0].raw_response == ""
+
+        full = store.window(target, limit=2, include_blobs=True)
+        assert full[1].raw_response == "response 1"
+        assert full[1].metadata == {"minute": 1}
+        assert full[1].metric_scores == {"passed": 1.0}
+
+    def test_latest_and_aggregate(self, store, target):
+        other = ModelTarget(provider_id="test", model_name="model-b")
+        store.add_many(
+            [
+                _result(target, "math", 0),
+                _result(target, "math", 5, passed=False, score=0.0),
+                _result(target, "fact", 2),
+                _result(other, "math", 9),
+            ]
+        )
+        store.flush()
+
+        latest = store.latest(target)
+        assert set(latest) == {"math", "fact"}
+        assert latest["math"].passed is False
+
+        (agg,) = store.aggregate(target, "math")
+        assert agg.runs == 2
+        assert agg.pass_rate == 0.5
+        assert agg.input_tokens == 20
+        assert agg.last == T0 + datetime.timedelta(minutes=5)
+        assert agg.first.tzinfo is datetime.UTC
+        assert len(store.aggregate()) == 3
+
+    def test_naive_timestamps_load_as_utc(self, store, target):
+        naive = datetime.datetime(2025, 6, 1, 8, 30)
+        store.add(_result(target).model_copy(update={"timestamp": naive}))
+        store.flush()
+        (loaded,) = store.window(target)
+        assert loaded.timestamp.tzinfo is datetime.UTC
+        assert loaded.timestamp == naive.astimezone()
+
+    def test_reopen_appends(self, tmp_path, target):
+        path = tmp_path / "results.db"
+        with ResultsStore(path) as store:
+            store.add(_result(target, minutes=0))
+        with ResultsStore(path) as store:
+            store.add(_result(target, minutes=1))
+            store.flush()
+            assert [r.raw_response for r in store.window(include_blobs=True)] == ["response 0", "response 1"]
@@ -0,0 +1,67 @@
+"""Unit tests for ProbeResultBatch."""
+
+import datetime
+
+from nerfprobe_core import ModelTarget, ProbeResult, ProbeResultBatch, ProbeType
+
+A = ModelTarget(provider_id="test", model_name="model-a")
+B = ModelTarget(provider_id="test", model_name="model-b")
+
+
+def _result(target, probe_name, i, **kwargs):
+    return ProbeResult(
+        probe_name=probe_name,
+        probe_type=ProbeType.TIMING if probe_name == "timing" else ProbeType.MATH,
+        target=target,
+        timestamp=datetime.datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.UTC) + datetime.timedelta(minutes=i),
+        passed=i % 2 == 0,
+        score=0.5,
+        latency_ms=100.0 + i,
+        raw_response=f"r{i}",
+        metric_scores={"passed": 1.0},
+        **kwargs,
+    )
+
+
+class TestProbeResultBatch:
+    def test_round_trip(self):
+        results = [
+            _result(A, "math", 0, input_tokens=10, output_tokens=5),
+            _result(B, "timing", 1, ttft_ms=80.0, mean_itl_ms=12.5, error_reason="slow"),
+        ]
+        batch = ProbeResultBatch.from_results(results)
+        assert len(batch) == 2
+        assert batch.to_results() == results
+        assert batch[-1] == results[1]
+
+    def test_naive_timestamps_are_local_time(self):
+        naive = datetime.datetime(2025, 6, 1, 8, 30, 0, 1)
+        result = _result(A, "math", 0).model_copy(update={"timestamp": naive})
+        restored = ProbeResultBatch.from_results([result]).timestamp(0)
+        assert restored.tzinfo is datetime.UTC
+        assert restored == naive.astimezone()
+
+    def test_interned_columns(self):
+        batch = ProbeResultBatch(
+            _result(t, p, i) for i, (t, p) in enumerate([(A, "math"), (B, "math"), (A, "timing")] * 100)
+        )
+        assert batch.targets == [A, B]
+        assert batch.probe_names == ["math", "timing"]
+        assert len(batch.target_codes) == 300
+        assert batch.target_codes.itemsize == 4
+        assert list(batch.scores[:3]) == [0.5, 0.5, 0.5]
+        assert batch.input_tokens[0] == -1
+
+    def test_groups(self):
+        batch = ProbeResultBatch([_result(A, "math", 0), _result(B, "math", 1), _result(A, "math", 2)])
+        groups = batch.groups()
+        assert groups[(A, "math")] == [0, 2]
+        assert groups[(B, "math")] == [1]
+
+    def test_results_do_not_share_containers(self):
+        batch = ProbeResultBatch([_result(A, "math", 0, metadata={"config": {"prompts": ["a"]}})])
+        first, second = batch[0], batch[0]
+        first.metadata["config"]["prompts"].append("b")
+        first.metric_scores["passed"] = 0.0
+        assert second.metadata["config"] == {"prompts": ["a"]}
+        assert batch[0].metric_scores == {"passed": 1.0}
@@ -92,6 +92,22 @@ class TestProbeResult:
         assert result.ttft_ms == 50.0
         assert "some_metric" in result.metric_scores
 
+    def test_trusted_matches_validated(self):
+        target = ModelTarget(provider_id="openai", model_name="gpt-4")
+        fields = {
+            "probe_name": "test_probe",
+            "probe_type": ProbeType.MATH,
+            "target": target,
+            "passed": True,
+            "score": 1.0,
+            "latency_ms": 50.0,
+            "raw_response": "4",
+        }
+        fast = ProbeResult.trusted(**fields)
+        assert fast.metric_scores == {}
+        assert fast.raw_response_ref is None
+        assert fast.summary() == ProbeResult(**fields).summary()
+
 
 class TestProbeType:
     def test_all_types_exist(self):
@@ -0,0 +1,90 @@
+"""Tests for the learned cost estimator."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import CostEstimator, ModelTarget, ProbeResult, ProbeType, StrWithUsage
+from nerfprobe_core.core import use_estimator
+from nerfprobe_core.probes import StyleProbe, StyleProbeConfig
+
+TARGET = ModelTarget(provider_id="test", model_name="model-a")
+OTHER = ModelTarget(provider_id="test", model_name="model-b")
+
+
+def _result(input_tokens, output_tokens, target=TARGET, raw="ok"):
+    return ProbeResult(
+        probe_name="style_probe",
+        probe_type=ProbeType.STYLE,
+        target=target,
+        passed=True,
+        score=1.0,
+        latency_ms=1.0,
+        raw_response=raw,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+    )
+
+
+@pytest.fixture
+def probe():
+    # Static estimate: 50 in / 500 out
+    return StyleProbe(StyleProbeConfig(name="style_probe", topic="rain", max_tokens_per_run=400))
+
+
+class TestCostEstimator:
+    def test_falls_back_to_static(self, probe):
+        assert CostEstimator().estimate(probe, TARGET) == probe.estimated_cost
+
+    def test_learns_per_target(self, probe):
+        estimator = CostEstimator.from_results(
+            [_result(60, 200)] * 9 + [_result(None, None), _result(0, 0, raw="SKIPPED")]
+        )
+
+        est = estimator.estimate(probe, TARGET)
+        assert est.input_tokens == 59  # (9*60 + 50) / 10
+        assert est.output_tokens == 230  # (9*200 + 500) / 10
+        assert estimator.stats("style_probe", TARGET).count == 9
+        assert estimator.estimate(probe, OTHER) == probe.estimated_cost
+
+    def test_sigmas_adds_margin(self, probe):
+        estimator = CostEstimator(prior_weight=0, sigmas=2.0)
+        estimator.observe_many([_result(10, 100), _result(10, 300)])
+        assert estimator.estimate(probe, TARGET).output_tokens == 200 + 283
+
+    def test_dataset_runs_learned_per_item(self):
+        run = _result(1000, 5000).model_copy(
+            update={"metric_scores": {"items": 50.0}, "metadata": {"dataset_path": "gsm.jsonl"}}
+        )
+        estimator = CostEstimator.from_results([run])
+        stats = estimator.stats("style_probe", TARGET)
+        assert (stats.mean_input, stats.mean_output) == (20, 100)
+
+    def test_select_packs_budget(self, probe):
+        estimator = CostEstimator(prior_weight=0)
+        estimator.observe(_result(50, 250))
+        selected, deferred = estimator.select([probe, probe, probe], TARGET, budget=700)
+        assert len(selected) == 2
+        assert len(deferred) == 1
+
+
+class TestProbeBudgetCheck:
+    @pytest.mark.asyncio
+    async def test_static_estimate_skips(self, probe):
+        gateway = AsyncMock()
+        result = await probe.run(TARGET, gateway)
+        assert result.raw_response.startswith("SKIPPED")
+        gateway.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_learned_estimate_runs(self, probe):
+        gateway = AsyncMock()
+        gateway.generate.return_value = StrWithUsage("rain " * 50, {"prompt_tokens": 40, "completion_tokens": 150})
+        estimator = CostEstimator(prior_weight=0)
+        estimator.observe(_result(40, 150))
+
+        with use_estimator(estimator):
+            result = await probe.run(TARGET, gateway)
+
+        assert not result.raw_response.startswith("SKIPPED")
+        gateway.generate.assert_called_once()
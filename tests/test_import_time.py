@@ -0,0 +1,119 @@
+"""Import-cost and lazy probe registry tests."""
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import ClassVar
+
+import pytest
+
+from nerfprobe_core.probes import registry
+from nerfprobe_core.probes.config import BaseProbeConfig, MathProbeConfig
+from nerfprobe_core.probes.core.math_probe import MathProbe
+from nerfprobe_core.probes.registry import BUILTIN_PROBES, ENTRY_POINT_GROUP, ProbeRegistry
+
+# Generous so slow CI machines pass; a regression to eager probe imports
+# (jsonschema, yaml, every probe module) still exceeds it.
+IMPORT_BUDGET_MS = 250.0
+
+HEAVY_MODULES = ["yaml", "jsonschema", "nerfprobe_core.scorers", "nerfprobe_core.probes.core.math_probe"]
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *args, "-c", code], capture_output=True, text=True, check=True)
+
+
+class TestLazyImports:
+    def test_package_import_is_lightweight(self):
+        code = (
+            "import sys, nerfprobe_core, nerfprobe_core.probes\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+            "print([m for m in sys.modules if m.endswith('_probe')])"
+        )
+        loaded, probes = _run(code).stdout.splitlines()
+        assert loaded == "[]"
+        assert probes == "[]"
+
+    def test_create_probe_imports_only_selected_module(self):
+        code = (
+            "import sys\n"
+            "from nerfprobe_core.probes import MathProbeConfig, create_probe\n"
+            "create_probe(MathProbeConfig(name='m', prompt='1+1', expected_answer='2'))\n"
+            "print(sorted(m for m in sys.modules if m.endswith('_probe')))"
+        )
+        assert _run(code).stdout.strip() == "['nerfprobe_core.probes.core.math_probe']"
+
+    def test_attribute_access_still_works(self):
+        import nerfprobe_core.probes as probes
+
+        assert probes.MathProbe is MathProbe
+        with pytest.raises(AttributeError):
+            _ = probes.NoSuchProbe
+
+    def test_import_time_budget(self):
+        # -X importtime reports per-module self time (us) on stderr
+        stderr = _run("import nerfprobe_core, nerfprobe_core.probes", "-X", "importtime").stderr
+        total_us = 0
+        for line in stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip().startswith("nerfprobe_core"):
+                total_us += int(parts[0].split(":")[1])
+        assert 0 < total_us / 1000 < IMPORT_BUDGET_MS
+
+
+class TestProbeRegistry:
+    def test_builtins_resolve(self):
+        reg = ProbeRegistry(BUILTIN_PROBES, group=None)
+        assert reg["math"] is MathProbe
+        assert reg.spec("math") == BUILTIN_PROBES["math"]
+        assert set(reg) == set(BUILTIN_PROBES)
+
+    def test_register_class_and_spec(self):
+        reg = ProbeRegistry({}, group=None)
+        reg.register("direct", MathProbe)
+        reg.register("lazy", BUILTIN_PROBES["math"])
+        assert reg["direct"] is MathProbe
+        assert reg["lazy"] is MathProbe
+        assert reg.spec("direct") == "nerfprobe_core.probes.core.math_probe:MathProbe"
+
+    def test_unknown_key(self):
+        reg = ProbeRegistry(BUILTIN_PROBES, group=None)
+        assert "nope" not in reg
+        with pytest.raises(KeyError):
+            reg["nope"]
+
+    def test_entry_point_discovery(self, monkeypatch):
+        ep = EntryPoint(name="custom", value=BUILTIN_PROBES["math"], group=ENTRY_POINT_GROUP)
+        shadow = EntryPoint(name="math", value="not_a_module:Nothing", group=ENTRY_POINT_GROUP)
+        calls = []
+
+        def fake_entry_points(group):
+            calls.append(group)
+            return [ep, shadow]
+
+        monkeypatch.setattr(registry, "entry_points", fake_entry_points)
+        reg = ProbeRegistry(BUILTIN_PROBES)
+
+        assert reg["math"] is MathProbe  # Built-in found without scanning
+        assert calls == []
+        assert "custom" in reg
+        assert reg["custom"] is MathProbe
+        assert reg["math"] is MathProbe  # Built-ins win over entry points
+        assert calls == [ENTRY_POINT_GROUP]
+
+    def test_probe_key_attribute_on_plugin_config(self):
+        class PluginConfig(BaseProbeConfig):
+            probe_key: ClassVar[str] = "plugin"
+
+        assert registry.probe_key_for_config(PluginConfig(name="p")) == "plugin"
+
+    def test_probe_key_attribute_beats_builtin_base(self):
+        class PluginMathConfig(MathProbeConfig):
+            probe_key: ClassVar[str] = "myplugin"
+
+        class DerivedMathConfig(MathProbeConfig):
+            pass
+
+        fields = {"name": "m", "prompt": "1+1?", "expected_answer": "2"}
+        assert registry.probe_key_for_config(PluginMathConfig(**fields)) == "myplugin"
+        assert registry.probe_key_for_config(DerivedMathConfig(**fields)) == "math"
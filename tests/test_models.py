@@ -0,0 +1,97 @@
+"""Unit tests for the model registry."""
+
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+import nerfprobe_core.models as models
+from nerfprobe_core.models import get_model_info, normalize_model_id
+
+
+@pytest.fixture
+def fresh_registry(isolated_registry):
+    """Empty site/user layers and cache (conftest isolates every test)."""
+    return isolated_registry
+
+
+class TestLazyLoading:
+    def test_import_does_not_load(self):
+        code = "import nerfprobe_core, nerfprobe_core.models as m; print(m._registry is None)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "True"
+
+    def test_models_attribute_loads_on_access(self, fresh_registry):
+        assert "gpt-5.2" in models.MODELS
+        assert models._registry is not None
+
+    def test_warm_start_skips_yaml(self, fresh_registry, monkeypatch):
+        cold = models.list_models()
+        assert list(fresh_registry.glob("models-*.json"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed on warm start")
+
+        monkeypatch.setattr(yaml, "safe_load", fail)
+        monkeypatch.setattr(models, "_registry", None)
+        assert models.list_models() == cold
+
+
+class TestLookup:
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("gpt-5.2", "gpt-5.2"),
+            ("GPT-5.2", "gpt-5.2"),
+            ("openai/gpt-5.2", "gpt-5.2"),
+            ("claude-opus-4-5-20251101", "claude-opus-4.5"),
+            ("anthropic/claude-opus-4.5:beta", "claude-opus-4.5"),
+            ("Grok4", "grok-4.1"),
+            ("deepseek-chat-latest", "deepseek-v4"),
+        ],
+    )
+    def test_normalized_lookup(self, query, expected):
+        info = get_model_info(query)
+        assert info is not None
+        assert info.id == expected
+
+    def test_unknown(self):
+        assert get_model_info("no-such-model") is None
+
+    def test_normalize(self):
+        assert normalize_model_id("OpenAI/GPT_4o-2024-08-06") == "gpt-4o"
+
+
+class TestLayers:
+    def test_user_layer_overrides_site_and_bundled(self, fresh_registry):
+        (fresh_registry / "site.yaml").write_text(
+            "models:\n"
+            "  - {id: gpt-5.2, provider: openai, context_window: 100000}\n"
+            "  - {id: internal-a, provider: acme, context_window: 8000}\n"
+        )
+        (fresh_registry / "user.yaml").write_text(
+            "models:\n  - {id: internal-a, provider: acme, context_window: 32000}\naliases:\n  ia: internal-a\n"
+        )
+
+        gpt = get_model_info("gpt-5.2")
+        assert gpt is not None
+        assert gpt.context_window == 100000
+        assert gpt.architecture == "moe"  # Fields not set in the site layer are kept
+        internal = get_model_info("ia")
+        assert internal is not None
+        assert internal.context_window == 32000
+
+    def test_overlay_save_reloads_registry(self, fresh_registry):
+        from nerfprobe_core.models.overlay import ModelOverlay
+
+        assert get_model_info("internal-b") is None
+        overlay = ModelOverlay()
+        assert overlay.path == fresh_registry / "user.yaml"
+        overlay.add(models.ModelInfo(id="internal-b", provider="acme", context_window=4096), aliases=["ib"])
+        overlay.save()
+
+        info = get_model_info("ib")
+        assert info is not None
+        assert info.context_window == 4096
+        assert "internal-b" in ModelOverlay()
@@ -0,0 +1,93 @@
+"""Tests for bulk model research."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import ModelTarget
+from nerfprobe_core.models import get_model_info
+from nerfprobe_core.models.overlay import ModelOverlay
+from nerfprobe_core.models.research import research_models
+
+RESEARCHER = ModelTarget(provider_id="test", model_name="researcher")
+
+
+@pytest.fixture
+def overlay():
+    # conftest points the registry layers at a per-test directory
+    return ModelOverlay()
+
+
+def _answer(context_window):
+    return "```json\n" + json.dumps({"context_window": context_window, "knowledge_cutoff": "2025-01-01"}) + "\n```"
+
+
+class TestResearchModels:
+    @pytest.mark.asyncio
+    async def test_researches_unknown_ids_only(self, overlay):
+        gateway = AsyncMock()
+        gateway.generate.return_value = _answer(64000)
+
+        report = await research_models(
+            {"gpt-5.2": "openai", "acme-1": "acme", "acme-2": "acme"}, gateway, RESEARCHER, overlay
+        )
+
+        assert report.skipped == ["gpt-5.2"]
+        assert sorted(report.researched) == ["acme-1", "acme-2"]
+        assert gateway.generate.call_count == 2
+        info = get_model_info("acme-1")
+        assert info is not None
+        assert info.context_window == 64000
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, overlay):
+        in_flight = peak = 0
+
+        async def generate(model, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _answer(1000)
+
+        gateway = AsyncMock()
+        gateway.generate.side_effect = generate
+        ids = {f"m-{i}": "acme" for i in range(10)}
+
+        report = await research_models(ids, gateway, RESEARCHER, overlay, concurrency=3)
+
+        assert len(report.researched) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_failures(self, overlay):
+        gateway = AsyncMock()
+        gateway.generate.side_effect = [_answer(1000), Exception("503 Service Unavailable")]
+
+        first = await research_models([("a-1", "acme"), ("a-2", "acme")], gateway, RESEARCHER, overlay, concurrency=1)
+        assert first.researched == ["a-1"]
+        assert "503" in first.failed["a-2"]
+
+        gateway.generate.side_effect = None
+        gateway.generate.return_value = "not json"
+        second = await research_models([("a-1", "acme"), ("a-2", "acme")], gateway, RESEARCHER, ModelOverlay())
+        assert second.skipped == ["a-1"]
+        assert second.failed == {"a-2": "Unparseable response"}
+
+    @pytest.mark.asyncio
+    async def test_saves_at_checkpoints(self, overlay, monkeypatch):
+        saves = []
+        save = overlay.save
+        monkeypatch.setattr(overlay, "save", lambda: saves.append(len(overlay)) or save())
+        gateway = AsyncMock()
+        gateway.generate.return_value = _answer(1000)
+        ids = {f"m-{i}": "acme" for i in range(10)}
+
+        report = await research_models(ids, gateway, RESEARCHER, overlay, checkpoint_every=4)
+
+        assert len(report.researched) == 10
+        assert saves == [4, 8, 10]
+        assert len(ModelOverlay()) == 10
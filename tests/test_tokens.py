@@ -0,0 +1,70 @@
+"""Tests for approximate token counting."""
+
+import time
+
+import pytest
+
+from nerfprobe_core.core.tokens import (
+    DEFAULT_PROFILE,
+    TokenProfile,
+    approx_token_count,
+    calibrate,
+    fits_context_window,
+    profile_for,
+)
+
+
+class TestApproxTokenCount:
+    @pytest.mark.parametrize(
+        "text, low, high",
+        [
+            # Reference counts from a cl100k-style tokenizer, within ~30%
+            ("The quick brown fox jumps over the lazy dog.", 8, 13),
+            ("量化器最小化原始权重与量化级别之间的均方误差。", 16, 32),
+            ("Квантователь минимизирует среднеквадратичную ошибку.", 15, 35),
+            ("def f(x):\n    return x * 2\n", 9, 16),
+            ("1234567890", 3, 5),
+        ],
+    )
+    def test_reasonable_counts(self, text, low, high):
+        assert low <= approx_token_count(text) <= high
+
+    def test_cjk_costs_more_than_words(self):
+        zh = "量化器最小化原始权重与量化级别之间的均方误差"
+        assert approx_token_count(zh) > 5 * len(zh.split())
+
+    def test_empty(self):
+        assert approx_token_count("") == 0
+        assert approx_token_count(" ") == 1
+
+    def test_megabyte_is_fast(self):
+        text = "The quick brown fox jumps over the lazy dog. 量化器最小化误差。\n" * 20_000
+        start = time.perf_counter()
+        approx_token_count(text)
+        assert time.perf_counter() - start < 0.25
+
+
+class TestProfiles:
+    def test_family_lookup(self):
+        assert profile_for("qwen3-72b").three_byte_tokens < DEFAULT_PROFILE.three_byte_tokens
+        assert profile_for("openai/gpt-5.2") == DEFAULT_PROFILE
+        assert profile_for("unknown-model") == DEFAULT_PROFILE
+
+    def test_calibrate_scale(self):
+        text = "The quick brown fox jumps over the lazy dog."
+        estimate = approx_token_count(text)
+        profile = calibrate([(text, estimate * 2)])
+        assert profile.scale == pytest.approx(2.0, rel=0.1)
+        assert approx_token_count(text, profile=profile) == pytest.approx(2 * estimate, abs=1)
+
+    def test_calibrate_without_samples(self):
+        profile = TokenProfile(scale=1.5)
+        assert calibrate([], profile) is profile
+
+
+class TestContextWindow:
+    def test_fits(self):
+        # gpt-5.2 is registered with a 200k window
+        assert fits_context_window("hello world", "gpt-5.2")
+        assert not fits_context_window(199_000, "gpt-5.2", reserve_tokens=2_000)
+        assert fits_context_window(10**9, "no-such-model")
@@ -0,0 +1,158 @@
+"""Tests for usage metering."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nerfprobe_core import (
+    LogprobResult,
+    MeteredGateway,
+    ModelTarget,
+    ProbeResult,
+    ProbeType,
+    StrWithUsage,
+    UsageMeter,
+)
+from nerfprobe_core.core import extract_usage, probe_scope, sum_tokens
+from nerfprobe_core.probes import MathProbe, MathProbeConfig
+
+CHEAP = ModelTarget(provider_id="test", model_name="cheap", cost_per_m_in=1.0, cost_per_m_out=2.0)
+PRICEY = ModelTarget(provider_id="test", model_name="pricey", cost_per_m_in=10.0, cost_per_m_out=30.0)
+
+
+class TestExtractUsage:
+    def test_shapes(self):
+        assert extract_usage(StrWithUsage("x", {"prompt_tokens": 3, "completion_tokens": 4})) == (3, 4)
+        assert extract_usage(StrWithUsage("x", {"input_tokens": 5, "output_tokens": 6})) == (5, 6)
+        assert extract_usage(LogprobResult(text="x", input_tokens=7)) == (7, None)
+        assert extract_usage(StrWithUsage("x", {"output_tokens": 0})) == (None, 0)
+        assert extract_usage("plain") == (None, None)
+
+    def test_sum_tokens(self):
+        assert sum_tokens(None, 3, None, 4) == 7
+        assert sum_tokens(None, None) is None
+        assert sum_tokens(0) == 0
+
+
+class TestUsageMeter:
+    def test_cost_and_grouping(self):
+        meter = UsageMeter()
+        meter.record(CHEAP, 1_000_000, 500_000, probe_name="math")
+        meter.record(PRICEY, 100_000, 100_000, probe_name="math")
+        meter.record(PRICEY, 0, 100_000, probe_name="style")
+
+        assert meter.requests == 3
+        assert meter.cost_usd == pytest.approx(2.0 + 4.0 + 3.0)
+        assert meter.by_target()[PRICEY].cost_usd == pytest.approx(7.0)
+        assert meter.by_probe(PRICEY)["style"].output_tokens == 100_000
+        math = meter.totals(probe_name="math")
+        assert math.requests == 2
+        assert math.total_tokens == 1_700_000
+
+    def test_unreported_counts_add_zero(self):
+        meter = UsageMeter()
+        meter.record(CHEAP, None, 10, probe_name="math")
+        assert meter.requests == 1
+        assert meter.input_tokens == 0
+        assert meter.totals().output_tokens == 10
+
+    def test_record_result_counts_tokens_not_requests(self):
+        result = ProbeResult(
+            probe_name="routing",
+            probe_type=ProbeType.ROUTING,
+            target=CHEAP,
+            passed=True,
+            score=1.0,
+            latency_ms=1.0,
+            raw_response="",
+            input_tokens=300,
+            output_tokens=200,
+        )
+        meter = UsageMeter()
+        meter.record_result(result)
+        assert (meter.requests, meter.input_tokens, meter.output_tokens) == (0, 300, 200)
+        meter.record_result(result, requests=5)
+        assert meter.by_probe()["routing"].requests == 5
+
+    def test_window(self):
+        meter = UsageMeter(bucket_seconds=10)
+        now = time.time()
+        meter.record(CHEAP, 100, 0, probe_name="old", at=now - 3600)
+        meter.record(CHEAP, 10, 0, probe_name="new", at=now)
+
+        assert meter.totals(window_seconds=60).input_tokens == 10
+        assert meter.totals().input_tokens == 110
+
+    def test_bucket_retention(self):
+        meter = UsageMeter(bucket_seconds=1, max_buckets=3)
+        for t in range(10):
+            meter.record(CHEAP, 1, 0, at=float(t))
+        assert len(meter._buckets) == 3
+        assert meter.totals().input_tokens == 10
+
+    def test_concurrent_threads(self):
+        meter = UsageMeter()
+
+        def work():
+            for _ in range(2000):
+                meter.record(CHEAP, 1, 1, probe_name="p")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert meter.requests == 16_000
+        assert meter.totals(CHEAP, "p").input_tokens == 16_000
+
+
+class TestMeteredGateway:
+    @pytest.mark.asyncio
+    async def test_run_probe_attributes_usage(self):
+        inner = AsyncMock()
+        inner.generate.return_value = StrWithUsage("4", {"prompt_tokens": 20, "completion_tokens": 2})
+        meter = UsageMeter()
+        gateway = MeteredGateway(inner, meter)
+        probe = MathProbe(MathProbeConfig(name="math_probe", prompt="2+2?", expected_answer="4"))
+
+        result = await gateway.run_probe(probe, CHEAP)
+
+        assert result.passed
+        assert meter.by_probe()["math_probe"].input_tokens == 20
+
+    @pytest.mark.asyncio
+    async def test_probe_reads_input_output_usage_keys(self):
+        gateway = AsyncMock()
+        gateway.generate.return_value = StrWithUsage("4", {"input_tokens": 20, "output_tokens": 2})
+        probe = MathProbe(MathProbeConfig(name="math_probe", prompt="2+2?", expected_answer="4"))
+
+        result = await probe.run(CHEAP, gateway)
+
+        assert (result.input_tokens, result.output_tokens) == (20, 2)
+
+    @pytest.mark.asyncio
+    async def test_unreported_usage_stays_none(self):
+        gateway = AsyncMock()
+        gateway.generate.return_value = "4"
+        probe = MathProbe(MathProbeConfig(name="math_probe", prompt="2+2?", expected_answer="4"))
+
+        result = await probe.run(CHEAP, gateway)
+
+        assert (result.input_tokens, result.output_tokens) == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_scope_follows_tasks(self):
+        inner = AsyncMock()
+        inner.generate.return_value = StrWithUsage("ok", {"prompt_tokens": 1, "completion_tokens": 1})
+        meter = UsageMeter()
+        gateway = MeteredGateway(inner, meter)
+
+        with probe_scope("fanout"):
+            await asyncio.gather(*(gateway.generate(CHEAP, "hi") for _ in range(5)))
+        await gateway.generate(CHEAP, "unscoped")
+
+        assert meter.by_probe()["fanout"].requests == 5
+        assert meter.by_probe()["unattributed"].requests == 1